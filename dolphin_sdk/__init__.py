@@ -1,5 +1,11 @@
+from dolphin_sdk import batch
 from dolphin_sdk import demo
 from dolphin_sdk import form
+from dolphin_sdk import meta
+from dolphin_sdk.async_web_sdk import AsyncDolphinWebSdk
+from dolphin_sdk.meta_column_store import DSTaskColumnStore
+from dolphin_sdk.meta_export import DSMetaExporter
 from dolphin_sdk.meta_sdk import DolphinMetaSdk
+from dolphin_sdk.meta_snapshot import DolphinMetaSnapshot
 from dolphin_sdk.objects import *
 from dolphin_sdk.web_sdk import DolphinWebSdk
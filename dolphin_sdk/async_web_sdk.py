@@ -0,0 +1,315 @@
+"""
+基于海豚调度 Web API 的异步 SDK
+"""
+
+import asyncio
+import time
+import urllib.parse
+from typing import Iterable, List, Optional
+
+from dolphin_sdk.common import DSRateLimiter
+from dolphin_sdk.common import DSRequestEvent
+from dolphin_sdk.common import DSRequestHook
+from dolphin_sdk.common import dispatch_request_event
+from dolphin_sdk.form import DSPostSchedulesForm
+from dolphin_sdk.form import DSStartProcessInstanceForm
+from dolphin_sdk.form import PostProcessDefinitionForm
+from dolphin_sdk.objects import DSReleaseState
+from dolphin_sdk.web_sdk import DolphinApiError
+from dolphin_sdk.web_sdk import ENDPOINT_PROCESS_DEFINITION
+from dolphin_sdk.web_sdk import ENDPOINT_PROCESS_DEFINITION_LIST
+from dolphin_sdk.web_sdk import ENDPOINT_PROCESS_DEFINITION_RELEASE
+from dolphin_sdk.web_sdk import ENDPOINT_PROCESS_DEFINITION_VERIFY_NAME
+from dolphin_sdk.web_sdk import ENDPOINT_SCHEDULES
+from dolphin_sdk.web_sdk import ENDPOINT_SCHEDULES_OFFLINE
+from dolphin_sdk.web_sdk import ENDPOINT_SCHEDULES_ONLINE
+from dolphin_sdk.web_sdk import ENDPOINT_START_PROCESS_INSTANCE
+from dolphin_sdk.web_sdk import ENDPOINT_TASK_DEFINITION_GEN_TASK_CODES
+from dolphin_sdk.web_sdk import _url
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp 为可选依赖，仅在使用异步 SDK 时需要
+    aiohttp = None
+
+__all__ = [
+    "AsyncDolphinWebSdk"
+]
+
+
+class AsyncDolphinWebSdk:
+    """基于海豚调度 Web API 的异步 SDK
+
+    与 DolphinWebSdk 提供相同的方法（均为协程），所有请求共享同一个 aiohttp.ClientSession 的连接池，并通过信号量限制同时在途
+    的请求数量。需要在同一个事件循环中使用，并在使用结束后调用 close() 或使用 async with 语句。
+    """
+
+    def __init__(self, base_url: str, token: str,
+                 max_concurrency: int = 16,
+                 limit_per_host: int = 0,
+                 connect_timeout: Optional[float] = 10.0,
+                 read_timeout: Optional[float] = 60.0,
+                 keepalive_timeout: float = 30.0,
+                 hooks: Optional[Iterable[DSRequestHook]] = None,
+                 rate_limiter: Optional[DSRateLimiter] = None):
+        """
+
+        Parameters
+        ----------
+        base_url : str
+            海豚调度 Web 服务地址
+        token : str
+            海豚调度的安全令牌
+        max_concurrency : int, default = 16
+            同时在途的请求数量上限
+        limit_per_host : int, default = 0
+            每个 Host 的连接数量上限，为 0 时与 max_concurrency 相同
+        connect_timeout : Optional[float], default = 10.0
+            建立连接的超时时间（秒），为 None 时不限制
+        read_timeout : Optional[float], default = 60.0
+            读取响应的超时时间（秒），为 None 时不限制
+        keepalive_timeout : float, default = 30.0
+            空闲长连接的保持时间（秒）
+        hooks : Optional[Iterable[DSRequestHook]], default = None
+            请求埋点的回调；每个请求完成（或失败）后，都会以 DSRequestEvent 调用所有回调（在事件循环线程中同步调用）
+        rate_limiter : Optional[DSRateLimiter], default = None
+            请求限流器（可以与其他同步或异步 SDK 实例共享）；每个请求发起前获取许可，完成后归还
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncDolphinWebSdk 依赖 aiohttp，请先安装：pip install aiohttp")
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency 必须为正整数: {max_concurrency}")
+
+        self._base_url = base_url
+        self._token = token
+        self._max_concurrency = max_concurrency
+        self._limit_per_host = limit_per_host if limit_per_host > 0 else max_concurrency
+        self._timeout = aiohttp.ClientTimeout(connect=connect_timeout, sock_read=read_timeout)
+        self._keepalive_timeout = keepalive_timeout
+        self._hook_list: List[DSRequestHook] = list(hooks) if hooks is not None else []
+        self._rate_limiter = rate_limiter
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> "AsyncDolphinWebSdk":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self) -> None:
+        """关闭连接池中的所有长连接（关闭后再次请求时会重新创建连接池）"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    # ------------------------------ SDK 属性 ------------------------------
+
+    @property
+    def base_url(self) -> str:
+        return self._base_url
+
+    @property
+    def token(self) -> str:
+        return self._token
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency
+
+    @property
+    def rate_limiter(self) -> Optional[DSRateLimiter]:
+        return self._rate_limiter
+
+    @property
+    def hook_list(self) -> List[DSRequestHook]:
+        return list(self._hook_list)
+
+    def add_hook(self, hook: DSRequestHook) -> None:
+        """添加请求埋点的回调"""
+        self._hook_list = self._hook_list + [hook]
+
+    # ------------------------------ 通用请求方法 ------------------------------
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """获取共享的 ClientSession（首次调用时在当前事件循环中创建）"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._max_concurrency,
+                limit_per_host=self._limit_per_host,
+                keepalive_timeout=self._keepalive_timeout
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self._timeout,
+                headers={
+                    "Accept": "application/json",
+                    "token": self.token
+                }
+            )
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        return self._session
+
+    async def _do_request(self, method: str, endpoint: str, url: str,
+                          params: Optional[dict] = None, data: Optional[dict] = None):
+        """执行海豚调度的请求，并返回解析后的 Json 结果；请求完成（或失败）后触发请求埋点（等待信号量和限流许可的时间不计入耗时）"""
+        session = self._get_session()
+        actual_url = f"{self._base_url}{url}"
+        async with self._semaphore:
+            status_code = None
+            response_bytes = 0
+            result = None
+            error = None
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire_async()
+            start_time = time.perf_counter()
+            try:
+                async with session.request(method, actual_url, params=params, data=data) as response:
+                    status_code = response.status
+                    body = await response.read()
+                    response_bytes = len(body)
+                    if method == "PUT" and response.status != 200:
+                        text = await response.text()
+                        raise DolphinApiError(f"status_code={response.status}, text={text}")
+                    result = await response.json(content_type=None)
+                    return result
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError, DolphinApiError) as e:
+                error = f"{type(e).__name__}: {e}"
+                raise
+            finally:
+                if self._hook_list or self._rate_limiter is not None:
+                    event = DSRequestEvent(
+                        endpoint=endpoint,
+                        method=method,
+                        status_code=status_code,
+                        ds_code=result.get("code") if isinstance(result, dict) else None,
+                        request_bytes=len(urllib.parse.urlencode(data)) if data else 0,
+                        response_bytes=response_bytes,
+                        latency=time.perf_counter() - start_time,
+                        error=error
+                    )
+                    if self._rate_limiter is not None:
+                        self._rate_limiter.release(event)
+                    dispatch_request_event(self._hook_list, event)
+
+    async def _do_get(self, endpoint: str, url: str, params: dict):
+        """执行海豚调度的 GET 请求"""
+        return await self._do_request("GET", endpoint, url, params=params)
+
+    async def _do_post(self, endpoint: str, url: str, data: dict):
+        """执行海豚调度的 POST 请求"""
+        return await self._do_request("POST", endpoint, url, data=data)
+
+    async def _do_put(self, endpoint: str, url: str, data: dict):
+        """执行海豚调度的 PUT 请求（HTTP 状态码不为 200 时抛出 DolphinApiError）"""
+        return await self._do_request("PUT", endpoint, url, data=data)
+
+    # ------------------------------ SDK 方法 ------------------------------
+
+    async def get_process_definition_verify_name(self, project_code: int, name: str) -> bool:
+        """【get】验证工作流名称是否可用
+
+        Parameters
+        ----------
+        project_code : int
+            项目ID
+        name : name
+            工作流名称
+        """
+        endpoint = ENDPOINT_PROCESS_DEFINITION_VERIFY_NAME
+        url = _url(endpoint, project_code=project_code)
+        params = {"name": name}
+        response = await self._do_get(endpoint, url, params)
+        return response["code"] == 0
+
+    async def get_process_definition(self, project_code: int, process_code: int):
+        """获取工作流定义
+
+        Parameters
+        ----------
+        project_code : int
+            项目ID
+        process_code : int
+            工作流ID
+        """
+        endpoint = ENDPOINT_PROCESS_DEFINITION
+        url = _url(endpoint, project_code=project_code, code=process_code)
+        params = {}
+        response = await self._do_get(endpoint, url, params)
+        if response["code"] != 0:
+            response_code = response["code"]
+            raise DolphinApiError(f"url={url} params={params} code={response_code}")
+        return response["data"]
+
+    async def get_task_definition_gen_task_codes(self, project_code: int, gen_num: int) -> List[int]:
+        """生成新建 task 的 task_code
+
+        Parameters
+        ----------
+        project_code : int
+            项目ID
+        gen_num : int
+            生成数量
+        """
+        endpoint = ENDPOINT_TASK_DEFINITION_GEN_TASK_CODES
+        url = _url(endpoint, project_code=project_code)
+        params = {"genNum": gen_num}
+        response = await self._do_get(endpoint, url, params)
+        if response["code"] != 0:
+            response_code = response["code"]
+            raise DolphinApiError(f"url={url} params={params} code={response_code}")
+        return response["data"]
+
+    async def post_process_definition(self, project_code: int, data: PostProcessDefinitionForm) -> dict:
+        """提交一个新的工作流"""
+        endpoint = ENDPOINT_PROCESS_DEFINITION_LIST
+        url = _url(endpoint, project_code=project_code)
+        return await self._do_post(endpoint, url, data.to_dict())
+
+    async def put_process_definition(self, project_code: int, process_code: int,
+                                     data: PostProcessDefinitionForm) -> dict:
+        """更新一个工作流"""
+        endpoint = ENDPOINT_PROCESS_DEFINITION
+        url = _url(endpoint, project_code=project_code, code=process_code)
+        return await self._do_put(endpoint, url, data.to_dict())
+
+    async def post_process_definition_release(self, project_code: int,
+                                              process_code: int,
+                                              process_name: str,
+                                              release_state: DSReleaseState) -> bool:
+        """上线 / 下线工作流"""
+        endpoint = ENDPOINT_PROCESS_DEFINITION_RELEASE
+        url = _url(endpoint, project_code=project_code, code=process_code)
+        response = await self._do_post(endpoint, url, {
+            "name": process_name,
+            "releaseState": release_state.web_value
+        })
+        return response["code"] == 0
+
+    async def post_start_process_instance(self, project_code: int, data: DSStartProcessInstanceForm) -> bool:
+        """启动工作流实例"""
+        endpoint = ENDPOINT_START_PROCESS_INSTANCE
+        url = _url(endpoint, project_code=project_code)
+        response = await self._do_post(endpoint, url, data.to_dict())
+        return response["code"] == 0
+
+    async def post_schedules(self, project_code: int, data: DSPostSchedulesForm) -> dict:
+        """设置工作流定时"""
+        endpoint = ENDPOINT_SCHEDULES
+        url = _url(endpoint, project_code=project_code)
+        return await self._do_post(endpoint, url, data.to_dict())
+
+    async def post_schedules_online(self, project_code: int, schedule_id: int) -> bool:
+        """将工作流定时上线"""
+        endpoint = ENDPOINT_SCHEDULES_ONLINE
+        url = _url(endpoint, project_code=project_code, id=schedule_id)
+        response = await self._do_post(endpoint, url, {})
+        return response["code"] == 0
+
+    async def post_schedules_offline(self, project_code: int, schedule_id: int) -> bool:
+        """将工作流定时下线"""
+        endpoint = ENDPOINT_SCHEDULES_OFFLINE
+        url = _url(endpoint, project_code=project_code, id=schedule_id)
+        response = await self._do_post(endpoint, url, {})
+        return response["code"] == 0
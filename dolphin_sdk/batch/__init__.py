@@ -0,0 +1,17 @@
+from dolphin_sdk.batch.bulk_create_shell_task import DSBulkCreateResult
+from dolphin_sdk.batch.bulk_create_shell_task import DSShellProcessSpec
+from dolphin_sdk.batch.bulk_create_shell_task import bulk_create_process_with_one_shell_task
+from dolphin_sdk.batch.task_code_pool import DSTaskCodePool
+from dolphin_sdk.batch.task_code_pool import DSTaskCodePoolStats
+from dolphin_sdk.batch.process_fingerprint import fingerprint_process_definition_form
+from dolphin_sdk.batch.process_fingerprint import fingerprint_process_definition_record
+from dolphin_sdk.batch.sync_process_definition import DSSyncReport
+from dolphin_sdk.batch.sync_process_definition import get_process_definition_fingerprint_dict
+from dolphin_sdk.batch.sync_process_definition import sync_process_definition
+from dolphin_sdk.batch.sync_process_definition import sync_process_definition_list
+from dolphin_sdk.batch.bulk_release import DSBulkReleaseReport
+from dolphin_sdk.batch.bulk_release import DSReleaseWaveReport
+from dolphin_sdk.batch.bulk_release import bulk_release_process_definition
+from dolphin_sdk.batch.backfill import DSBackfillReport
+from dolphin_sdk.batch.backfill import backfill_process_definition
+from dolphin_sdk.batch.backfill import split_complement_time_range
@@ -0,0 +1,199 @@
+"""
+分段、并行地提交工作流补数，并支持基于本地检查点文件的断点续跑
+"""
+
+import concurrent.futures
+import dataclasses
+import datetime
+import os
+import threading
+import time
+from typing import List, Optional, Set, Tuple
+
+from dolphin_sdk.common import topological_wave_list
+from dolphin_sdk.form import DSStartProcessInstanceForm
+from dolphin_sdk.meta_sdk import DolphinMetaSdk
+from dolphin_sdk.objects import DSComplementDependentMode
+from dolphin_sdk.objects import DSComplementTimeRange
+from dolphin_sdk.objects import DSFailureStrategy
+from dolphin_sdk.objects import DSProcessDefinition
+from dolphin_sdk.objects import DSRunMode
+from dolphin_sdk.web_sdk import DolphinWebSdk
+
+__all__ = [
+    "DSBackfillReport",
+    "split_complement_time_range",
+    "backfill_process_definition"
+]
+
+
+@dataclasses.dataclass(slots=True)
+class DSBackfillReport:
+    """批量补数的结果"""
+
+    # 本次提交成功的（工作流，补数时间段）
+    submitted_list: List[Tuple[DSProcessDefinition, DSComplementTimeRange]] = dataclasses.field(
+        kw_only=True, default_factory=lambda: [])
+
+    # 根据检查点跳过的（工作流，补数时间段）数量
+    skipped_count: int = dataclasses.field(kw_only=True, default=0)
+
+    # 提交失败或被跳过的（工作流，补数时间段）及原因
+    failed_list: List[Tuple[DSProcessDefinition, DSComplementTimeRange, str]] = dataclasses.field(
+        kw_only=True, default_factory=lambda: [])
+
+    # 总耗时（秒）
+    elapsed: float = dataclasses.field(kw_only=True, default=0.0)
+
+
+def split_complement_time_range(start_date: datetime.date,
+                                end_date: datetime.date,
+                                chunk_days: int) -> List[DSComplementTimeRange]:
+    """将 [start_date, end_date] 的日期范围（包含两端）按 chunk_days 天切分为多个补数时间段"""
+    if chunk_days < 1:
+        raise ValueError(f"chunk_days 必须为正整数: {chunk_days}")
+    result = []
+    chunk_start = start_date
+    while chunk_start <= end_date:
+        chunk_end = min(chunk_start + datetime.timedelta(days=chunk_days - 1), end_date)
+        result.append(DSComplementTimeRange(
+            complement_start_date=datetime.datetime.combine(chunk_start, datetime.time.min),
+            complement_end_date=datetime.datetime.combine(chunk_end, datetime.time.min)
+        ))
+        chunk_start = chunk_end + datetime.timedelta(days=1)
+    return result
+
+
+def backfill_process_definition(web_sdk: DolphinWebSdk,
+                                meta_sdk: DolphinMetaSdk,
+                                process_definition_list: List[DSProcessDefinition],
+                                start_date: datetime.date,
+                                end_date: datetime.date,
+                                worker_group: str,
+                                chunk_days: int = 7,
+                                max_workers: int = 4,
+                                expected_parallelism_number: Optional[int] = None,
+                                failure_strategy: DSFailureStrategy = DSFailureStrategy.CONTINUE,
+                                environment_code: Optional[int] = None,
+                                checkpoint_path: Optional[str] = None) -> DSBackfillReport:
+    """为一组工作流分段提交补数
+
+    日期范围被切分为多个补数时间段，按时间顺序逐段提交；每段内按 DEPENDENT 任务的依赖关系划分为拓扑批次，上游工作流所在批次提交完成后再
+    提交下游工作流，同一批次内在线程池中并行提交。上游工作流提交失败时，跳过同一时间段中的下游工作流。
+
+    如提供 checkpoint_path，则每个提交成功的（工作流，补数时间段）都会追加写入该文件；再次执行时会跳过文件中已记录的提交。
+
+    Parameters
+    ----------
+    web_sdk : DolphinWebSdk
+        海豚调度 Web SDK
+    meta_sdk : DolphinMetaSdk
+        海豚调度元数据 SDK
+    process_definition_list : List[DSProcessDefinition]
+        需要补数的工作流
+    start_date : datetime.date
+        补数开始日期（包含）
+    end_date : datetime.date
+        补数结束日期（包含）
+    worker_group : str
+        Worker 分组
+    chunk_days : int, default = 7
+        每个补数时间段的天数
+    max_workers : int, default = 4
+        同时提交的请求数量上限
+    expected_parallelism_number : Optional[int], default = None
+        单个补数命令内的并行度；为 None 时串行补数
+    failure_strategy : DSFailureStrategy, default = DSFailureStrategy.CONTINUE
+        失败策略
+    environment_code : Optional[int], default = None
+        环境编号
+    checkpoint_path : Optional[str], default = None
+        检查点文件路径
+    """
+    start_time = time.monotonic()
+    report = DSBackfillReport()
+
+    checkpoint = _BackfillCheckpoint(checkpoint_path) if checkpoint_path is not None else None
+    upstream_dict = meta_sdk.get_upstream_process_dict_by_process_definition_list(process_definition_list)
+    wave_list = topological_wave_list(process_definition_list, upstream_dict)
+    time_range_list = split_complement_time_range(start_date, end_date, chunk_days)
+
+    def submit(process: DSProcessDefinition, time_range: DSComplementTimeRange) -> bool:
+        form = DSStartProcessInstanceForm(
+            process_code=process.process_code,
+            worker_group=worker_group,
+            environment_code=environment_code,
+            failure_strategy=failure_strategy,
+            complement_dependent_mode=DSComplementDependentMode.OFF_MODE,
+            run_mode=(DSRunMode.RUN_MODE_PARALLEL if expected_parallelism_number is not None
+                      else DSRunMode.RUN_MODE_SERIAL),
+            expected_parallelism_number=expected_parallelism_number,
+            schedule_time=time_range,
+            exec_type="COMPLEMENT_DATA"
+        )
+        return web_sdk.post_start_process_instance(process.project_code, form)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for time_range in time_range_list:
+            failed_set: Set[DSProcessDefinition] = set()
+            for wave in wave_list:
+                future_dict = {}
+                for process in wave:
+                    if checkpoint is not None and checkpoint.contains(process, time_range):
+                        report.skipped_count += 1
+                    elif upstream_dict.get(process, set()) & failed_set:
+                        failed_set.add(process)
+                        report.failed_list.append((process, time_range, "上游工作流提交失败，已跳过"))
+                    else:
+                        future_dict[executor.submit(submit, process, time_range)] = process
+
+                for future in concurrent.futures.as_completed(future_dict):
+                    process = future_dict[future]
+                    try:
+                        is_success = future.result()
+                        reason = "接口返回失败"
+                    except Exception as e:
+                        is_success = False
+                        reason = f"{type(e).__name__}: {e}"
+                    if is_success:
+                        report.submitted_list.append((process, time_range))
+                        if checkpoint is not None:
+                            checkpoint.add(process, time_range)
+                    else:
+                        failed_set.add(process)
+                        report.failed_list.append((process, time_range, reason))
+
+    report.elapsed = time.monotonic() - start_time
+    return report
+
+
+class _BackfillCheckpoint:
+    """补数检查点文件：每行记录一个已提交成功的（工作流，补数时间段）"""
+
+    def __init__(self, path: str):
+        self._path = path
+        self._lock = threading.Lock()
+        self._done_set: Set[str] = set()
+        if os.path.exists(path):
+            with open(path, "r", encoding="UTF-8") as file:
+                for line in file:
+                    line = line.strip()
+                    if line:
+                        self._done_set.add(line)
+
+    @staticmethod
+    def _key(process: DSProcessDefinition, time_range: DSComplementTimeRange) -> str:
+        return (f"{process.project_code}:{process.process_code}:"
+                f"{time_range.complement_start_date:%Y-%m-%d}:{time_range.complement_end_date:%Y-%m-%d}")
+
+    def contains(self, process: DSProcessDefinition, time_range: DSComplementTimeRange) -> bool:
+        return self._key(process, time_range) in self._done_set
+
+    def add(self, process: DSProcessDefinition, time_range: DSComplementTimeRange) -> None:
+        key = self._key(process, time_range)
+        with self._lock:
+            self._done_set.add(key)
+            with open(self._path, "a", encoding="UTF-8") as file:
+                file.write(key + "\n")
+                file.flush()
+                os.fsync(file.fileno())
@@ -0,0 +1,133 @@
+"""
+批量创建仅包含一个 Shell 任务的工作流
+"""
+
+import concurrent.futures
+import dataclasses
+from typing import List, Optional
+
+from dolphin_sdk.batch.task_code_pool import DSTaskCodePool
+from dolphin_sdk.form import build_process_form_with_one_shell_task
+from dolphin_sdk.web_sdk import DolphinWebSdk
+
+__all__ = [
+    "DSShellProcessSpec",
+    "DSBulkCreateResult",
+    "bulk_create_process_with_one_shell_task"
+]
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class DSShellProcessSpec:
+    """仅包含一个 Shell 任务的工作流的描述（与 create_process_with_one_shell_task 的参数一一对应）"""
+
+    task_name: str = dataclasses.field(kw_only=True)
+    process_name: str = dataclasses.field(kw_only=True)
+    worker_group: str = dataclasses.field(kw_only=True)
+    environment_code: int = dataclasses.field(kw_only=True)
+    shell_script: str = dataclasses.field(kw_only=True)
+    process_description: str = dataclasses.field(kw_only=True, default="")
+
+
+@dataclasses.dataclass(slots=True)
+class DSBulkCreateResult:
+    """批量创建工作流时单个工作流的创建结果"""
+
+    spec: DSShellProcessSpec = dataclasses.field(kw_only=True)
+
+    # 分配的任务编号
+    task_code: Optional[int] = dataclasses.field(kw_only=True, default=None)
+
+    # 创建成功的工作流编号
+    process_code: Optional[int] = dataclasses.field(kw_only=True, default=None)
+
+    # 创建失败的原因
+    error: Optional[str] = dataclasses.field(kw_only=True, default=None)
+
+    @property
+    def success(self) -> bool:
+        return self.error is None and self.process_code is not None
+
+
+def bulk_create_process_with_one_shell_task(sdk: DolphinWebSdk,
+                                            project_code: int,
+                                            spec_list: List[DSShellProcessSpec],
+                                            max_workers: int = 8,
+                                            task_code_pool: Optional[DSTaskCodePool] = None
+                                            ) -> List[DSBulkCreateResult]:
+    """批量创建仅包含一个 Shell 任务的工作流，返回与 spec_list 顺序一致的创建结果列表
+
+    所有任务编号通过一次 gen-task-codes 请求获取；名称校验和工作流提交在线程池中并行执行，单个工作流失败不会中断其他工作流的创建。
+
+    Parameters
+    ----------
+    sdk : DolphinWebSdk
+        海豚调度 Web SDK（多个线程共享其连接池，建议 pool_maxsize 不小于 max_workers）
+    project_code : int
+        项目ID
+    spec_list : List[DSShellProcessSpec]
+        需要创建的工作流的描述列表
+    max_workers : int, default = 8
+        并行提交的线程数
+    task_code_pool : Optional[DSTaskCodePool], default = None
+        任务编号预取池；如提供则从池中获取任务编号，而不再调用 gen-task-codes 接口
+    """
+    if not spec_list:
+        return []
+
+    result_list = [DSBulkCreateResult(spec=spec) for spec in spec_list]
+
+    # 一次性获取所有任务 ID
+    if task_code_pool is not None:
+        if task_code_pool.project_code != project_code:
+            raise ValueError(f"任务编号预取池的项目 {task_code_pool.project_code} 与 {project_code} 不一致")
+        task_code_list = task_code_pool.acquire_many(len(spec_list))
+    else:
+        task_code_list = sdk.get_task_definition_gen_task_codes(project_code=project_code, gen_num=len(spec_list))
+    for result, task_code in zip(result_list, task_code_list):
+        result.task_code = task_code
+
+    # 同一批次中重复的工作流名称只保留第一个
+    visited_name_set = set()
+    pending_list = []
+    for result in result_list:
+        if result.task_code is None:
+            result.error = "未分配到任务 ID"
+        elif result.spec.process_name in visited_name_set:
+            result.error = f"工作流名称在批次中重复: {result.spec.process_name}"
+        else:
+            visited_name_set.add(result.spec.process_name)
+            pending_list.append(result)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_dict = {executor.submit(_create_one, sdk, project_code, result): result for result in pending_list}
+        for future in concurrent.futures.as_completed(future_dict):
+            result = future_dict[future]
+            try:
+                result.process_code = future.result()
+            except Exception as e:
+                result.error = f"{type(e).__name__}: {e}"
+
+    return result_list
+
+
+def _create_one(sdk: DolphinWebSdk, project_code: int, result: DSBulkCreateResult) -> int:
+    """校验名称并提交单个工作流，返回创建的工作流 ID"""
+    spec = result.spec
+    if sdk.get_process_definition_verify_name(project_code, spec.process_name) is False:
+        raise KeyError(f"工作流名称不合法: {spec.process_name}")
+
+    form_data = build_process_form_with_one_shell_task(
+        project_code=project_code,
+        task_code=result.task_code,
+        task_name=spec.task_name,
+        process_name=spec.process_name,
+        worker_group=spec.worker_group,
+        environment_code=spec.environment_code,
+        shell_script=spec.shell_script,
+        process_description=spec.process_description
+    )
+    response_json = sdk.post_process_definition(project_code=project_code, data=form_data)
+    if response_json["code"] != 0:
+        raise KeyError(f"提交工作流失败: code={response_json['code']}, msg={response_json.get('msg')}")
+    return response_json["data"]["code"]
@@ -0,0 +1,161 @@
+"""
+按依赖顺序分批次并行上线 / 下线工作流
+"""
+
+import concurrent.futures
+import dataclasses
+import time
+from typing import Dict, List, Set
+
+from dolphin_sdk.common import topological_wave_list
+from dolphin_sdk.meta_sdk import DolphinMetaSdk
+from dolphin_sdk.objects import DSProcessDefinition
+from dolphin_sdk.objects import DSReleaseState
+from dolphin_sdk.web_sdk import DolphinWebSdk
+
+__all__ = [
+    "DSReleaseWaveReport",
+    "DSBulkReleaseReport",
+    "bulk_release_process_definition"
+]
+
+
+@dataclasses.dataclass(slots=True)
+class DSReleaseWaveReport:
+    """单个批次的上线 / 下线结果"""
+
+    # 批次序号（从 0 开始）
+    wave_index: int = dataclasses.field(kw_only=True)
+
+    # 批次中的工作流
+    process_list: List[DSProcessDefinition] = dataclasses.field(kw_only=True)
+
+    # 执行成功的工作流
+    success_list: List[DSProcessDefinition] = dataclasses.field(kw_only=True, default_factory=lambda: [])
+
+    # 执行失败或被跳过的工作流及原因
+    failed_dict: Dict[DSProcessDefinition, str] = dataclasses.field(kw_only=True, default_factory=lambda: {})
+
+    # 批次耗时（秒）
+    elapsed: float = dataclasses.field(kw_only=True, default=0.0)
+
+
+@dataclasses.dataclass(slots=True)
+class DSBulkReleaseReport:
+    """批量上线 / 下线的结果"""
+
+    release_state: DSReleaseState = dataclasses.field(kw_only=True)
+    wave_report_list: List[DSReleaseWaveReport] = dataclasses.field(kw_only=True, default_factory=lambda: [])
+
+    # 总耗时（秒，包含构造依赖关系的耗时）
+    elapsed: float = dataclasses.field(kw_only=True, default=0.0)
+
+    @property
+    def success_list(self) -> List[DSProcessDefinition]:
+        return [process for wave_report in self.wave_report_list for process in wave_report.success_list]
+
+    @property
+    def failed_dict(self) -> Dict[DSProcessDefinition, str]:
+        return {process: reason
+                for wave_report in self.wave_report_list for process, reason in wave_report.failed_dict.items()}
+
+    def summary(self) -> str:
+        """返回每个批次的耗时统计"""
+        line_list = [f"{self.release_state.web_value}: {len(self.success_list)} 成功, "
+                     f"{len(self.failed_dict)} 失败, 总耗时 {self.elapsed:.2f}s"]
+        for wave_report in self.wave_report_list:
+            line_list.append(f"  wave {wave_report.wave_index}: {len(wave_report.process_list)} 个工作流, "
+                             f"{len(wave_report.success_list)} 成功, {len(wave_report.failed_dict)} 失败, "
+                             f"耗时 {wave_report.elapsed:.2f}s")
+        return "\n".join(line_list)
+
+
+def bulk_release_process_definition(web_sdk: DolphinWebSdk,
+                                    meta_sdk: DolphinMetaSdk,
+                                    process_definition_list: List[DSProcessDefinition],
+                                    release_state: DSReleaseState,
+                                    max_workers: int = 8,
+                                    skip_dependent_on_failure: bool = True) -> DSBulkReleaseReport:
+    """按 DEPENDENT 任务的依赖关系分批次上线 / 下线工作流
+
+    根据海豚元数据构造 process_definition_list 内部的上游依赖关系，并划分为拓扑批次：上线时先上线上游工作流，下线时先下线下游工作流。
+    同一批次内的工作流之间没有依赖关系，在线程池中并行执行；前一个批次全部完成后再执行下一个批次。
+
+    Parameters
+    ----------
+    web_sdk : DolphinWebSdk
+        海豚调度 Web SDK
+    meta_sdk : DolphinMetaSdk
+        海豚调度元数据 SDK
+    process_definition_list : List[DSProcessDefinition]
+        需要上线 / 下线的工作流
+    release_state : DSReleaseState
+        目标状态
+    max_workers : int, default = 8
+        每个批次中并行执行的线程数
+    skip_dependent_on_failure : bool, default = True
+        当某个工作流执行失败时，是否跳过需要在它之后执行的工作流（上线时为其下游，下线时为其上游）
+    """
+    start_time = time.monotonic()
+    report = DSBulkReleaseReport(release_state=release_state)
+
+    upstream_dict = meta_sdk.get_upstream_process_dict_by_process_definition_list(process_definition_list)
+    name_dict = {
+        DSProcessDefinition(project_code=record.project_code, process_code=record.process_code): record.name
+        for record in meta_sdk.get_process_definition_detail_list_by_process_definition_list(process_definition_list)
+    }
+
+    # 计算每个工作流必须在其之后执行的工作流（上线时为其上游，下线时为其下游）
+    if release_state == DSReleaseState.ONLINE:
+        before_dict = upstream_dict
+    else:
+        before_dict = _reverse(process_definition_list, upstream_dict)
+    wave_list = topological_wave_list(process_definition_list, before_dict)
+
+    failed_set = set()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for wave_index, wave in enumerate(wave_list):
+            wave_start_time = time.monotonic()
+            wave_report = DSReleaseWaveReport(wave_index=wave_index, process_list=wave)
+
+            future_dict = {}
+            for process in wave:
+                if process not in name_dict:
+                    wave_report.failed_dict[process] = "工作流在元数据中不存在"
+                elif skip_dependent_on_failure and before_dict.get(process, set()) & failed_set:
+                    wave_report.failed_dict[process] = "依赖的工作流执行失败，已跳过"
+                else:
+                    future = executor.submit(web_sdk.post_process_definition_release,
+                                             process.project_code, process.process_code, name_dict[process],
+                                             release_state)
+                    future_dict[future] = process
+
+            for future in concurrent.futures.as_completed(future_dict):
+                process = future_dict[future]
+                try:
+                    is_success = future.result()
+                except Exception as e:
+                    wave_report.failed_dict[process] = f"{type(e).__name__}: {e}"
+                    continue
+                if is_success:
+                    wave_report.success_list.append(process)
+                else:
+                    wave_report.failed_dict[process] = "接口返回失败"
+
+            failed_set.update(wave_report.failed_dict)
+            wave_report.elapsed = time.monotonic() - wave_start_time
+            report.wave_report_list.append(wave_report)
+
+    report.elapsed = time.monotonic() - start_time
+    return report
+
+
+def _reverse(process_definition_list: List[DSProcessDefinition],
+             upstream_dict: Dict[DSProcessDefinition, Set[DSProcessDefinition]]
+             ) -> Dict[DSProcessDefinition, Set[DSProcessDefinition]]:
+    """将上游依赖关系反转为下游依赖关系"""
+    downstream_dict = {process: set() for process in process_definition_list}
+    for process, upstream_set in upstream_dict.items():
+        for upstream in upstream_set:
+            downstream_dict.setdefault(upstream, set()).add(process)
+    return downstream_dict
@@ -0,0 +1,117 @@
+"""
+工作流定义的内容指纹
+
+将工作流定义中的任务定义、任务关系、任务位置、全局参数、执行策略和租户转换为规范化的 Json 后计算哈希值。同一个工作流定义无论来自
+PostProcessDefinitionForm 表单，还是来自海豚元数据中的记录，都会得到相同的指纹，据此可以判断工作流定义是否发生变化。
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List, Optional
+
+from dolphin_sdk.form import PostProcessDefinitionForm
+from dolphin_sdk.objects import DSLocation
+from dolphin_sdk.objects import DSProcessDefinitionRecord
+from dolphin_sdk.objects import DSProcessTaskRelationRecord
+from dolphin_sdk.objects import DSTaskDefinitionRecord
+
+__all__ = [
+    "fingerprint_process_definition_form",
+    "fingerprint_process_definition_record"
+]
+
+
+def fingerprint_process_definition_form(form: PostProcessDefinitionForm) -> str:
+    """计算创建 / 更新工作流表单的内容指纹"""
+    return _fingerprint({
+        "name": form.name,
+        "description": form.description,
+        "timeout": form.timeout,
+        "executionType": form.execution_type.upper(),
+        "tenantCode": form.tenant_code,
+        "globalParams": form.globalParams,
+        "tasks": _canonical_task_list(form.task_definition_json),
+        "relations": sorted(
+            _canonical_relation(relation.pre_task_code, relation.post_task_code, relation.condition_type,
+                                relation.condition_params)
+            for relation in form.task_relation_json
+        ),
+        "locations": _canonical_location_list(form.locations),
+    })
+
+
+def fingerprint_process_definition_record(process: DSProcessDefinitionRecord,
+                                          task_list: List[DSTaskDefinitionRecord],
+                                          relation_list: List[DSProcessTaskRelationRecord],
+                                          tenant_code: Optional[str]) -> str:
+    """计算海豚元数据中工作流定义的内容指纹
+
+    Parameters
+    ----------
+    process : DSProcessDefinitionRecord
+        t_ds_process_definition 表中的工作流定义
+    task_list : List[DSTaskDefinitionRecord]
+        t_ds_task_definition 表中该工作流包含的所有任务定义
+    relation_list : List[DSProcessTaskRelationRecord]
+        t_ds_process_task_relation 表中该工作流的所有任务关系
+    tenant_code : Optional[str]
+        工作流的租户编码（t_ds_process_definition 表中只保存 tenant_id，需要根据 t_ds_tenant 表转换）
+    """
+    global_params = process.global_params
+    if isinstance(global_params, str):
+        global_params = json.loads(global_params) if global_params else []
+    return _fingerprint({
+        "name": process.name,
+        "description": process.description,
+        "timeout": process.timeout,
+        "executionType": process.execution_type.name,
+        "tenantCode": tenant_code,
+        "globalParams": global_params,
+        "tasks": _canonical_task_list(task_list),
+        "relations": sorted(
+            _canonical_relation(relation.pre_task_code, relation.post_task_code, relation.condition_type.web_value,
+                                relation.condition_params)
+            for relation in relation_list
+        ),
+        "locations": _canonical_location_list(process.locations),
+    })
+
+
+def _canonical_task_list(task_list: List[DSTaskDefinitionRecord]) -> List[Any]:
+    """将任务定义转换为按任务编号排序的 Web API Json 格式（不包含版本号）"""
+    return [_drop_empty(task.to_json()) for task in sorted(task_list, key=lambda task: task.task_code)]
+
+
+def _drop_empty(data: Any) -> Any:
+    """递归地移除值为 None 或空字符串、空列表、空字典的键（表单中的缺省值与元数据中的缺省值写法不同，统一视为未设置）"""
+    if isinstance(data, dict):
+        result = {}
+        for key, value in data.items():
+            value = _drop_empty(value)
+            if value is not None and value != "" and value != [] and value != {}:
+                result[key] = value
+        return result
+    if isinstance(data, list):
+        return [_drop_empty(value) for value in data]
+    return data
+
+
+def _canonical_relation(pre_task_code: int, post_task_code: int, condition_type: str,
+                        condition_params: Optional[Any]) -> str:
+    """将任务关系转换为规范化字符串（不包含版本号；空的条件参数在表单中为 []，在元数据中为 {}，统一视为空）"""
+    return _dumps([pre_task_code, post_task_code, condition_type, condition_params or None])
+
+
+def _canonical_location_list(location_list: List[DSLocation]) -> List[List[Any]]:
+    """将任务位置转换为按任务编号排序的列表"""
+    return sorted([location.task_code, float(location.x), float(location.y)] for location in location_list)
+
+
+def _fingerprint(data: Dict[str, Any]) -> str:
+    if data["description"] is None:
+        data["description"] = ""
+    return hashlib.sha256(_dumps(data).encode("UTF-8")).hexdigest()
+
+
+def _dumps(data: Any) -> str:
+    return json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str)
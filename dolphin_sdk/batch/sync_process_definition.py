@@ -0,0 +1,147 @@
+"""
+基于内容指纹同步工作流定义：仅当工作流定义发生变化时才调用更新接口
+"""
+
+import collections
+import concurrent.futures
+import dataclasses
+from typing import Dict, List, Tuple
+
+from dolphin_sdk.batch.process_fingerprint import fingerprint_process_definition_form
+from dolphin_sdk.batch.process_fingerprint import fingerprint_process_definition_record
+from dolphin_sdk.form import PostProcessDefinitionForm
+from dolphin_sdk.meta_sdk import DolphinMetaSdk
+from dolphin_sdk.objects import DSProcessDefinition
+from dolphin_sdk.objects import DSTaskDefinition
+from dolphin_sdk.web_sdk import DolphinWebSdk
+
+__all__ = [
+    "DSSyncReport",
+    "get_process_definition_fingerprint_dict",
+    "sync_process_definition",
+    "sync_process_definition_list"
+]
+
+
+@dataclasses.dataclass(slots=True)
+class DSSyncReport:
+    """批量同步工作流定义的结果"""
+
+    # 内容发生变化并已更新的工作流
+    updated_list: List[DSProcessDefinition] = dataclasses.field(kw_only=True, default_factory=lambda: [])
+
+    # 内容未变化而跳过更新的工作流
+    skipped_list: List[DSProcessDefinition] = dataclasses.field(kw_only=True, default_factory=lambda: [])
+
+    # 更新失败的工作流及失败原因
+    failed_dict: Dict[DSProcessDefinition, str] = dataclasses.field(kw_only=True, default_factory=lambda: {})
+
+
+def get_process_definition_fingerprint_dict(
+        meta_sdk: DolphinMetaSdk,
+        process_definition_list: List[DSProcessDefinition]
+) -> Dict[DSProcessDefinition, str]:
+    """根据海豚元数据批量计算工作流定义的内容指纹（元数据中不存在的工作流不包含在返回值中）"""
+    process_record_list = meta_sdk.get_process_definition_detail_list_by_process_definition_list(
+        process_definition_list=process_definition_list
+    )
+    relation_list = meta_sdk.get_process_task_relation_list_by_process_definition_list(
+        process_definition_list=process_definition_list
+    )
+
+    process_relation_dict = collections.defaultdict(list)
+    task_definition_set = set()
+    for relation in relation_list:
+        process_relation_dict[relation.process_code].append(relation)
+        task_definition_set.add(DSTaskDefinition(
+            project_code=relation.project_code,
+            task_code=relation.post_task_code,
+            process_code=relation.process_code
+        ))
+
+    process_task_dict = collections.defaultdict(list)
+    for task in meta_sdk.get_task_definition_detail_list_by_task_definition_list(
+            task_definition_list=list(task_definition_set)
+    ):
+        process_task_dict[task.process_code].append(task)
+
+    tenant_code_dict = meta_sdk.get_tenant_code_dict()
+
+    result = {}
+    for process_record in process_record_list:
+        process = DSProcessDefinition(project_code=process_record.project_code,
+                                      process_code=process_record.process_code)
+        result[process] = fingerprint_process_definition_record(
+            process=process_record,
+            task_list=process_task_dict[process_record.process_code],
+            relation_list=process_relation_dict[process_record.process_code],
+            tenant_code=tenant_code_dict.get(process_record.tenant_id)
+        )
+    return result
+
+
+def sync_process_definition(web_sdk: DolphinWebSdk,
+                            meta_sdk: DolphinMetaSdk,
+                            project_code: int,
+                            process_code: int,
+                            data: PostProcessDefinitionForm) -> bool:
+    """当表单与海豚元数据中的工作流定义不一致时更新工作流，返回是否执行了更新"""
+    report = sync_process_definition_list(
+        web_sdk=web_sdk,
+        meta_sdk=meta_sdk,
+        item_list=[(DSProcessDefinition(project_code=project_code, process_code=process_code), data)],
+        max_workers=1
+    )
+    for error in report.failed_dict.values():
+        raise KeyError(error)
+    return len(report.updated_list) > 0
+
+
+def sync_process_definition_list(web_sdk: DolphinWebSdk,
+                                 meta_sdk: DolphinMetaSdk,
+                                 item_list: List[Tuple[DSProcessDefinition, PostProcessDefinitionForm]],
+                                 max_workers: int = 8) -> DSSyncReport:
+    """批量同步工作流定义：先根据元数据批量计算指纹，再仅对指纹不一致的工作流并行调用更新接口
+
+    Parameters
+    ----------
+    web_sdk : DolphinWebSdk
+        海豚调度 Web SDK
+    meta_sdk : DolphinMetaSdk
+        海豚调度元数据 SDK
+    item_list : List[Tuple[DSProcessDefinition, PostProcessDefinitionForm]]
+        工作流及其期望的表单的列表
+    max_workers : int, default = 8
+        并行更新的线程数
+    """
+    report = DSSyncReport()
+    fingerprint_dict = get_process_definition_fingerprint_dict(
+        meta_sdk=meta_sdk,
+        process_definition_list=[process for process, _ in item_list]
+    )
+
+    changed_list = []
+    for process, data in item_list:
+        if fingerprint_dict.get(process) == fingerprint_process_definition_form(data):
+            report.skipped_list.append(process)
+        else:
+            changed_list.append((process, data))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_dict = {
+            executor.submit(web_sdk.put_process_definition, process.project_code, process.process_code, data): process
+            for process, data in changed_list
+        }
+        for future in concurrent.futures.as_completed(future_dict):
+            process = future_dict[future]
+            try:
+                response = future.result()
+            except Exception as e:
+                report.failed_dict[process] = f"{type(e).__name__}: {e}"
+                continue
+            if response["code"] != 0:
+                report.failed_dict[process] = f"code={response['code']}, msg={response.get('msg')}"
+            else:
+                report.updated_list.append(process)
+
+    return report
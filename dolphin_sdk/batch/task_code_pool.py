@@ -0,0 +1,268 @@
+"""
+海豚调度任务编号（task_code）的预取池
+"""
+
+import asyncio
+import collections
+import dataclasses
+import logging
+import threading
+import time
+from typing import Deque, List, Optional
+
+from dolphin_sdk.web_sdk import DolphinApiError
+from dolphin_sdk.web_sdk import DolphinWebSdk
+
+__all__ = [
+    "DSTaskCodePool",
+    "DSTaskCodePoolStats"
+]
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class DSTaskCodePoolStats:
+    """任务编号预取池的统计信息"""
+
+    # 调用 gen-task-codes 接口的次数
+    fetch_count: int = dataclasses.field(kw_only=True)
+
+    # 从接口获取的任务编号数量
+    fetched_count: int = dataclasses.field(kw_only=True)
+
+    # 已分配给调用方的任务编号数量
+    issued_count: int = dataclasses.field(kw_only=True)
+
+    # 关闭时未分配而被丢弃的任务编号数量
+    wasted_count: int = dataclasses.field(kw_only=True)
+
+    # 当前池中剩余的任务编号数量
+    available_count: int = dataclasses.field(kw_only=True)
+
+    # 连续补充失败的次数（补充成功后清零）
+    failure_count: int = dataclasses.field(kw_only=True, default=0)
+
+    # 最近一次补充失败的原因（补充成功后清空）
+    last_error: Optional[str] = dataclasses.field(kw_only=True, default=None)
+
+    # 距离允许再次后台补充的剩余时间（秒，不在退避期间时为 0）
+    backoff_remaining: float = dataclasses.field(kw_only=True, default=0.0)
+
+
+class DSTaskCodePool:
+    """单个项目的任务编号预取池
+
+    按 block_size 成块调用 gen-task-codes 接口预取任务编号，在本地分配；当剩余数量低于 low_water_mark 时在后台线程中补充。
+    补充失败后按指数退避暂停后台补充（池为空时的同步补充不受影响，失败时直接抛出异常）。同步方法是线程安全的，异步方法不会在等待
+    补充时阻塞事件循环。
+    """
+
+    def __init__(self, sdk: DolphinWebSdk, project_code: int,
+                 block_size: int = 200,
+                 low_water_mark: int = 50,
+                 background_refill: bool = True,
+                 min_backoff: float = 1.0,
+                 max_backoff: float = 60.0):
+        """
+
+        Parameters
+        ----------
+        sdk : DolphinWebSdk
+            海豚调度 Web SDK
+        project_code : int
+            项目ID（任务编号按项目生成）
+        block_size : int, default = 200
+            每次调用 gen-task-codes 接口获取的任务编号数量
+        low_water_mark : int, default = 50
+            剩余任务编号数量低于该值时触发后台补充
+        background_refill : bool, default = True
+            是否在后台线程中补充；为 False 时仅在池为空时同步补充
+        min_backoff : float, default = 1.0
+            第一次补充失败后暂停后台补充的时间（秒），之后每次连续失败翻倍
+        max_backoff : float, default = 60.0
+            暂停后台补充的最长时间（秒）
+        """
+        if block_size < 1:
+            raise ValueError(f"block_size 必须为正整数: {block_size}")
+        self._sdk = sdk
+        self._project_code = project_code
+        self._block_size = block_size
+        self._low_water_mark = low_water_mark
+        self._background_refill = background_refill
+        self._min_backoff = min_backoff
+        self._max_backoff = max_backoff
+
+        self._code_queue: Deque[int] = collections.deque()
+        self._condition = threading.Condition()
+        self._refilling = False
+        self._closed = False
+
+        self._fetch_count = 0
+        self._fetched_count = 0
+        self._issued_count = 0
+        self._wasted_count = 0
+        self._failure_count = 0
+        self._last_error: Optional[str] = None
+        self._backoff_deadline = 0.0
+
+    def __enter__(self) -> "DSTaskCodePool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def project_code(self) -> int:
+        return self._project_code
+
+    # ------------------------------ 同步方法 ------------------------------
+
+    def acquire(self) -> int:
+        """获取一个任务编号"""
+        return self.acquire_many(1)[0]
+
+    def acquire_many(self, n: int) -> List[int]:
+        """获取 n 个任务编号（池中不足时同步补充，或等待正在进行的补充完成）"""
+        result = []
+        while True:
+            with self._condition:
+                if self._closed:
+                    self._wasted_count += len(result)
+                    self._check_open()
+                while self._code_queue and len(result) < n:
+                    result.append(self._code_queue.popleft())
+                if len(result) >= n:
+                    self._issued_count += len(result)
+                    self._maybe_start_background_refill()
+                    return result
+                if self._refilling:
+                    self._condition.wait()
+                    continue
+                self._refilling = True
+            try:
+                self._refill(max(self._block_size, n - len(result)))
+            except Exception:
+                with self._condition:  # 补充失败时将已取出的任务编号放回池中
+                    self._code_queue.extendleft(reversed(result))
+                raise
+
+    def try_acquire(self) -> Optional[int]:
+        """在不等待补充的情况下获取一个任务编号，池为空时返回 None"""
+        with self._condition:
+            self._check_open()
+            if not self._code_queue:
+                self._maybe_start_background_refill()
+                return None
+            self._issued_count += 1
+            code = self._code_queue.popleft()
+            self._maybe_start_background_refill()
+            return code
+
+    def release(self, code_list: List[int]) -> None:
+        """归还已获取但未使用的任务编号，使其可以被再次分配"""
+        with self._condition:
+            if self._closed:
+                self._wasted_count += len(code_list)
+                return
+            self._issued_count -= len(code_list)
+            self._code_queue.extendleft(reversed(code_list))
+            self._condition.notify_all()
+
+    def close(self) -> None:
+        """关闭预取池，池中剩余的任务编号计入丢弃数量"""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._wasted_count += len(self._code_queue)
+            self._code_queue.clear()
+            self._condition.notify_all()
+
+    def stats(self) -> DSTaskCodePoolStats:
+        """返回预取池的统计信息"""
+        with self._condition:
+            return DSTaskCodePoolStats(
+                fetch_count=self._fetch_count,
+                fetched_count=self._fetched_count,
+                issued_count=self._issued_count,
+                wasted_count=self._wasted_count,
+                available_count=len(self._code_queue),
+                failure_count=self._failure_count,
+                last_error=self._last_error,
+                backoff_remaining=max(0.0, self._backoff_deadline - time.monotonic())
+            )
+
+    # ------------------------------ 异步方法 ------------------------------
+
+    async def acquire_async(self) -> int:
+        """获取一个任务编号（需要等待补充时在线程池中等待，不阻塞事件循环）"""
+        code = self.try_acquire()
+        if code is not None:
+            return code
+        return await asyncio.get_running_loop().run_in_executor(None, self.acquire)
+
+    async def acquire_many_async(self, n: int) -> List[int]:
+        """获取 n 个任务编号（需要等待补充时在线程池中等待，不阻塞事件循环）"""
+        return await asyncio.get_running_loop().run_in_executor(None, self.acquire_many, n)
+
+    # ------------------------------ 内部方法 ------------------------------
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise RuntimeError("任务编号预取池已关闭")
+
+    def _maybe_start_background_refill(self) -> None:
+        """剩余数量低于低水位、且不在补充失败后的退避期间时启动后台补充线程（调用方需持有锁）"""
+        if (self._background_refill is False or self._refilling is True
+                or len(self._code_queue) >= self._low_water_mark
+                or time.monotonic() < self._backoff_deadline):
+            return
+        self._refilling = True
+        thread = threading.Thread(target=self._background_refill_worker, daemon=True,
+                                  name=f"DSTaskCodePool-{self._project_code}")
+        thread.start()
+
+    def _background_refill_worker(self) -> None:
+        try:
+            self._refill(self._block_size)
+        except Exception:  # 后台补充失败时只记录日志并进入退避，由下一次同步补充重新请求并抛出异常
+            _LOGGER.exception("任务编号预取池后台补充失败: project_code=%s", self._project_code)
+
+    def _refill(self, size: int) -> None:
+        """调用 gen-task-codes 接口补充任务编号（调用方需已将 _refilling 置为 True 且未持有锁）
+
+        接口没有返回任何任务编号时抛出 DolphinApiError，避免 acquire_many 反复请求接口而无法结束。
+        """
+        try:
+            code_list = self._sdk.get_task_definition_gen_task_codes(project_code=self._project_code, gen_num=size)
+        except Exception as e:
+            with self._condition:
+                self._record_failure(e)
+            raise
+        with self._condition:
+            self._fetch_count += 1
+            if not code_list:
+                error = DolphinApiError(f"gen-task-codes 接口没有返回任务编号: project_code={self._project_code}, "
+                                        f"gen_num={size}")
+                self._record_failure(error)
+                raise error
+            self._failure_count = 0
+            self._last_error = None
+            self._backoff_deadline = 0.0
+            self._fetched_count += len(code_list)
+            if self._closed:
+                self._wasted_count += len(code_list)
+            else:
+                self._code_queue.extend(code_list)
+            self._refilling = False
+            self._condition.notify_all()
+
+    def _record_failure(self, error: Exception) -> None:
+        """记录补充失败并设置后台补充的退避截止时间，结束本次补充（调用方需持有锁）"""
+        self._failure_count += 1
+        self._last_error = f"{type(error).__name__}: {error}"
+        backoff = min(self._max_backoff, self._min_backoff * 2 ** (self._failure_count - 1))
+        self._backoff_deadline = time.monotonic() + backoff
+        self._refilling = False
+        self._condition.notify_all()
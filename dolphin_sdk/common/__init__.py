@@ -1 +1,12 @@
-from dolphin_sdk.common.total import meta_list_to_json
\ No newline at end of file
+from dolphin_sdk.common.graph import topological_wave_list
+from dolphin_sdk.common.instrumentation import DSCallbackHook
+from dolphin_sdk.common.instrumentation import DSEndpointStats
+from dolphin_sdk.common.instrumentation import DSLatencyHistogram
+from dolphin_sdk.common.instrumentation import DSRequestEvent
+from dolphin_sdk.common.instrumentation import DSRequestHook
+from dolphin_sdk.common.instrumentation import dispatch_request_event
+from dolphin_sdk.common.rate_limiter import DSRateLimiter
+from dolphin_sdk.common.rate_limiter import DSRateLimiterStats
+from dolphin_sdk.common.read_cache import DSReadCache
+from dolphin_sdk.common.read_cache import DSReadCacheStats
+from dolphin_sdk.common.total import meta_list_to_json
@@ -0,0 +1,53 @@
+"""
+有向无环图相关工具函数
+"""
+
+from typing import Dict, Hashable, Iterable, List, Set, TypeVar
+
+__all__ = [
+    "topological_wave_list"
+]
+
+T = TypeVar("T", bound=Hashable)
+
+
+def topological_wave_list(node_list: Iterable[T], upstream_dict: Dict[T, Set[T]]) -> List[List[T]]:
+    """将节点按依赖关系划分为拓扑层级：每一层中的节点只依赖于之前层级中的节点，同一层中的节点之间没有依赖关系
+
+    只考虑 node_list 内部节点之间的依赖关系；如果存在环，则环上的节点（及其下游节点）统一放在最后一层。层级内部的节点保持
+    node_list 中的顺序。
+
+    Parameters
+    ----------
+    node_list : Iterable[T]
+        节点的列表
+    upstream_dict : Dict[T, Set[T]]
+        节点到其直接上游节点集合的映射
+    """
+    node_list = list(dict.fromkeys(node_list))
+    node_set = set(node_list)
+    remain_dict = {node: {upstream for upstream in upstream_dict.get(node, ()) if upstream in node_set and upstream != node}
+                   for node in node_list}
+    downstream_dict = {node: [] for node in node_list}
+    for node, upstream_set in remain_dict.items():
+        for upstream in upstream_set:
+            downstream_dict[upstream].append(node)
+
+    wave_list = []
+    current_wave = [node for node in node_list if not remain_dict[node]]
+    visited_count = 0
+    while current_wave:
+        wave_list.append(current_wave)
+        visited_count += len(current_wave)
+        next_wave_set = set()
+        for node in current_wave:
+            for downstream in downstream_dict[node]:
+                remain_dict[downstream].discard(node)
+                if not remain_dict[downstream]:
+                    next_wave_set.add(downstream)
+        current_wave = [node for node in node_list if node in next_wave_set]
+
+    if visited_count < len(node_list):
+        visited_set = {node for wave in wave_list for node in wave}
+        wave_list.append([node for node in node_list if node not in visited_set])
+    return wave_list
@@ -0,0 +1,214 @@
+"""
+Web API 请求的埋点：每个请求完成后生成一个 DSRequestEvent 并交给所有 DSRequestHook 处理
+"""
+
+import abc
+import dataclasses
+import logging
+import math
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+__all__ = [
+    "DSRequestEvent",
+    "DSRequestHook",
+    "DSCallbackHook",
+    "DSEndpointStats",
+    "DSLatencyHistogram",
+    "dispatch_request_event"
+]
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class DSRequestEvent:
+    """一次 Web API 请求的埋点事件"""
+
+    # 接口模板，例如 /projects/{project_code}/process-definition/{code}
+    endpoint: str = dataclasses.field(kw_only=True)
+
+    # 请求方法
+    method: str = dataclasses.field(kw_only=True)
+
+    # HTTP 状态码（请求未收到响应时为 None）
+    status_code: Optional[int] = dataclasses.field(kw_only=True, default=None)
+
+    # 海豚调度响应中的 code 字段（响应不是 Json 或不包含 code 时为 None）
+    ds_code: Optional[int] = dataclasses.field(kw_only=True, default=None)
+
+    # 请求体字节数
+    request_bytes: int = dataclasses.field(kw_only=True, default=0)
+
+    # 响应体字节数
+    response_bytes: int = dataclasses.field(kw_only=True, default=0)
+
+    # 请求耗时（秒）
+    latency: float = dataclasses.field(kw_only=True)
+
+    # 请求异常（请求成功时为 None）
+    error: Optional[str] = dataclasses.field(kw_only=True, default=None)
+
+    @property
+    def is_server_error(self) -> bool:
+        """是否为服务端错误（请求异常或 HTTP 5xx）"""
+        return self.error is not None or (self.status_code is not None and self.status_code >= 500)
+
+
+class DSRequestHook(abc.ABC):
+    """请求埋点的回调接口（可能在多个线程中被同时调用，实现需要线程安全；实现不应抛出异常）"""
+
+    @abc.abstractmethod
+    def on_request(self, event: DSRequestEvent) -> None:
+        """在每个请求完成（或失败）后被调用"""
+
+
+class DSCallbackHook(DSRequestHook):
+    """将埋点事件转发给回调函数，用于对接外部的指标系统"""
+
+    def __init__(self, callback: Callable[[DSRequestEvent], None]):
+        self._callback = callback
+
+    def on_request(self, event: DSRequestEvent) -> None:
+        self._callback(event)
+
+
+def dispatch_request_event(hook_list: Iterable[DSRequestHook], event: DSRequestEvent) -> None:
+    """依次将埋点事件交给每个 DSRequestHook 处理；回调抛出的异常只记录日志，不影响请求的结果和其他回调"""
+    for hook in hook_list:
+        try:
+            hook.on_request(event)
+        except Exception:
+            _LOGGER.exception("请求埋点回调 %s 执行失败: %s %s", type(hook).__name__, event.method, event.endpoint)
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class DSEndpointStats:
+    """单个接口的请求统计"""
+
+    method: str = dataclasses.field(kw_only=True)
+    endpoint: str = dataclasses.field(kw_only=True)
+    count: int = dataclasses.field(kw_only=True)
+
+    # 服务端错误（请求异常或 HTTP 5xx）的数量
+    error_count: int = dataclasses.field(kw_only=True)
+
+    # 海豚调度响应 code 不为 0 的数量
+    ds_error_count: int = dataclasses.field(kw_only=True)
+
+    # 耗时分位数（秒）
+    p50: float = dataclasses.field(kw_only=True)
+    p95: float = dataclasses.field(kw_only=True)
+    p99: float = dataclasses.field(kw_only=True)
+    max: float = dataclasses.field(kw_only=True)
+    mean: float = dataclasses.field(kw_only=True)
+
+    request_bytes: int = dataclasses.field(kw_only=True)
+    response_bytes: int = dataclasses.field(kw_only=True)
+
+
+class _Histogram:
+    """对数分桶的耗时直方图（相邻桶的上界相差 growth 倍，分位数的相对误差不超过 growth - 1）"""
+
+    __slots__ = ("bucket_dict", "count", "error_count", "ds_error_count", "total", "max",
+                 "request_bytes", "response_bytes")
+
+    def __init__(self):
+        self.bucket_dict: Dict[int, int] = {}
+        self.count = 0
+        self.error_count = 0
+        self.ds_error_count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+
+class DSLatencyHistogram(DSRequestHook):
+    """进程内的请求耗时聚合器：按（请求方法，接口模板）统计耗时分位数、错误数量和字节数"""
+
+    def __init__(self, min_latency: float = 0.0001, growth: float = 1.05):
+        """
+
+        Parameters
+        ----------
+        min_latency : float, default = 0.0001
+            第一个桶的上界（秒）
+        growth : float, default = 1.05
+            相邻桶上界的比例
+        """
+        self._min_latency = min_latency
+        self._log_growth = math.log(growth)
+        self._growth = growth
+        self._lock = threading.Lock()
+        self._histogram_dict: Dict[Tuple[str, str], _Histogram] = {}
+
+    def on_request(self, event: DSRequestEvent) -> None:
+        if event.latency <= self._min_latency:
+            bucket = 0
+        else:
+            bucket = math.ceil(math.log(event.latency / self._min_latency) / self._log_growth)
+        with self._lock:
+            histogram = self._histogram_dict.get((event.method, event.endpoint))
+            if histogram is None:
+                histogram = self._histogram_dict[(event.method, event.endpoint)] = _Histogram()
+            histogram.bucket_dict[bucket] = histogram.bucket_dict.get(bucket, 0) + 1
+            histogram.count += 1
+            histogram.total += event.latency
+            histogram.max = max(histogram.max, event.latency)
+            histogram.request_bytes += event.request_bytes
+            histogram.response_bytes += event.response_bytes
+            if event.is_server_error:
+                histogram.error_count += 1
+            if event.ds_code is not None and event.ds_code != 0:
+                histogram.ds_error_count += 1
+
+    def reset(self) -> None:
+        """清空所有统计"""
+        with self._lock:
+            self._histogram_dict.clear()
+
+    def snapshot(self) -> List[DSEndpointStats]:
+        """返回所有接口的统计，按请求数量降序排列"""
+        with self._lock:
+            result = [self._to_stats(method, endpoint, histogram)
+                      for (method, endpoint), histogram in self._histogram_dict.items()]
+        result.sort(key=lambda stats: stats.count, reverse=True)
+        return result
+
+    def summary(self) -> str:
+        """返回所有接口统计的文本表格"""
+        line_list = [f"{'method':<6} {'endpoint':<64} {'count':>7} {'err':>5} {'ds_err':>6} "
+                     f"{'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9} {'max(ms)':>9}"]
+        for stats in self.snapshot():
+            line_list.append(f"{stats.method:<6} {stats.endpoint:<64} {stats.count:>7} {stats.error_count:>5} "
+                             f"{stats.ds_error_count:>6} {stats.p50 * 1000:>9.1f} {stats.p95 * 1000:>9.1f} "
+                             f"{stats.p99 * 1000:>9.1f} {stats.max * 1000:>9.1f}")
+        return "\n".join(line_list)
+
+    def _to_stats(self, method: str, endpoint: str, histogram: _Histogram) -> DSEndpointStats:
+        bucket_list = sorted(histogram.bucket_dict.items())
+        return DSEndpointStats(
+            method=method,
+            endpoint=endpoint,
+            count=histogram.count,
+            error_count=histogram.error_count,
+            ds_error_count=histogram.ds_error_count,
+            p50=self._quantile(bucket_list, histogram, 0.50),
+            p95=self._quantile(bucket_list, histogram, 0.95),
+            p99=self._quantile(bucket_list, histogram, 0.99),
+            max=histogram.max,
+            mean=histogram.total / histogram.count if histogram.count > 0 else 0.0,
+            request_bytes=histogram.request_bytes,
+            response_bytes=histogram.response_bytes
+        )
+
+    def _quantile(self, bucket_list: List[Tuple[int, int]], histogram: _Histogram, q: float) -> float:
+        """返回分位数所在桶的上界（不超过最大耗时）"""
+        rank = q * histogram.count
+        cumulative = 0
+        for bucket, count in bucket_list:
+            cumulative += count
+            if cumulative >= rank:
+                return min(self._min_latency * self._growth ** bucket, histogram.max)
+        return histogram.max
@@ -0,0 +1,237 @@
+"""
+Web API 请求的限流器：令牌桶限制请求速率，并限制同时在途的请求数量；可选地根据请求耗时和错误率自适应地调整在途请求数量上限（AIMD）
+"""
+
+import asyncio
+import dataclasses
+import math
+import threading
+import time
+from typing import Optional
+
+from dolphin_sdk.common.instrumentation import DSRequestEvent
+
+__all__ = [
+    "DSRateLimiter",
+    "DSRateLimiterStats"
+]
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class DSRateLimiterStats:
+    """限流器的统计信息"""
+
+    # 当前在途的请求数量
+    in_flight: int = dataclasses.field(kw_only=True)
+
+    # 当前的在途请求数量上限（None 表示不限制）
+    concurrency_limit: Optional[int] = dataclasses.field(kw_only=True)
+
+    # 获取许可的次数
+    acquired_count: int = dataclasses.field(kw_only=True)
+
+    # 需要等待才获取到许可的次数
+    throttled_count: int = dataclasses.field(kw_only=True)
+
+    # 等待许可的总时间（秒）
+    total_wait_time: float = dataclasses.field(kw_only=True)
+
+    # 自适应模式下降低 / 提高在途请求数量上限的次数
+    decrease_count: int = dataclasses.field(kw_only=True)
+    increase_count: int = dataclasses.field(kw_only=True)
+
+
+class DSRateLimiter:
+    """Web API 请求的限流器（线程安全，可以在多个 SDK 实例、多个线程和多个事件循环之间共享）
+
+    每个请求在发起前调用 acquire()（或 acquire_async()）获取许可，在完成后调用 release(event) 归还许可。
+
+    开启自适应模式时，每完成 window_size 个请求调整一次在途请求数量上限：如窗口内的错误率超过 max_error_rate，或平均耗时超过
+    延迟阈值，则将上限乘以 decrease_factor；否则将上限加 1，直至 max_in_flight。
+    """
+
+    def __init__(self, rate: Optional[float] = None,
+                 burst: Optional[int] = None,
+                 max_in_flight: Optional[int] = None,
+                 adaptive: bool = False,
+                 min_in_flight: int = 1,
+                 window_size: int = 20,
+                 max_error_rate: float = 0.05,
+                 target_latency: Optional[float] = None,
+                 latency_tolerance: float = 2.0,
+                 decrease_factor: float = 0.5,
+                 count_ds_error: bool = False):
+        """
+
+        Parameters
+        ----------
+        rate : Optional[float], default = None
+            每秒请求数量上限，为 None 时不限制请求速率
+        burst : Optional[int], default = None
+            令牌桶容量（允许的突发请求数量），为 None 时为 max(1, ceil(rate))
+        max_in_flight : Optional[int], default = None
+            同时在途的请求数量上限，为 None 时不限制；开启自适应模式时必须提供，作为自适应调整的上界
+        adaptive : bool, default = False
+            是否根据请求耗时和错误率自适应地调整在途请求数量上限
+        min_in_flight : int, default = 1
+            自适应调整的下界
+        window_size : int, default = 20
+            自适应模式下每次调整所依据的请求数量
+        max_error_rate : float, default = 0.05
+            自适应模式下可接受的错误率（请求异常、HTTP 5xx，以及 count_ds_error 为 True 时海豚调度响应 code 不为 0 的请求）
+        target_latency : Optional[float], default = None
+            自适应模式下可接受的平均耗时（秒）；为 None 时使用观察到的最低窗口平均耗时乘以 latency_tolerance
+        latency_tolerance : float, default = 2.0
+            未提供 target_latency 时，平均耗时相对于基线耗时的容忍倍数
+        decrease_factor : float, default = 0.5
+            自适应模式下降低在途请求数量上限时的乘数
+        count_ds_error : bool, default = False
+            是否将海豚调度响应 code 不为 0 的请求计为错误（名称校验等接口会正常地返回非 0 的 code，因此默认不计入）
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError(f"rate 必须为正数: {rate}")
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError(f"max_in_flight 必须为正整数: {max_in_flight}")
+        if adaptive is True and max_in_flight is None:
+            raise ValueError("自适应模式必须提供 max_in_flight")
+
+        self._rate = rate
+        self._burst = burst if burst is not None else (max(1, math.ceil(rate)) if rate is not None else 1)
+        self._max_in_flight = max_in_flight
+        self._adaptive = adaptive
+        self._min_in_flight = max(1, min(min_in_flight, max_in_flight)) if max_in_flight is not None else 1
+        self._window_size = window_size
+        self._max_error_rate = max_error_rate
+        self._target_latency = target_latency
+        self._latency_tolerance = latency_tolerance
+        self._decrease_factor = decrease_factor
+        self._count_ds_error = count_ds_error
+
+        self._condition = threading.Condition()
+        self._tokens = float(self._burst)
+        self._last_refill = time.monotonic()
+        self._in_flight = 0
+        self._limit = max_in_flight
+
+        # 自适应窗口
+        self._window_count = 0
+        self._window_error_count = 0
+        self._window_latency = 0.0
+        self._baseline_latency: Optional[float] = None
+
+        self._acquired_count = 0
+        self._throttled_count = 0
+        self._total_wait_time = 0.0
+        self._decrease_count = 0
+        self._increase_count = 0
+
+    @property
+    def adaptive(self) -> bool:
+        return self._adaptive
+
+    @property
+    def concurrency_limit(self) -> Optional[int]:
+        return self._limit
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """阻塞直至获取许可；如在 timeout 秒内未获取到许可则返回 False"""
+        start_time = time.monotonic()
+        deadline = start_time + timeout if timeout is not None else None
+        with self._condition:
+            while True:
+                wait_time = self._try_acquire_locked()
+                if wait_time is None:
+                    self._record_acquired_locked(time.monotonic() - start_time)
+                    return True
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    wait_time = min(wait_time, remaining) if wait_time > 0 else remaining
+                # wait_time 为 0 表示需要等待在途请求完成，由 release() 唤醒
+                self._condition.wait(wait_time if wait_time > 0 else None)
+
+    async def acquire_async(self, poll_interval: float = 0.01) -> None:
+        """在协程中等待直至获取许可（需要等待在途请求完成时，每隔 poll_interval 秒重试一次，不阻塞事件循环）"""
+        start_time = time.monotonic()
+        while True:
+            with self._condition:
+                wait_time = self._try_acquire_locked()
+                if wait_time is None:
+                    self._record_acquired_locked(time.monotonic() - start_time)
+                    return
+            await asyncio.sleep(wait_time if wait_time > 0 else poll_interval)
+
+    def release(self, event: Optional[DSRequestEvent] = None) -> None:
+        """归还许可；自适应模式下根据请求的埋点事件调整在途请求数量上限"""
+        with self._condition:
+            self._in_flight -= 1
+            if self._adaptive is True and event is not None:
+                self._observe_locked(event)
+            self._condition.notify_all()
+
+    def stats(self) -> DSRateLimiterStats:
+        """返回限流器的统计信息"""
+        with self._condition:
+            return DSRateLimiterStats(
+                in_flight=self._in_flight,
+                concurrency_limit=self._limit,
+                acquired_count=self._acquired_count,
+                throttled_count=self._throttled_count,
+                total_wait_time=self._total_wait_time,
+                decrease_count=self._decrease_count,
+                increase_count=self._increase_count
+            )
+
+    def _try_acquire_locked(self) -> Optional[float]:
+        """尝试获取许可；成功时返回 None，否则返回建议的等待时间（秒，0 表示需要等待在途请求完成）"""
+        if self._limit is not None and self._in_flight >= self._limit:
+            return 0.0
+        if self._rate is not None:
+            now = time.monotonic()
+            self._tokens = min(float(self._burst), self._tokens + (now - self._last_refill) * self._rate)
+            self._last_refill = now
+            if self._tokens < 1:
+                return (1 - self._tokens) / self._rate
+            self._tokens -= 1
+        self._in_flight += 1
+        return None
+
+    def _record_acquired_locked(self, wait_time: float) -> None:
+        self._acquired_count += 1
+        if wait_time > 0.001:
+            self._throttled_count += 1
+            self._total_wait_time += wait_time
+
+    def _observe_locked(self, event: DSRequestEvent) -> None:
+        """将请求计入自适应窗口，窗口满时调整在途请求数量上限"""
+        self._window_count += 1
+        self._window_latency += event.latency
+        if event.is_server_error or (self._count_ds_error and event.ds_code is not None and event.ds_code != 0):
+            self._window_error_count += 1
+        if self._window_count < self._window_size:
+            return
+
+        error_rate = self._window_error_count / self._window_count
+        mean_latency = self._window_latency / self._window_count
+        self._window_count = 0
+        self._window_error_count = 0
+        self._window_latency = 0.0
+
+        if self._target_latency is not None:
+            latency_threshold = self._target_latency
+        else:
+            if error_rate <= self._max_error_rate and (self._baseline_latency is None
+                                                       or mean_latency < self._baseline_latency):
+                self._baseline_latency = mean_latency
+            latency_threshold = (self._baseline_latency * self._latency_tolerance if self._baseline_latency is not None
+                                 else math.inf)
+
+        if error_rate > self._max_error_rate or mean_latency > latency_threshold:
+            new_limit = max(self._min_in_flight, int(self._limit * self._decrease_factor))
+            if new_limit < self._limit:
+                self._limit = new_limit
+                self._decrease_count += 1
+        elif self._limit < self._max_in_flight:
+            self._limit += 1
+            self._increase_count += 1
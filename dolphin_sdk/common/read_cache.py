@@ -0,0 +1,176 @@
+"""
+只读请求的缓存：合并并发的相同请求（single-flight），并将结果保存在有容量上限、按接口设置过期时间的 LRU 缓存中
+"""
+
+import collections
+import dataclasses
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+__all__ = [
+    "DSReadCache",
+    "DSReadCacheStats"
+]
+
+T = TypeVar("T")
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class DSReadCacheStats:
+    """只读请求缓存的统计信息"""
+
+    # 命中缓存的次数
+    hit_count: int = dataclasses.field(kw_only=True)
+
+    # 未命中缓存而实际发起请求的次数
+    miss_count: int = dataclasses.field(kw_only=True)
+
+    # 与正在进行中的相同请求合并的次数
+    coalesced_count: int = dataclasses.field(kw_only=True)
+
+    # 因超过容量上限而被淘汰的缓存数量
+    eviction_count: int = dataclasses.field(kw_only=True)
+
+    # 当前缓存数量
+    size: int = dataclasses.field(kw_only=True)
+
+
+class _InFlight:
+    """正在进行中的请求"""
+
+    __slots__ = ("event", "value", "error", "invalidated")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+        self.invalidated = False
+
+
+class DSReadCache:
+    """只读请求的缓存（线程安全）
+
+    缓存键由接口模板（endpoint）和请求参数（key）组成；接口模板同时用于查找过期时间。缓存的返回值会被多个调用方共享，调用方不应修改。
+    """
+
+    def __init__(self, max_size: int = 1024,
+                 default_ttl: float = 30.0,
+                 ttl_dict: Optional[Dict[str, float]] = None):
+        """
+
+        Parameters
+        ----------
+        max_size : int, default = 1024
+            缓存数量上限，超过时淘汰最久未使用的缓存
+        default_ttl : float, default = 30.0
+            缓存的默认过期时间（秒）
+        ttl_dict : Optional[Dict[str, float]], default = None
+            接口模板到过期时间（秒）的映射，用于覆盖默认过期时间；过期时间为 0 时不缓存（但仍合并并发请求）
+        """
+        self._max_size = max_size
+        self._default_ttl = default_ttl
+        self._ttl_dict = dict(ttl_dict) if ttl_dict is not None else {}
+
+        self._lock = threading.Lock()
+        self._cache: "collections.OrderedDict[Tuple[Hashable, ...], Tuple[float, Any]]" = collections.OrderedDict()
+        self._in_flight_dict: Dict[Tuple[Hashable, ...], _InFlight] = {}
+
+        self._hit_count = 0
+        self._miss_count = 0
+        self._coalesced_count = 0
+        self._eviction_count = 0
+
+    def get_or_load(self, endpoint: str, key: Tuple[Hashable, ...], loader: Callable[[], T]) -> T:
+        """返回缓存的结果；如未缓存，则调用 loader 获取结果（同一时间相同键的请求只调用一次 loader）
+
+        Parameters
+        ----------
+        endpoint : str
+            接口模板
+        key : Tuple[Hashable, ...]
+            请求参数
+        loader : Callable[[], T]
+            实际发起请求的函数（抛出异常时结果不会被缓存）
+        """
+        cache_key = (endpoint,) + tuple(key)
+        with self._lock:
+            entry = self._cache.get(cache_key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._cache.move_to_end(cache_key)
+                    self._hit_count += 1
+                    return entry[1]
+                del self._cache[cache_key]
+
+            in_flight = self._in_flight_dict.get(cache_key)
+            if in_flight is not None:
+                self._coalesced_count += 1
+                is_leader = False
+            else:
+                in_flight = _InFlight()
+                self._in_flight_dict[cache_key] = in_flight
+                self._miss_count += 1
+                is_leader = True
+
+        if is_leader is False:
+            in_flight.event.wait()
+            if in_flight.error is not None:
+                raise in_flight.error
+            return in_flight.value
+
+        try:
+            value = loader()
+        except BaseException as e:
+            in_flight.error = e
+            with self._lock:
+                self._in_flight_dict.pop(cache_key, None)
+            in_flight.event.set()
+            raise
+
+        in_flight.value = value
+        with self._lock:
+            self._in_flight_dict.pop(cache_key, None)
+            ttl = self._ttl_dict.get(endpoint, self._default_ttl)
+            if in_flight.invalidated is False and ttl > 0:
+                self._cache[cache_key] = (time.monotonic() + ttl, value)
+                self._cache.move_to_end(cache_key)
+                while len(self._cache) > self._max_size:
+                    self._cache.popitem(last=False)
+                    self._eviction_count += 1
+        in_flight.event.set()
+        return value
+
+    def invalidate(self, endpoint: str, key_prefix: Tuple[Hashable, ...] = ()) -> int:
+        """使接口模板为 endpoint 且请求参数以 key_prefix 开头的缓存失效，返回失效的缓存数量
+
+        正在进行中的匹配请求的结果不会被写入缓存（但仍会返回给等待中的调用方）。
+        """
+        prefix = (endpoint,) + tuple(key_prefix)
+        n_prefix = len(prefix)
+        with self._lock:
+            remove_list = [cache_key for cache_key in self._cache if cache_key[:n_prefix] == prefix]
+            for cache_key in remove_list:
+                del self._cache[cache_key]
+            for cache_key, in_flight in self._in_flight_dict.items():
+                if cache_key[:n_prefix] == prefix:
+                    in_flight.invalidated = True
+        return len(remove_list)
+
+    def clear(self) -> None:
+        """清空所有缓存"""
+        with self._lock:
+            self._cache.clear()
+            for in_flight in self._in_flight_dict.values():
+                in_flight.invalidated = True
+
+    def stats(self) -> DSReadCacheStats:
+        """返回缓存的统计信息"""
+        with self._lock:
+            return DSReadCacheStats(
+                hit_count=self._hit_count,
+                miss_count=self._miss_count,
+                coalesced_count=self._coalesced_count,
+                eviction_count=self._eviction_count,
+                size=len(self._cache)
+            )
@@ -1 +1,4 @@
+from dolphin_sdk.demo.benchmark_intern import benchmark_intern
+from dolphin_sdk.demo.benchmark_row_decoder import benchmark_row_decoder
+from dolphin_sdk.demo.create_shell_task import build_process_form_with_one_shell_task
 from dolphin_sdk.demo.create_shell_task import create_process_with_one_shell_task
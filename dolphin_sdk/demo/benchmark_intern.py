@@ -0,0 +1,102 @@
+"""
+比较构造 t_ds_task_definition 表记录对象时开启和不开启字符串驻留的内存占用
+
+使用内存中构造的模拟记录，不需要连接数据库：worker_group、依赖项的 cycle / dateValue 等字段只有少数几种取值，description 和
+脚本各不相同。分别在不使用驻留池和使用驻留池的情况下构造记录对象并解析 task_params，使用 tracemalloc 统计记录对象占用的内存。
+"""
+
+import datetime
+import gc
+import json
+import tracemalloc
+from typing import Dict, List, Optional, Tuple
+
+from dolphin_sdk.objects import DSInternPool
+from dolphin_sdk.objects import DSTaskDefinitionRecord
+
+__all__ = [
+    "benchmark_intern"
+]
+
+_WORKER_GROUP_LIST = ["default", "gpu_cluster_group_a", "cpu_cluster_group_b"]
+
+
+def _build_task_definition_rows(row_count: int) -> Tuple[List[str], List[tuple]]:
+    """构造 t_ds_task_definition 表的模拟记录（一半为 SHELL 类型，一半为 DEPENDENT 类型）
+
+    每条记录的字符串都单独构造（json.loads 和 bytes.decode 的结果），与从数据库读取的结果一致。
+    """
+    column_list = [
+        "id", "code", "name", "version", "description", "project_code", "user_id", "task_type", "task_execute_type",
+        "task_params", "flag", "task_priority", "worker_group", "environment_code", "fail_retry_times",
+        "fail_retry_interval", "timeout_flag", "timeout_notify_strategy", "timeout", "delay_time", "resource_ids",
+        "task_group_id", "task_group_priority", "cpu_quota", "memory_max", "create_time", "update_time"
+    ]
+    now = datetime.datetime(2024, 1, 1)
+    row_list = []
+    for i in range(row_count):
+        if i % 2 == 0:
+            task_type = "SHELL"
+            task_params = json.dumps({
+                "rawScript": f"echo {i}",
+                "localParams": [{"prop": "dt", "direct": "IN", "type": "VARCHAR", "value": "${system.biz.date}"}],
+                "resourceList": []
+            })
+        else:
+            task_type = "DEPENDENT"
+            task_params = json.dumps({
+                "localParams": [], "resourceList": [],
+                "dependence": {"relation": "AND", "dependTaskList": [{"relation": "AND", "dependItemList": [
+                    {"projectCode": 1, "definitionCode": 500 + i % 50, "depTaskCode": 0, "cycle": "day",
+                     "dateValue": "today"}
+                ]}]}
+            })
+        worker_group = _WORKER_GROUP_LIST[i % len(_WORKER_GROUP_LIST)].encode().decode()
+        row_list.append((i, 10000 + i, f"task_{i}", 1, f"任务 {i}", 1, 1, task_type.encode().decode(), 0, task_params, 1,
+                         2, worker_group, -1, 0, 1, 0, 0, 0, 0, "", 0, 0, -1, -1, now, now))
+    return column_list, row_list
+
+
+def _measure(column_list: List[str], row_list: List[tuple], intern_pool: Optional[DSInternPool]) -> int:
+    """返回构造记录对象并解析 task_params 后新增的内存（字节）"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        decoder = DSTaskDefinitionRecord.compile_row_decoder(column_list, eager=True, intern_pool=intern_pool)
+        record_list = [decoder(row) for row in row_list]
+        gc.collect()
+        memory_bytes, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del record_list
+    return memory_bytes
+
+
+def benchmark_intern(row_count: int = 20000) -> Dict[str, float]:
+    """返回不开启和开启字符串驻留时记录对象占用的内存，以及驻留池的统计信息，并打印对比结果
+
+    Parameters
+    ----------
+    row_count : int, default = 20000
+        模拟记录数
+    """
+    column_list, row_list = _build_task_definition_rows(row_count)
+    plain_bytes = _measure(column_list, row_list, None)
+    intern_pool = DSInternPool()
+    intern_bytes = _measure(column_list, row_list, intern_pool)
+    stats = intern_pool.stats()
+
+    print(f"不开启驻留: {plain_bytes / 1024 / 1024:.2f} MB，开启驻留: {intern_bytes / 1024 / 1024:.2f} MB，"
+          f"节省 {(plain_bytes - intern_bytes) / 1024 / 1024:.2f} MB")
+    print(f"驻留池: {stats.distinct_count} 个字符串，命中 {stats.hit_count} / {stats.lookup_count} 次，"
+          f"净节省 {stats.net_saved_bytes / 1024 / 1024:.2f} MB")
+    return {
+        "plain_bytes": plain_bytes,
+        "intern_bytes": intern_bytes,
+        "saved_bytes": stats.saved_bytes,
+        "net_saved_bytes": stats.net_saved_bytes,
+    }
+
+
+if __name__ == "__main__":
+    benchmark_intern()
@@ -0,0 +1,117 @@
+"""
+比较字典格式和元组格式查询结果构造记录对象的速度（每秒构造的记录数）
+
+使用内存中构造的 t_ds_task_definition 和 t_ds_process_definition 表记录，不需要连接数据库，只比较构造记录对象的耗时：
+- 字典格式：为每条记录构造字典，调用 from_t_ds_*_record 按字段名读取
+- 元组格式：根据字段名生成一次构造函数，按位置读取元组中的值
+"""
+
+import datetime
+import time
+from typing import Callable, Dict, List, Tuple
+
+from dolphin_sdk.objects import DSProcessDefinitionRecord
+from dolphin_sdk.objects import DSTaskDefinitionRecord
+
+__all__ = [
+    "benchmark_row_decoder"
+]
+
+_TASK_PARAMS = '{"rawScript": "echo 1", "localParams": [], "resourceList": []}'
+
+
+def _build_task_definition_rows(row_count: int) -> Tuple[List[str], List[tuple]]:
+    """构造 t_ds_task_definition 表的模拟记录"""
+    column_list = [
+        "id", "code", "name", "version", "description", "project_code", "user_id", "task_type", "task_execute_type",
+        "task_params", "flag", "task_priority", "worker_group", "environment_code", "fail_retry_times",
+        "fail_retry_interval", "timeout_flag", "timeout_notify_strategy", "timeout", "delay_time", "resource_ids",
+        "task_group_id", "task_group_priority", "cpu_quota", "memory_max", "create_time", "update_time"
+    ]
+    now = datetime.datetime(2024, 1, 1)
+    row_list = [(i, 10000 + i, f"task_{i}", 1, "", 1, 1, "SHELL", 0, _TASK_PARAMS, 1, 2, "default", -1, 0, 1, 0, 0, 0,
+                 0, "", 0, 0, -1, -1, now, now)
+                for i in range(row_count)]
+    return column_list, row_list
+
+
+def _build_process_definition_rows(row_count: int) -> Tuple[List[str], List[tuple]]:
+    """构造 t_ds_process_definition 表的模拟记录"""
+    column_list = [
+        "id", "code", "name", "version", "description", "project_code", "release_state", "user_id", "global_params",
+        "flag", "locations", "warning_group_id", "timeout", "tenant_id", "execution_type", "create_time", "update_time"
+    ]
+    now = datetime.datetime(2024, 1, 1)
+    row_list = [(i, 10000 + i, f"process_{i}", 1, "", 1, 1, 1, "[]", 1, "[]", 0, 0, -1, 0, now, now)
+                for i in range(row_count)]
+    return column_list, row_list
+
+
+def _measure(function: Callable[[], object], row_count: int, repeat: int) -> float:
+    """返回 repeat 次执行中最快一次的每秒记录数"""
+    best_time = None
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        function()
+        use_time = time.perf_counter() - start_time
+        if best_time is None or use_time < best_time:
+            best_time = use_time
+    return row_count / best_time
+
+
+def benchmark_row_decoder(row_count: int = 100000, repeat: int = 3) -> Dict[str, Dict[str, float]]:
+    """返回每张表使用字典格式和元组格式构造记录对象的每秒记录数，并打印对比结果
+
+    字典格式的耗时包含将元组转换为字典的耗时（与 DictCursor 为每条记录构造字典对应）。
+
+    Parameters
+    ----------
+    row_count : int, default = 100000
+        每张表的模拟记录数
+    repeat : int, default = 3
+        重复次数，取最快的一次
+    """
+    result = {}
+
+    column_list, row_list = _build_task_definition_rows(row_count)
+
+    def task_dict_path():
+        return [DSTaskDefinitionRecord.from_t_ds_task_definition_record(dict(zip(column_list, row)))
+                for row in row_list]
+
+    def task_tuple_path():
+        decoder = DSTaskDefinitionRecord.compile_row_decoder(column_list)
+        return [decoder(row) for row in row_list]
+
+    if task_dict_path() != task_tuple_path():
+        raise ValueError("t_ds_task_definition 表的两种构造方式结果不一致")
+    result["t_ds_task_definition"] = {
+        "dict": _measure(task_dict_path, row_count, repeat),
+        "tuple": _measure(task_tuple_path, row_count, repeat)
+    }
+
+    column_list, row_list = _build_process_definition_rows(row_count)
+
+    def process_dict_path():
+        return [DSProcessDefinitionRecord.from_t_ds_process_definition_record(dict(zip(column_list, row)))
+                for row in row_list]
+
+    def process_tuple_path():
+        decoder = DSProcessDefinitionRecord.compile_row_decoder(column_list)
+        return [decoder(row) for row in row_list]
+
+    if process_dict_path() != process_tuple_path():
+        raise ValueError("t_ds_process_definition 表的两种构造方式结果不一致")
+    result["t_ds_process_definition"] = {
+        "dict": _measure(process_dict_path, row_count, repeat),
+        "tuple": _measure(process_tuple_path, row_count, repeat)
+    }
+
+    for table_name, speed_dict in result.items():
+        print(f"{table_name}: 字典格式 {speed_dict['dict']:.0f} 行/秒，元组格式 {speed_dict['tuple']:.0f} 行/秒，"
+              f"提升 {speed_dict['tuple'] / speed_dict['dict']:.2f} 倍")
+    return result
+
+
+if __name__ == "__main__":
+    benchmark_row_decoder()
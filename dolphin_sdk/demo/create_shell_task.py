@@ -1,6 +1,4 @@
-from dolphin_sdk.form import DSProcessTaskRelationForm
-from dolphin_sdk.form import PostProcessDefinitionForm
-from dolphin_sdk.objects import DSLocation, DSTaskDefinitionParamsShell, DSTaskDefinitionRecordShell
+from dolphin_sdk.form import build_process_form_with_one_shell_task
 from dolphin_sdk.web_sdk import DolphinWebSdk
 
 
@@ -18,38 +16,15 @@ def create_process_with_one_shell_task(sdk: DolphinWebSdk,
     task_code_list = sdk.get_task_definition_gen_task_codes(project_code=project_code, gen_num=1)
     task_code = task_code_list[0]
 
-    # 构造任务定义
-    task_definition = DSTaskDefinitionRecordShell(
+    form_data = build_process_form_with_one_shell_task(
         project_code=project_code,
         task_code=task_code,
-        name=task_name,
-        environment_code=environment_code,
-        task_params=DSTaskDefinitionParamsShell(
-            raw_script=shell_script
-        ),
+        task_name=task_name,
+        process_name=process_name,
         worker_group=worker_group,
-        fail_retry_times=3,
-        fail_retry_interval=10
-    )
-
-    # 构造任务关联定义
-    task_relation = DSProcessTaskRelationForm(
-        post_task_code=task_code
-    )
-
-    # 构造任务位置
-    location = DSLocation(
-        task_code=task_code,
-        x=100.0,
-        y=100.0
-    )
-
-    form_data = PostProcessDefinitionForm(
-        task_definition_json=[task_definition],
-        task_relation_json=[task_relation],
-        locations=[location],
-        name=process_name,
-        description=process_description
+        environment_code=environment_code,
+        shell_script=shell_script,
+        process_description=process_description
     )
 
     if sdk.get_process_definition_verify_name(project_code, process_name) is False:
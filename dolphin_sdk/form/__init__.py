@@ -2,3 +2,4 @@ from dolphin_sdk.form.post_process_definition import PostProcessDefinitionForm
 from dolphin_sdk.form.post_schedules import DSPostSchedulesForm
 from dolphin_sdk.form.process_task_relation_form import DSProcessTaskRelationForm
 from dolphin_sdk.form.start_process_instance import DSStartProcessInstanceForm
+from dolphin_sdk.form.shell_process_form import build_process_form_with_one_shell_task
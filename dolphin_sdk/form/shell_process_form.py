@@ -0,0 +1,58 @@
+"""
+构造仅包含一个 Shell 任务的工作流的表单
+"""
+
+from dolphin_sdk.form.post_process_definition import PostProcessDefinitionForm
+from dolphin_sdk.form.process_task_relation_form import DSProcessTaskRelationForm
+from dolphin_sdk.objects import DSLocation
+from dolphin_sdk.objects import DSTaskDefinitionParamsShell
+from dolphin_sdk.objects import DSTaskDefinitionRecordShell
+
+__all__ = [
+    "build_process_form_with_one_shell_task"
+]
+
+
+def build_process_form_with_one_shell_task(project_code: int,
+                                           task_code: int,
+                                           task_name: str,
+                                           process_name: str,
+                                           worker_group: str,
+                                           environment_code: int,
+                                           shell_script: str,
+                                           process_description: str = "") -> PostProcessDefinitionForm:
+    """构造仅包含一个 Shell 任务的工作流的表单（task_code 需提前通过 gen-task-codes 接口获取）"""
+
+    # 构造任务定义
+    task_definition = DSTaskDefinitionRecordShell(
+        project_code=project_code,
+        task_code=task_code,
+        name=task_name,
+        environment_code=environment_code,
+        task_params=DSTaskDefinitionParamsShell(
+            raw_script=shell_script
+        ),
+        worker_group=worker_group,
+        fail_retry_times=3,
+        fail_retry_interval=10
+    )
+
+    # 构造任务关联定义
+    task_relation = DSProcessTaskRelationForm(
+        post_task_code=task_code
+    )
+
+    # 构造任务位置
+    location = DSLocation(
+        task_code=task_code,
+        x=100.0,
+        y=100.0
+    )
+
+    return PostProcessDefinitionForm(
+        task_definition_json=[task_definition],
+        task_relation_json=[task_relation],
+        locations=[location],
+        name=process_name,
+        description=process_description
+    )
@@ -61,6 +61,9 @@ class DSStartProcessInstanceForm:
     # 补跑调度时间
     schedule_time: DSComplementTimeRange = dataclasses.field(kw_only=True)
 
+    # 命令类型：启动工作流（默认） & 补数（COMPLEMENT_DATA）
+    exec_type: str = dataclasses.field(kw_only=True, default="START_PROCESS")
+
     @staticmethod
     def create_as_default(process_code: int, worker_group: str) -> "DSStartProcessInstanceForm":
         """根据默认值创建"""
@@ -76,7 +79,7 @@ class DSStartProcessInstanceForm:
             "failureStrategy": self.failure_strategy.web_value,
             "warningType": self.warning_type.web_value,
             "warningGroupId": str(self.warning_group_id) if self.warning_group_id is not None else "",
-            "execType": "START_PROCESS",
+            "execType": self.exec_type,
             "startNodeList": "",
             "taskDependType": "TASK_POST",
             "complementDependentMode": self.complement_dependent_mode.web_value,
@@ -0,0 +1,20 @@
+from dolphin_sdk.meta.dependency_graph import DSDependencyGraph
+from dolphin_sdk.meta.dependency_graph import DSDependentTaskEdge
+from dolphin_sdk.meta.dependency_graph import DEPENDENT_ITEM_COLUMN_LIST
+from dolphin_sdk.meta.dependency_graph import extract_dependent_item_list
+from dolphin_sdk.meta.dependency_graph import extract_upstream_process_set
+from dolphin_sdk.meta.projection import DSFields
+from dolphin_sdk.meta.projection import PROJECTION_FULL
+from dolphin_sdk.meta.projection import PROJECTION_KEYS
+from dolphin_sdk.meta.projection import PROJECTION_SUMMARY
+from dolphin_sdk.meta.projection import get_select_column_list
+from dolphin_sdk.meta.projection import get_select_list_sql
+from dolphin_sdk.meta.batch_query import DSBatchSizeController
+from dolphin_sdk.meta.batch_query import execute_in_batches
+from dolphin_sdk.meta.sharded_scan import scan_shards
+from dolphin_sdk.meta.sharded_scan import split_id_range
+from dolphin_sdk.meta.query_filter import DSQueryFilter
+from dolphin_sdk.meta.query_filter import bind_sql
+from dolphin_sdk.meta.query_filter import IN_LIST_ARITY_LIST
+from dolphin_sdk.meta.query_filter import get_in_list_arity
+from dolphin_sdk.meta.query_filter import in_list_placeholder
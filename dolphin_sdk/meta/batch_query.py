@@ -0,0 +1,157 @@
+"""
+IN 列表查询的分批执行
+
+将编号列表切分为多个批次，在有界线程池中并发执行，并按批次顺序合并结果。批次大小可以根据观察到的查询耗时自适应调整，并且总是受
+max_allowed_packet 允许的 IN 列表长度限制。
+"""
+
+import concurrent.futures
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence, TypeVar
+
+__all__ = [
+    "DSBatchSizeController",
+    "execute_in_batches"
+]
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class DSBatchSizeController:
+    """批次大小控制器（线程安全，可以在多次查询之间复用以保留学习到的批次大小）
+
+    未提供 target_latency 时批次大小固定。提供 target_latency 时，每完成一个批次，根据该批次的耗时更新单个编号平均耗时的指数加权移动
+    平均，并将批次大小调整为 target_latency 内能完成的编号数量；每次调整不超过 2 倍，且不超出 [min_batch_size, max_batch_size]。
+    """
+
+    def __init__(self, batch_size: int = 100,
+                 target_latency: Optional[float] = None,
+                 min_batch_size: int = 10,
+                 max_batch_size: int = 5000,
+                 max_allowed_packet: int = 4 * 1024 * 1024,
+                 item_bytes: int = 24,
+                 smoothing: float = 0.3,
+                 allowed_size_list: Optional[Sequence[int]] = None):
+        """
+
+        Parameters
+        ----------
+        batch_size : int, default = 100
+            初始批次大小（未提供 target_latency 时为固定的批次大小）
+        target_latency : Optional[float], default = None
+            每个批次的目标耗时（秒），为 None 时不自适应调整
+        min_batch_size : int, default = 10
+            自适应调整的下界
+        max_batch_size : int, default = 5000
+            自适应调整的上界
+        max_allowed_packet : int, default = 4 * 1024 * 1024
+            MySQL 的 max_allowed_packet（字节），SQL 语句的长度不能超过该值
+        item_bytes : int, default = 24
+            IN 列表中每个编号占用的字节数（BIGINT 编号加引号、逗号和空格不超过 24 字节）
+        smoothing : float, default = 0.3
+            单个编号平均耗时的指数加权移动平均系数
+        allowed_size_list : Optional[Sequence[int]], default = None
+            允许的批次大小；提供时实际使用的批次大小向下取整到其中的值（不小于其中的最小值），使批次与 IN 列表长度对齐
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size 必须为正整数: {batch_size}")
+
+        # 为 SQL 语句中 IN 列表以外的部分预留 1KB
+        self._packet_batch_size = max(1, (max_allowed_packet - 1024) // item_bytes)
+        self._target_latency = target_latency
+        self._min_batch_size = max(1, min(min_batch_size, self._packet_batch_size))
+        self._max_batch_size = max(self._min_batch_size, min(max_batch_size, self._packet_batch_size))
+        self._smoothing = smoothing
+        self._allowed_size_list = sorted(allowed_size_list) if allowed_size_list else None
+
+        self._lock = threading.Lock()
+        self._batch_size = min(batch_size, self._packet_batch_size)
+        self._item_latency: Optional[float] = None
+
+    @property
+    def adaptive(self) -> bool:
+        return self._target_latency is not None
+
+    @property
+    def batch_size(self) -> int:
+        if self._allowed_size_list is None:
+            return self._batch_size
+        result = self._allowed_size_list[0]
+        for size in self._allowed_size_list:
+            if size <= self._batch_size:
+                result = size
+        return result
+
+    def observe(self, item_count: int, latency: float) -> None:
+        """记录一个批次的编号数量和耗时（秒），自适应模式下调整批次大小"""
+        if self._target_latency is None or item_count <= 0:
+            return
+        with self._lock:
+            item_latency = latency / item_count
+            if self._item_latency is None:
+                self._item_latency = item_latency
+            else:
+                self._item_latency += self._smoothing * (item_latency - self._item_latency)
+            if self._item_latency <= 0:
+                expected_size = self._max_batch_size
+            else:
+                expected_size = int(self._target_latency / self._item_latency)
+            expected_size = max(self._batch_size // 2, min(self._batch_size * 2, expected_size))
+            self._batch_size = max(self._min_batch_size, min(self._max_batch_size, expected_size))
+
+
+def execute_in_batches(item_list: Sequence[T],
+                       query: Callable[[Sequence[T]], List[R]],
+                       controller: DSBatchSizeController,
+                       parallelism: int = 1) -> List[R]:
+    """将 item_list 切分为多个批次执行 query，按批次顺序合并并返回结果
+
+    第一个批次总是在当前线程中执行，用于初始化连接池并为自适应批次大小提供第一个耗时样本；其余批次在最多 parallelism 个线程中并发
+    执行，每个批次在提交时根据当前的批次大小切分。query 会在多个线程中同时调用，每次调用应从连接池中获取独立的连接。
+
+    Parameters
+    ----------
+    item_list : Sequence[T]
+        需要查询的编号列表
+    query : Callable[[Sequence[T]], List[R]]
+        查询一个批次的函数
+    controller : DSBatchSizeController
+        批次大小控制器
+    parallelism : int, default = 1
+        同时执行的批次数量上限，为 1 时在当前线程中依次执行
+    """
+    if not item_list:
+        return []
+
+    def run(chunk: Sequence[T]) -> List[R]:
+        start_time = time.monotonic()
+        rows = query(chunk)
+        controller.observe(len(chunk), time.monotonic() - start_time)
+        return rows
+
+    chunk = item_list[:controller.batch_size]
+    result_dict: Dict[int, List[R]] = {0: run(chunk)}
+    position = len(chunk)
+
+    if parallelism <= 1:
+        while position < len(item_list):
+            chunk = item_list[position: position + controller.batch_size]
+            result_dict[len(result_dict)] = run(chunk)
+            position += len(chunk)
+    else:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=parallelism) as executor:
+            future_dict: Dict[concurrent.futures.Future, int] = {}
+            index = 1
+            while position < len(item_list) or future_dict:
+                while position < len(item_list) and len(future_dict) < parallelism:
+                    chunk = item_list[position: position + controller.batch_size]
+                    future_dict[executor.submit(run, chunk)] = index
+                    index += 1
+                    position += len(chunk)
+                done_set, _ = concurrent.futures.wait(future_dict, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done_set:
+                    result_dict[future_dict.pop(future)] = future.result()
+
+    return [row for index in sorted(result_dict) for row in result_dict[index]]
@@ -0,0 +1,267 @@
+"""
+工作流之间的依赖关系图
+
+依赖关系由 DEPENDENT 类型任务的 task_params 中的 dependItemList 定义：每个依赖项（projectCode, definitionCode）都是所属工作流的一个
+上游工作流。依赖关系图保存以任务为单位的边表，并按工作流聚合为上游和下游两个邻接表，可以在一次遍历中求出多个起点的传递闭包；边表
+可以按任务增量更新，两个邻接表随之原地修改。
+"""
+
+import dataclasses
+import datetime
+import json
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from dolphin_sdk.objects import DSProcessDefinition
+
+__all__ = [
+    "DSDependentTaskEdge",
+    "DSDependencyGraph",
+    "DEPENDENT_ITEM_COLUMN_LIST",
+    "extract_dependent_item_list",
+    "extract_upstream_process_set"
+]
+
+# extract_dependent_item_list 返回的每个依赖项中各个值的名称
+DEPENDENT_ITEM_COLUMN_LIST = ["depend_relation", "depend_task_index", "depend_task_relation", "upstream_project_code",
+                              "upstream_process_code", "dep_task_code", "cycle", "date_value"]
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class DSDependentTaskEdge:
+    """一个 DEPENDENT 类型任务定义的所有依赖边"""
+
+    # 任务编号
+    task_code: int = dataclasses.field(kw_only=True)
+
+    # 任务所属的工作流
+    process: DSProcessDefinition = dataclasses.field(kw_only=True)
+
+    # 任务依赖的上游工作流
+    upstream_set: FrozenSet[DSProcessDefinition] = dataclasses.field(kw_only=True)
+
+
+def extract_upstream_process_set(task_params: str) -> FrozenSet[DSProcessDefinition]:
+    """从 DEPENDENT 类型任务的 task_params 字段中提取依赖的上游工作流（只读取依赖项中的项目编号和工作流编号）"""
+    dependence = json.loads(task_params).get("dependence") or {}
+    result = set()
+    for depend_task in dependence.get("dependTaskList") or []:
+        for depend_item in depend_task.get("dependItemList") or []:
+            project_code = depend_item.get("projectCode")
+            process_code = depend_item.get("definitionCode")
+            if project_code is not None and process_code is not None:
+                result.add(DSProcessDefinition(project_code=project_code, process_code=process_code))
+    return frozenset(result)
+
+
+def extract_dependent_item_list(task_params: str) -> List[Tuple[Any, ...]]:
+    """将 DEPENDENT 类型任务的 task_params 字段中的依赖项展开为元组的列表（每个依赖项一个元组，元组中的值依次对应
+    DEPENDENT_ITEM_COLUMN_LIST；只读取依赖项所需的字段，不构造任务参数对象）"""
+    dependence = json.loads(task_params).get("dependence") or {}
+    depend_relation = dependence.get("relation")
+    result = []
+    for depend_task_index, depend_task in enumerate(dependence.get("dependTaskList") or []):
+        depend_task_relation = depend_task.get("relation")
+        for depend_item in depend_task.get("dependItemList") or []:
+            result.append((depend_relation, depend_task_index, depend_task_relation, depend_item.get("projectCode"),
+                           depend_item.get("definitionCode"), depend_item.get("depTaskCode"),
+                           depend_item.get("cycle"), depend_item.get("dateValue")))
+    return result
+
+
+class DSDependencyGraph:
+    """工作流之间的依赖关系图（增量更新与查询不能在多个线程中同时进行）"""
+
+    def __init__(self, edge_list: Iterable[DSDependentTaskEdge],
+                 watermark: Optional[datetime.datetime] = None):
+        """
+
+        Parameters
+        ----------
+        edge_list : Iterable[DSDependentTaskEdge]
+            所有 DEPENDENT 类型任务的依赖边
+        watermark : Optional[datetime.datetime], default = None
+            构造依赖边时读取到的最大更新时间，用于增量更新
+        """
+        self._watermark = watermark
+
+        # 任务编号到该任务的依赖边的映射；任务属于多个工作流时，每个工作流各有一条依赖边
+        self._edge_dict: Dict[int, Dict[DSProcessDefinition, DSDependentTaskEdge]] = {}
+
+        # 工作流到上游工作流的映射；值为上游工作流到边数量的映射（同一工作流中的多个任务可能依赖同一个上游工作流）
+        self._upstream_dict: Dict[DSProcessDefinition, Dict[DSProcessDefinition, int]] = {}
+
+        # 上游工作流到直接依赖它的下游工作流的映射（反向索引）；值为下游工作流到边数量的映射
+        self._downstream_dict: Dict[DSProcessDefinition, Dict[DSProcessDefinition, int]] = {}
+
+        for edge in edge_list:
+            self._add_edge(edge)
+
+    @property
+    def task_count(self) -> int:
+        """依赖关系图中 DEPENDENT 类型任务的数量"""
+        return len(self._edge_dict)
+
+    @property
+    def edge_list(self) -> List[DSDependentTaskEdge]:
+        return [edge for process_edge_dict in self._edge_dict.values() for edge in process_edge_dict.values()]
+
+    @property
+    def task_code_set(self) -> Set[int]:
+        """依赖关系图中所有 DEPENDENT 类型任务的编号"""
+        return set(self._edge_dict)
+
+    @property
+    def watermark(self) -> Optional[datetime.datetime]:
+        return self._watermark
+
+    def get_upstream_set(self, process: DSProcessDefinition) -> Set[DSProcessDefinition]:
+        """返回工作流直接依赖的上游工作流"""
+        return set(self._upstream_dict.get(process, ()))
+
+    def get_upstream_dict(self, process_list: Iterable[DSProcessDefinition]
+                          ) -> Dict[DSProcessDefinition, Set[DSProcessDefinition]]:
+        """返回每个工作流直接依赖的上游工作流"""
+        return {process: self.get_upstream_set(process) for process in process_list}
+
+    def get_upstream_level_list(self, start_list: Iterable[DSProcessDefinition],
+                                max_depth: Optional[int] = None) -> List[List[DSProcessDefinition]]:
+        """从多个起点同时向上游遍历，返回每一层首次到达的工作流
+
+        第 0 层为起点本身，第 k 层为最短依赖路径长度为 k 的上游工作流。
+
+        Parameters
+        ----------
+        start_list : Iterable[DSProcessDefinition]
+            起点工作流
+        max_depth : Optional[int], default = None
+            最大遍历深度，为 None 时不限制
+        """
+        return self._bfs(start_list, self._upstream_dict, max_depth)
+
+    def get_upstream_closure(self, start_list: Iterable[DSProcessDefinition],
+                             max_depth: Optional[int] = None,
+                             include: bool = True) -> Set[DSProcessDefinition]:
+        """返回多个起点直接或间接依赖的所有上游工作流
+
+        Parameters
+        ----------
+        start_list : Iterable[DSProcessDefinition]
+            起点工作流
+        max_depth : Optional[int], default = None
+            最大遍历深度，为 None 时不限制
+        include : bool, default = True
+            结果中是否包含起点工作流
+        """
+        level_list = self.get_upstream_level_list(start_list, max_depth)
+        return {process for level in (level_list if include else level_list[1:]) for process in level}
+
+    def get_downstream_set(self, process: DSProcessDefinition) -> Set[DSProcessDefinition]:
+        """返回直接依赖该工作流的下游工作流"""
+        return set(self._downstream_dict.get(process, ()))
+
+    def get_downstream_level_list(self, start_list: Iterable[DSProcessDefinition],
+                                  max_depth: Optional[int] = None) -> List[List[DSProcessDefinition]]:
+        """从多个起点同时向下游遍历，返回每一层首次到达的工作流（第 0 层为起点本身）
+
+        Parameters
+        ----------
+        start_list : Iterable[DSProcessDefinition]
+            起点工作流
+        max_depth : Optional[int], default = None
+            最大遍历深度，为 None 时不限制
+        """
+        return self._bfs(start_list, self._downstream_dict, max_depth)
+
+    def get_downstream_closure(self, start_list: Iterable[DSProcessDefinition],
+                               max_depth: Optional[int] = None,
+                               include: bool = True) -> Set[DSProcessDefinition]:
+        """返回直接或间接依赖多个起点的所有下游工作流（即起点失败时的影响范围）
+
+        Parameters
+        ----------
+        start_list : Iterable[DSProcessDefinition]
+            起点工作流
+        max_depth : Optional[int], default = None
+            最大遍历深度，为 None 时不限制
+        include : bool, default = True
+            结果中是否包含起点工作流
+        """
+        level_list = self.get_downstream_level_list(start_list, max_depth)
+        return {process for level in (level_list if include else level_list[1:]) for process in level}
+
+    def apply_changes(self, upsert_edge_list: Iterable[DSDependentTaskEdge],
+                      remove_task_code_set: Iterable[int],
+                      watermark: Optional[datetime.datetime]) -> None:
+        """增量更新依赖关系图：删除 remove_task_code_set 中的任务，替换或新增 upsert_edge_list 中的任务依赖边，并更新水位线
+
+        upsert_edge_list 中出现的任务，其原有的所有依赖边（包括在其他工作流中的依赖边）被替换为 upsert_edge_list 中该任务的依赖边，
+        因此任务属于多个工作流时，需要同时提供该任务在每个工作流中的依赖边。
+        """
+        upsert_edge_list = list(upsert_edge_list)
+        for task_code in set(remove_task_code_set) | {edge.task_code for edge in upsert_edge_list}:
+            self._remove_task(task_code)
+        for edge in upsert_edge_list:
+            self._add_edge(edge)
+        if watermark is not None and (self._watermark is None or watermark > self._watermark):
+            self._watermark = watermark
+
+    def _add_edge(self, edge: DSDependentTaskEdge) -> None:
+        """添加依赖边（同一任务在同一工作流中已有依赖边时替换）"""
+        process_edge_dict = self._edge_dict.setdefault(edge.task_code, {})
+        old_edge = process_edge_dict.get(edge.process)
+        if old_edge is not None:
+            self._unlink_edge(old_edge)
+        process_edge_dict[edge.process] = edge
+        upstream_count_dict = self._upstream_dict.setdefault(edge.process, {})
+        for upstream in edge.upstream_set:
+            upstream_count_dict[upstream] = upstream_count_dict.get(upstream, 0) + 1
+            downstream_count_dict = self._downstream_dict.setdefault(upstream, {})
+            downstream_count_dict[edge.process] = downstream_count_dict.get(edge.process, 0) + 1
+
+    def _remove_task(self, task_code: int) -> None:
+        """删除任务在所有工作流中的依赖边"""
+        process_edge_dict = self._edge_dict.pop(task_code, None)
+        if process_edge_dict is None:
+            return
+        for edge in process_edge_dict.values():
+            self._unlink_edge(edge)
+
+    def _unlink_edge(self, edge: DSDependentTaskEdge) -> None:
+        """从两个邻接表中减去依赖边的计数"""
+        for upstream in edge.upstream_set:
+            self._decrease(self._upstream_dict, edge.process, upstream)
+            self._decrease(self._downstream_dict, upstream, edge.process)
+
+    @staticmethod
+    def _decrease(adjacency_dict: Dict[DSProcessDefinition, Dict[DSProcessDefinition, int]],
+                  source: DSProcessDefinition, target: DSProcessDefinition) -> None:
+        """将邻接表中 source -> target 的边数量减 1，减为 0 时删除"""
+        count_dict = adjacency_dict[source]
+        count = count_dict[target] - 1
+        if count > 0:
+            count_dict[target] = count
+            return
+        del count_dict[target]
+        if not count_dict:
+            del adjacency_dict[source]
+
+    @staticmethod
+    def _bfs(start_list: Iterable[DSProcessDefinition],
+             adjacency_dict: Dict[DSProcessDefinition, Dict[DSProcessDefinition, int]],
+             max_depth: Optional[int]) -> List[List[DSProcessDefinition]]:
+        """按层广度优先遍历"""
+        level = list(dict.fromkeys(start_list))
+        visited = set(level)
+        level_list = [level]
+        while level and (max_depth is None or len(level_list) <= max_depth):
+            next_level = []
+            for process in level:
+                for neighbor in adjacency_dict.get(process, ()):
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        next_level.append(neighbor)
+            if not next_level:
+                break
+            level_list.append(next_level)
+            level = next_level
+        return level_list
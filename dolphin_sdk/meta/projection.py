@@ -0,0 +1,94 @@
+"""
+元数据查询的字段投影
+
+查询方法的 fields 参数可以是投影名称（keys / summary / full），也可以是字段名称的集合。查询时只选择这些字段，其余字段在记录对象中为
+UNLOADED。task_params、locations 等大字段只在 full 投影中选择。
+"""
+
+from typing import Dict, Iterable, List, Union
+
+__all__ = [
+    "PROJECTION_KEYS",
+    "PROJECTION_SUMMARY",
+    "PROJECTION_FULL",
+    "DSFields",
+    "get_select_column_list",
+    "get_select_list_sql"
+]
+
+# 只包含主键、编号、版本和更新时间
+PROJECTION_KEYS = "keys"
+
+# 包含除大字段（任务参数、任务位置、全局参数）以外的所有字段
+PROJECTION_SUMMARY = "summary"
+
+# 包含所有字段（SELECT *）
+PROJECTION_FULL = "full"
+
+DSFields = Union[str, Iterable[str]]
+
+_TASK_DEFINITION_COLUMN_LIST = [
+    "id", "code", "name", "version", "description", "project_code", "user_id", "task_type", "task_execute_type",
+    "task_params", "flag", "task_priority", "worker_group", "environment_code", "fail_retry_times",
+    "fail_retry_interval", "timeout_flag", "timeout_notify_strategy", "timeout", "delay_time", "resource_ids",
+    "task_group_id", "task_group_priority", "cpu_quota", "memory_max", "create_time", "update_time"
+]
+
+_PROCESS_DEFINITION_COLUMN_LIST = [
+    "id", "code", "name", "version", "description", "project_code", "release_state", "user_id", "global_params",
+    "flag", "locations", "warning_group_id", "timeout", "tenant_id", "execution_type", "create_time", "update_time"
+]
+
+# 表名 -> （所有字段，构造记录对象必须的字段，投影名称 -> 字段）
+_TABLE_PROJECTION_DICT: Dict[str, tuple] = {
+    "t_ds_task_definition": (
+        _TASK_DEFINITION_COLUMN_LIST,
+        ["id", "code", "project_code", "task_type"],
+        {
+            PROJECTION_KEYS: ["id", "code", "project_code", "task_type", "version", "update_time"],
+            PROJECTION_SUMMARY: [column for column in _TASK_DEFINITION_COLUMN_LIST if column != "task_params"],
+        }
+    ),
+    "t_ds_process_definition": (
+        _PROCESS_DEFINITION_COLUMN_LIST,
+        ["id", "code", "project_code"],
+        {
+            PROJECTION_KEYS: ["id", "code", "project_code", "version", "update_time"],
+            PROJECTION_SUMMARY: [column for column in _PROCESS_DEFINITION_COLUMN_LIST
+                                 if column not in {"locations", "global_params"}],
+        }
+    ),
+}
+
+
+def get_select_column_list(table_name: str, fields: DSFields) -> List[str]:
+    """返回投影需要选择的字段（总是包含构造记录对象必须的字段）
+
+    Parameters
+    ----------
+    table_name : str
+        表名
+    fields : DSFields
+        投影名称或字段名称的集合
+    """
+    column_list, required_column_list, profile_dict = _TABLE_PROJECTION_DICT[table_name]
+    if isinstance(fields, str):
+        if fields == PROJECTION_FULL:
+            return list(column_list)
+        if fields not in profile_dict:
+            raise KeyError(f"未知的投影名称: {fields}")
+        return list(profile_dict[fields])
+
+    field_set = set(fields)
+    unknown_field_set = field_set - set(column_list)
+    if unknown_field_set:
+        raise KeyError(f"{table_name} 表中不存在字段: {sorted(unknown_field_set)}")
+    return [column for column in column_list if column in field_set or column in required_column_list]
+
+
+def get_select_list_sql(table_name: str, fields: DSFields, table_alias: str = "") -> str:
+    """返回投影的 SELECT 字段列表（full 投影返回 *）"""
+    prefix = f"{table_alias}." if table_alias else ""
+    if isinstance(fields, str) and fields == PROJECTION_FULL:
+        return f"{prefix}*"
+    return ", ".join(f"{prefix}`{column}`" for column in get_select_column_list(table_name, fields))
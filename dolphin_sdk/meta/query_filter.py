@@ -0,0 +1,114 @@
+"""
+元数据查询的过滤条件下推
+
+过滤条件转换为 WHERE 子句在 MySQL 中执行，只有满足条件的记录才会返回。条件中的值使用 %s 占位符，并使用 PyMySQL 的转义规则绑定
+（与 PyMySQL 客户端绑定参数的方式相同），而不是直接拼接到 SQL 语句中。
+
+IN 列表的长度只使用 IN_LIST_ARITY_LIST 中的几种取值，不足时重复最后一个值补齐，使同一个查询只产生少数几种 SQL 语句文本，便于语句
+缓存和按语句摘要统计。
+"""
+
+import enum
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+import pymysql.converters
+
+__all__ = [
+    "IN_LIST_ARITY_LIST",
+    "DSQueryFilter",
+    "bind_sql",
+    "get_in_list_arity",
+    "in_list_placeholder"
+]
+
+# IN 列表允许的长度（升序）
+IN_LIST_ARITY_LIST = (1, 10, 50, 100, 500, 1000, 5000)
+
+
+def get_in_list_arity(count: int) -> int:
+    """返回不小于 count 的最小 IN 列表长度（超过最大长度时为最大长度的整数倍）"""
+    for arity in IN_LIST_ARITY_LIST:
+        if arity >= count:
+            return arity
+    max_arity = IN_LIST_ARITY_LIST[-1]
+    return (count + max_arity - 1) // max_arity * max_arity
+
+
+def in_list_placeholder(value_list: Sequence[Any]) -> Tuple[str, List[Any]]:
+    """返回 IN 列表的占位符（如 "(%s, %s)"）和补齐后的参数列表（value_list 不能为空）"""
+    if not value_list:
+        raise ValueError("IN 列表不能为空")
+    arity = get_in_list_arity(len(value_list))
+    args = list(value_list) + [value_list[-1]] * (arity - len(value_list))
+    return "(" + ", ".join(["%s"] * arity) + ")", args
+
+
+def bind_sql(sql: str, args: Sequence[Any]) -> str:
+    """将参数绑定到 SQL 语句中的 %s 占位符（枚举值转换为数据库中存储的值）"""
+    return sql % tuple(pymysql.converters.escape_item(_to_db_value(arg), "utf8mb4") for arg in args)
+
+
+def _to_db_value(value: Any) -> Any:
+    if isinstance(value, enum.Enum) and hasattr(value, "db_value"):
+        return value.db_value
+    return value
+
+
+class DSQueryFilter:
+    """由多个 AND 关系的条件组成的过滤条件；值为 None 的条件会被忽略"""
+
+    def __init__(self):
+        self._condition_list: List[str] = []
+        self._args: List[Any] = []
+
+    def __bool__(self) -> bool:
+        return bool(self._condition_list)
+
+    @property
+    def condition_list(self) -> List[str]:
+        """使用 %s 占位符的条件列表"""
+        return list(self._condition_list)
+
+    @property
+    def args(self) -> List[Any]:
+        """与占位符对应的参数列表"""
+        return list(self._args)
+
+    def equal(self, column: str, value: Optional[Any]) -> "DSQueryFilter":
+        """添加 column = value 条件"""
+        if value is not None:
+            self._condition_list.append(f"`{column}` = %s")
+            self._args.append(value)
+        return self
+
+    def greater_equal(self, column: str, value: Optional[Any]) -> "DSQueryFilter":
+        """添加 column >= value 条件"""
+        if value is not None:
+            self._condition_list.append(f"`{column}` >= %s")
+            self._args.append(value)
+        return self
+
+    def is_in(self, column: str, value_list: Optional[Iterable[Any]]) -> "DSQueryFilter":
+        """添加 column IN (...) 条件（value_list 为空时不匹配任何记录）"""
+        if value_list is None:
+            return self
+        value_list = list(dict.fromkeys(value_list))
+        if not value_list:
+            self._condition_list.append("1 = 0")
+            return self
+        placeholder, args = in_list_placeholder([_to_db_value(value) for value in value_list])
+        self._condition_list.append(f"`{column}` IN {placeholder}")
+        self._args.extend(args)
+        return self
+
+    def to_condition(self, keyword: str = "WHERE") -> Tuple[str, List[Any]]:
+        """返回使用 %s 占位符的条件子句和参数列表（没有条件时返回空字符串和空列表）"""
+        if not self._condition_list:
+            return "", []
+        return f" {keyword} " + " AND ".join(self._condition_list), [_to_db_value(arg) for arg in self._args]
+
+    def to_sql(self, keyword: str = "WHERE") -> str:
+        """返回绑定参数后的条件子句（keyword 为 AND 时构造追加到已有 WHERE 子句之后的条件；没有条件时返回空字符串）"""
+        if not self._condition_list:
+            return ""
+        return bind_sql(f" {keyword} " + " AND ".join(self._condition_list), self._args)
@@ -0,0 +1,127 @@
+"""
+按主键范围分片的并行全表扫描
+
+根据主键的最小值和最大值将表切分为多个左闭右开的主键范围，每个分片使用独立的连接按主键翻页读取，多个分片并发执行。每个分片的结果
+写入有界队列，队列写满时分片线程阻塞等待（背压），因此内存占用与表的大小无关。
+"""
+
+import concurrent.futures
+import queue
+import threading
+from typing import Callable, Generator, Iterable, List, Optional, Tuple, TypeVar
+
+__all__ = [
+    "split_id_range",
+    "scan_shards"
+]
+
+R = TypeVar("R")
+
+# 分片结束的标记
+_SHARD_END = object()
+
+
+class _ShardError:
+    """分片线程中抛出的异常"""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def split_id_range(min_id: Optional[int], max_id: Optional[int], shard_count: int) -> List[Tuple[int, int]]:
+    """将主键范围 [min_id, max_id] 均匀切分为不超过 shard_count 个左闭右开的范围（表为空时返回空列表）"""
+    if min_id is None or max_id is None:
+        return []
+    shard_count = max(1, min(shard_count, max_id - min_id + 1))
+    step = (max_id - min_id + 1) / shard_count
+    boundary_list = [min_id + int(step * i) for i in range(shard_count)] + [max_id + 1]
+    return [(boundary_list[i], boundary_list[i + 1]) for i in range(shard_count)]
+
+
+def scan_shards(range_list: List[Tuple[int, int]],
+                scan: Callable[[int, int], Iterable[R]],
+                parallelism: int,
+                ordered: bool = True,
+                queue_size: int = 8,
+                chunk_size: int = 1000) -> Generator[R, None, None]:
+    """并发扫描多个主键范围，返回所有记录
+
+    Parameters
+    ----------
+    range_list : List[Tuple[int, int]]
+        按主键升序排列的左闭右开主键范围
+    scan : Callable[[int, int], Iterable[R]]
+        扫描一个主键范围的函数（在分片线程中调用，应按主键升序返回记录，并使用独立的连接）
+    parallelism : int
+        同时扫描的分片数量
+    ordered : bool, default = True
+        为 True 时按主键顺序返回记录（依次消费每个分片的队列，后续分片在队列写满后等待）；为 False 时按到达顺序返回记录
+    queue_size : int, default = 8
+        每个队列最多缓存的记录块数量
+    chunk_size : int, default = 1000
+        每个记录块包含的记录数量
+    """
+    if not range_list:
+        return
+
+    stop_event = threading.Event()
+    if ordered is True:
+        queue_list = [queue.Queue(maxsize=queue_size) for _ in range_list]
+    else:
+        queue_list = [queue.Queue(maxsize=queue_size)] * len(range_list)
+
+    def put(target: queue.Queue, item) -> bool:
+        """写入队列；消费者已停止时返回 False"""
+        while not stop_event.is_set():
+            try:
+                target.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def run(index: int) -> None:
+        target = queue_list[index]
+        start_id, end_id = range_list[index]
+        try:
+            chunk = []
+            for record in scan(start_id, end_id):
+                chunk.append(record)
+                if len(chunk) >= chunk_size:
+                    if not put(target, chunk):
+                        return
+                    chunk = []
+            if chunk and not put(target, chunk):
+                return
+            put(target, _SHARD_END)
+        except BaseException as e:
+            put(target, _ShardError(e))
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max(1, parallelism))
+    try:
+        # 分片按主键顺序提交，有序模式下正在消费的分片总是已经开始执行
+        for index in range(len(range_list)):
+            executor.submit(run, index)
+
+        if ordered is True:
+            for target in queue_list:
+                yield from _drain(target, 1)
+        else:
+            yield from _drain(queue_list[0], len(range_list))
+    finally:
+        stop_event.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _drain(source: queue.Queue, shard_count: int) -> Generator:
+    """读取队列中的记录块，直至收到 shard_count 个分片结束标记"""
+    while shard_count > 0:
+        item = source.get()
+        if item is _SHARD_END:
+            shard_count -= 1
+        elif isinstance(item, _ShardError):
+            raise item.error
+        else:
+            yield from item
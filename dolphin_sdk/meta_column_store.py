@@ -0,0 +1,316 @@
+"""
+按列存储的任务定义集合，用于统计分析
+
+每个整数字段（包括枚举字段在数据库中存储的值）保存为一个 NumPy 数组，worker_group、task_type 等取值较少的字符串字段使用字典编码
+（每行保存字符串在字典中的序号）。过滤和分组统计在数组上向量化执行，只在需要时将指定行转换为 DSTaskDefinitionRecord 对象。
+task_params、name、description 等字段不在列存储中保存，需要时可以使用 to_task_definition_list 的结果重新查询。
+
+NumPy 为可选依赖，仅在使用列存储时需要。
+"""
+
+import array
+import enum
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from dolphin_sdk.meta_sdk import DolphinMetaSdk
+from dolphin_sdk.objects import DSTaskDefinition
+from dolphin_sdk.objects import DSTaskDefinitionRecord
+from dolphin_sdk.objects import DSTaskDefinitionRecordUnknown
+from dolphin_sdk.objects import is_loaded
+
+try:
+    import numpy as np
+except ImportError:  # numpy 为可选依赖，仅在使用列存储时需要
+    np = None
+
+__all__ = [
+    "NULL_INT",
+    "DSTaskColumnStore"
+]
+
+# 整数字段为 None 时保存的值
+NULL_INT = -(2 ** 63)
+
+# 整数字段：记录对象的属性名 -> t_ds_task_definition 表的字段名
+_INT_COLUMN_DICT = {
+    "id": "id",
+    "task_code": "code",
+    "project_code": "project_code",
+    "version": "version",
+    "user_id": "user_id",
+    "environment_code": "environment_code",
+    "fail_retry_times": "fail_retry_times",
+    "fail_retry_interval": "fail_retry_interval",
+    "timeout": "timeout",
+    "delay_time": "delay_time",
+    "cpu_quota": "cpu_quota",
+    "memory_max": "memory_max",
+}
+
+# 枚举字段（保存数据库中存储的值）
+_ENUM_COLUMN_LIST = ["task_execute_type", "flag", "task_priority", "timeout_flag"]
+
+# 字典编码的字符串字段
+_STRING_COLUMN_LIST = ["task_type", "worker_group"]
+
+# 构造列存储时需要从 t_ds_task_definition 表读取的字段
+_SELECT_COLUMN_LIST = list(_INT_COLUMN_DICT.values()) + _ENUM_COLUMN_LIST + _STRING_COLUMN_LIST
+
+
+class DSTaskColumnStore:
+    """按列存储的任务定义集合
+
+    除 process_code 外，列名与 DSTaskDefinitionRecord 的属性名相同；process_code 为任务所属的工作流编号（构造时提供映射才有值）。
+    整数字段和枚举字段为 int64 数组，值为 None 时保存为 NULL_INT；字符串字段为 int32 的字典序号数组，值为 None 时序号为 -1（未注册
+    类型的任务的 task_type 列保存数据库中的原始值，因此可以按各个未注册类型分别统计）。
+    """
+
+    INT_COLUMN_LIST = list(_INT_COLUMN_DICT) + ["process_code"]
+    ENUM_COLUMN_LIST = list(_ENUM_COLUMN_LIST)
+    STRING_COLUMN_LIST = list(_STRING_COLUMN_LIST)
+
+    def __init__(self, int_column_dict: Dict[str, "np.ndarray"],
+                 string_code_dict: Dict[str, "np.ndarray"],
+                 string_value_dict: Dict[str, List[str]]):
+        """
+
+        Parameters
+        ----------
+        int_column_dict : Dict[str, np.ndarray]
+            整数字段和枚举字段名到 int64 数组的映射
+        string_code_dict : Dict[str, np.ndarray]
+            字符串字段名到字典序号数组的映射
+        string_value_dict : Dict[str, List[str]]
+            字符串字段名到字典（序号 -> 字符串）的映射
+        """
+        if np is None:
+            raise ImportError("DSTaskColumnStore 依赖 numpy，请先安装：pip install numpy")
+        self._int_column_dict = int_column_dict
+        self._string_code_dict = string_code_dict
+        self._string_value_dict = string_value_dict
+        self._string_index_dict = {column: {value: i for i, value in enumerate(value_list)}
+                                   for column, value_list in string_value_dict.items()}
+
+    @staticmethod
+    def from_records(record_iter: Iterable[DSTaskDefinitionRecord]) -> "DSTaskColumnStore":
+        """根据任务定义记录构造列存储（逐条读取，不保留记录对象；记录中需要包含列存储的所有字段）"""
+        if np is None:
+            raise ImportError("DSTaskColumnStore 依赖 numpy，请先安装：pip install numpy")
+        int_buffer_dict = {column: array.array("q")
+                           for column in DSTaskColumnStore.INT_COLUMN_LIST + _ENUM_COLUMN_LIST}
+        string_buffer_dict = {column: array.array("i") for column in _STRING_COLUMN_LIST}
+        string_index_dict: Dict[str, Dict[str, int]] = {column: {} for column in _STRING_COLUMN_LIST}
+
+        for record in record_iter:
+            for column in _INT_COLUMN_DICT:
+                int_buffer_dict[column].append(_to_int(record, column))
+            int_buffer_dict["process_code"].append(NULL_INT if record.process_code is None else record.process_code)
+            for column in _ENUM_COLUMN_LIST:
+                int_buffer_dict[column].append(_to_int(record, column))
+            for column in _STRING_COLUMN_LIST:
+                if column == "task_type" and isinstance(record, DSTaskDefinitionRecordUnknown):
+                    value = record.raw_task_type
+                else:
+                    value = getattr(record, column)
+                if not is_loaded(value):
+                    raise ValueError(f"记录中没有读取 {column} 字段，无法构造列存储")
+                if isinstance(value, enum.Enum):
+                    value = value.db_value
+                if value is None:
+                    string_buffer_dict[column].append(-1)
+                    continue
+                index_dict = string_index_dict[column]
+                if value not in index_dict:
+                    index_dict[value] = len(index_dict)
+                string_buffer_dict[column].append(index_dict[value])
+
+        return DSTaskColumnStore(
+            int_column_dict={column: np.frombuffer(buffer, dtype=np.int64).copy()
+                             for column, buffer in int_buffer_dict.items()},
+            string_code_dict={column: np.frombuffer(buffer, dtype=np.int32).copy()
+                              for column, buffer in string_buffer_dict.items()},
+            string_value_dict={column: list(index_dict) for column, index_dict in string_index_dict.items()}
+        )
+
+    @staticmethod
+    def from_meta_sdk(meta_sdk: DolphinMetaSdk,
+                      task_code_to_process_code_hash: Optional[Dict[int, int]] = None,
+                      **kwargs) -> "DSTaskColumnStore":
+        """扫描 t_ds_task_definition 表构造列存储（只读取列存储需要的字段，不读取 task_params）
+
+        Parameters
+        ----------
+        meta_sdk : DolphinMetaSdk
+            海豚调度元数据 SDK
+        task_code_to_process_code_hash : Optional[Dict[int, int]], default = None
+            任务编号到工作流编号的映射，用于填充 process_code 列；为 None 时 process_code 列均为 NULL_INT
+        **kwargs
+            传给 get_all_task_definition_detail_list 的其他参数（如 parallelism、project_code_list、update_time_from）
+        """
+        return DSTaskColumnStore.from_records(meta_sdk.get_all_task_definition_detail_list(
+            task_code_to_process_code_hash=task_code_to_process_code_hash,
+            fields=_SELECT_COLUMN_LIST,
+            **kwargs
+        ))
+
+    def __len__(self) -> int:
+        return len(self._int_column_dict["id"])
+
+    # ------------------------------ 读取列 ------------------------------
+
+    def get_column(self, column: str) -> "np.ndarray":
+        """返回列的数组：整数字段和枚举字段返回 int64 数组，字符串字段返回解码后的 object 数组（None 解码为 None）"""
+        if column in self._int_column_dict:
+            return self._int_column_dict[column]
+        if column in self._string_code_dict:
+            return self._decode_string_column(column, self._string_code_dict[column])
+        raise KeyError(f"列存储中不存在字段: {column}")
+
+    def get_string_codes(self, column: str) -> "np.ndarray":
+        """返回字符串字段的字典序号数组"""
+        if column not in self._string_code_dict:
+            raise KeyError(f"{column} 不是字典编码的字符串字段")
+        return self._string_code_dict[column]
+
+    def get_string_values(self, column: str) -> List[str]:
+        """返回字符串字段的字典（序号 -> 字符串）"""
+        if column not in self._string_value_dict:
+            raise KeyError(f"{column} 不是字典编码的字符串字段")
+        return list(self._string_value_dict[column])
+
+    # ------------------------------ 过滤 ------------------------------
+
+    def mask(self, **conditions: Any) -> "np.ndarray":
+        """返回满足所有条件的行的布尔数组
+
+        每个条件的键为列名，值为单个值或值的列表（满足其中之一即可）；枚举值会转换为数据库中存储的值，None 匹配空值。例如：
+        ``store.mask(task_type="SPARK", cpu_quota=-1)``。
+        """
+        result = np.ones(len(self), dtype=bool)
+        for column, value in conditions.items():
+            value_list = list(value) if isinstance(value, (list, tuple, set, frozenset)) else [value]
+            if column in self._int_column_dict:
+                array_value = self._int_column_dict[column]
+                target_list = [_to_db_int(item) for item in value_list]
+            elif column in self._string_code_dict:
+                array_value = self._string_code_dict[column]
+                index_dict = self._string_index_dict[column]
+                target_list = [-1 if item is None else index_dict.get(_to_db_value(item)) for item in value_list]
+                target_list = [target for target in target_list if target is not None]
+            else:
+                raise KeyError(f"列存储中不存在字段: {column}")
+            result &= np.isin(array_value, target_list)
+        return result
+
+    def filter(self, mask: "np.ndarray") -> "DSTaskColumnStore":
+        """返回只包含指定行的列存储（mask 为布尔数组或行号数组；字符串字段的字典保持不变）"""
+        return DSTaskColumnStore(
+            int_column_dict={column: value[mask] for column, value in self._int_column_dict.items()},
+            string_code_dict={column: value[mask] for column, value in self._string_code_dict.items()},
+            string_value_dict=self._string_value_dict
+        )
+
+    # ------------------------------ 分组统计 ------------------------------
+
+    def count_by(self, column: str) -> Dict[Any, int]:
+        """返回列中每个取值的行数（空值的键为 None）"""
+        if column in self._string_code_dict:
+            codes = self._string_code_dict[column]
+            count_array = np.bincount(codes + 1, minlength=len(self._string_value_dict[column]) + 1)
+            result = {value: int(count_array[i + 1])
+                      for i, value in enumerate(self._string_value_dict[column]) if count_array[i + 1] > 0}
+            if count_array[0] > 0:
+                result[None] = int(count_array[0])
+            return result
+        value_array, count_array = np.unique(self._get_int_column(column), return_counts=True)
+        return {_from_db_int(value): int(count) for value, count in zip(value_array.tolist(), count_array.tolist())}
+
+    def sum_by(self, column: str, value_column: str) -> Dict[Any, int]:
+        """按 column 分组，返回每组 value_column 之和（value_column 必须为整数字段，空值不计入）"""
+        value_array = self._get_int_column(value_column)
+        valid = value_array != NULL_INT
+        if column in self._string_code_dict:
+            key_list = [None] + self._string_value_dict[column]
+            inverse = self._string_code_dict[column][valid] + 1  # 空值的序号 -1 对应 key_list 中的 None
+        else:
+            key_array, inverse = np.unique(self._get_int_column(column)[valid], return_inverse=True)
+            key_list = [_from_db_int(key) for key in key_array.tolist()]
+        sum_array = np.zeros(len(key_list), dtype=np.int64)
+        np.add.at(sum_array, inverse, value_array[valid])  # 使用 int64 累加，避免浮点数权重的精度损失
+        count_array = np.bincount(inverse, minlength=len(key_list))
+        return {key_list[i]: int(sum_array[i]) for i in range(len(key_list)) if count_array[i] > 0}
+
+    # ------------------------------ 转换为记录 ------------------------------
+
+    def to_task_definition_list(self, mask: Optional["np.ndarray"] = None) -> List[DSTaskDefinition]:
+        """返回指定行（mask 为 None 时为所有行）的任务定义，可以用于查询完整的任务定义详情"""
+        project_code_array = self._int_column_dict["project_code"]
+        task_code_array = self._int_column_dict["task_code"]
+        process_code_array = self._int_column_dict["process_code"]
+        if mask is not None:
+            project_code_array, task_code_array, process_code_array = (
+                project_code_array[mask], task_code_array[mask], process_code_array[mask])
+        return [DSTaskDefinition(project_code=project_code, task_code=task_code,
+                                 process_code=_from_db_int(process_code))
+                for project_code, task_code, process_code in zip(project_code_array.tolist(),
+                                                                 task_code_array.tolist(),
+                                                                 process_code_array.tolist())]
+
+    def to_records(self, mask: Optional["np.ndarray"] = None) -> List[DSTaskDefinitionRecord]:
+        """将指定行（mask 为 None 时为所有行）转换为任务定义记录（列存储中没有的字段为 UNLOADED）"""
+        column_list = _SELECT_COLUMN_LIST
+        array_list = ([self._int_column_dict[column] for column in _INT_COLUMN_DICT]
+                      + [self._int_column_dict[column] for column in _ENUM_COLUMN_LIST]
+                      + [self._decode_string_column(column, self._string_code_dict[column])
+                         for column in _STRING_COLUMN_LIST])
+        process_code_array = self._int_column_dict["process_code"]
+        if mask is not None:
+            array_list = [value[mask] for value in array_list]
+            process_code_array = process_code_array[mask]
+
+        # 记录在构造列存储时已经计入过未注册任务类型的统计，重新构造时不再计数
+        decoder = DSTaskDefinitionRecord.compile_row_decoder(column_list, count_unknown=False)
+        value_list_list = [value.tolist() for value in array_list]
+        int_column_count = len(_INT_COLUMN_DICT) + len(_ENUM_COLUMN_LIST)
+        result = []
+        for row, process_code in zip(zip(*value_list_list), process_code_array.tolist()):
+            row = tuple(_from_db_int(value) for value in row[:int_column_count]) + row[int_column_count:]
+            result.append(decoder(row, _from_db_int(process_code)))
+        return result
+
+    def memory_bytes(self) -> int:
+        """返回列存储中数组占用的字节数（不包括字典）"""
+        return (sum(value.nbytes for value in self._int_column_dict.values())
+                + sum(value.nbytes for value in self._string_code_dict.values()))
+
+    def _get_int_column(self, column: str) -> "np.ndarray":
+        if column not in self._int_column_dict:
+            raise KeyError(f"{column} 不是整数字段或枚举字段")
+        return self._int_column_dict[column]
+
+    def _decode_string_column(self, column: str, codes: "np.ndarray") -> "np.ndarray":
+        value_array = np.array(self._string_value_dict[column] + [None], dtype=object)
+        return value_array[codes]  # 序号 -1 对应末尾的 None
+
+
+def _to_int(record: DSTaskDefinitionRecord, column: str) -> int:
+    value = getattr(record, column)
+    if not is_loaded(value):
+        raise ValueError(f"记录中没有读取 {column} 字段，无法构造列存储")
+    return _to_db_int(value)
+
+
+def _to_db_value(value: Any) -> Any:
+    if isinstance(value, enum.Enum) and hasattr(value, "db_value"):
+        return value.db_value
+    return value
+
+
+def _to_db_int(value: Union[int, enum.Enum, None]) -> int:
+    value = _to_db_value(value)
+    return NULL_INT if value is None else int(value)
+
+
+def _from_db_int(value: int) -> Optional[int]:
+    return None if value == NULL_INT else value
+
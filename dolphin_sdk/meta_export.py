@@ -0,0 +1,292 @@
+"""
+将海豚调度元数据按列导出为 Parquet 或 Arrow IPC 文件
+
+每张 t_ds_* 表导出为一个文件，DEPENDENT 类型任务的依赖项展开为每个依赖项一行，导出为 dependent_item 文件。记录按主键翻页读取，
+以元组格式每 batch_size 行构造一个 RecordBatch 写入文件，不构造记录对象，也不将整张表读入内存，内存占用与表的大小无关。各字段的类型
+根据 information_schema 中的 MySQL 数据类型确定，不依赖第一批记录中的取值（第一批记录中某个字段全部为 NULL 时也能得到正确的类型）。
+
+PyArrow 为可选依赖，仅在导出时需要。
+"""
+
+import dataclasses
+import datetime
+import os
+import time
+from typing import Iterable, List, Optional, Tuple
+
+from dolphin_sdk.meta_sdk import DolphinMetaSdk
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow 为可选依赖，仅在导出时需要
+    pa = None
+    pq = None
+
+__all__ = [
+    "EXPORT_TABLE_LIST",
+    "DEPENDENT_ITEM_TABLE_NAME",
+    "DSMetaExportTableStats",
+    "DSMetaExportStats",
+    "DSMetaExporter"
+]
+
+# 支持导出的元数据表
+EXPORT_TABLE_LIST = ["t_ds_project", "t_ds_process_definition", "t_ds_process_task_relation", "t_ds_task_definition",
+                     "t_ds_schedules"]
+
+# DEPENDENT 类型任务的依赖项导出的文件名（不含扩展名）
+DEPENDENT_ITEM_TABLE_NAME = "dependent_item"
+
+# 支持的文件格式 -> 文件扩展名
+_FILE_FORMAT_DICT = {
+    "parquet": ".parquet",
+    "arrow": ".arrow"
+}
+
+# MySQL 数据类型 -> Arrow 类型的名称（未列出的类型按字符串导出）
+_MYSQL_TYPE_DICT = {
+    "tinyint": "int64",
+    "smallint": "int64",
+    "mediumint": "int64",
+    "int": "int64",
+    "integer": "int64",
+    "bigint": "int64",
+    "float": "float64",
+    "double": "float64",
+    "date": "date32",
+    "datetime": "timestamp",
+    "timestamp": "timestamp",
+    "time": "duration",
+    "bit": "binary",
+    "binary": "binary",
+    "varbinary": "binary",
+    "tinyblob": "binary",
+    "blob": "binary",
+    "mediumblob": "binary",
+    "longblob": "binary",
+}
+
+# 依赖项文件中各字段的 Arrow 类型的名称
+_DEPENDENT_ITEM_TYPE_DICT = {
+    "task_code": "int64",
+    "project_code": "int64",
+    "process_code": "int64",
+    "depend_relation": "string",
+    "depend_task_index": "int64",
+    "depend_task_relation": "string",
+    "upstream_project_code": "int64",
+    "upstream_process_code": "int64",
+    "dep_task_code": "int64",
+    "cycle": "string",
+    "date_value": "string",
+    "update_time": "timestamp",
+}
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class DSMetaExportTableStats:
+    """一张表的导出结果"""
+
+    # 表名（依赖项为 DEPENDENT_ITEM_TABLE_NAME）
+    table_name: str = dataclasses.field(kw_only=True)
+
+    # 导出的文件路径
+    path: str = dataclasses.field(kw_only=True)
+
+    # 导出的记录数量
+    row_count: int = dataclasses.field(kw_only=True)
+
+    # 写入的 RecordBatch 数量
+    batch_count: int = dataclasses.field(kw_only=True)
+
+    # 文件大小（字节）
+    file_bytes: int = dataclasses.field(kw_only=True)
+
+    # 耗时（秒，包括读取和写入）
+    elapsed: float = dataclasses.field(kw_only=True)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.row_count / self.elapsed if self.elapsed > 0 else 0.0
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class DSMetaExportStats:
+    """一次导出的结果"""
+
+    # 各表的导出结果（按导出顺序）
+    table_stats_list: List[DSMetaExportTableStats] = dataclasses.field(kw_only=True)
+
+    # 总耗时（秒）
+    elapsed: float = dataclasses.field(kw_only=True)
+
+    @property
+    def row_count(self) -> int:
+        return sum(table_stats.row_count for table_stats in self.table_stats_list)
+
+    @property
+    def file_bytes(self) -> int:
+        return sum(table_stats.file_bytes for table_stats in self.table_stats_list)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.row_count / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        """返回每张表及合计的吞吐量摘要（每行一张表）"""
+        line_list = [_format_stats(table_stats.table_name, table_stats.row_count, table_stats.batch_count,
+                                   table_stats.file_bytes, table_stats.elapsed)
+                     for table_stats in self.table_stats_list]
+        line_list.append(_format_stats("合计", self.row_count,
+                                       sum(table_stats.batch_count for table_stats in self.table_stats_list),
+                                       self.file_bytes, self.elapsed))
+        return "\n".join(line_list)
+
+
+class DSMetaExporter:
+    """将海豚调度元数据按列导出为 Parquet 或 Arrow IPC 文件"""
+
+    def __init__(self, meta_sdk: DolphinMetaSdk, output_dir: str,
+                 file_format: str = "parquet",
+                 batch_size: int = 10000,
+                 update_time_from: Optional[datetime.datetime] = None,
+                 parallelism: Optional[int] = None,
+                 compression: Optional[str] = "zstd"):
+        """
+
+        Parameters
+        ----------
+        meta_sdk : DolphinMetaSdk
+            读取元数据的 SDK
+        output_dir : str
+            导出文件所在的目录（不存在时创建），每张表导出为 {table_name}.parquet 或 {table_name}.arrow
+        file_format : str, default = "parquet"
+            文件格式：parquet 或 arrow（Arrow IPC 文件格式）
+        batch_size : int, default = 10000
+            每个 RecordBatch 的记录数量（Parquet 文件中每个 RecordBatch 为一个行组），决定导出时的内存占用
+        update_time_from : Optional[datetime.datetime], default = None
+            只导出更新时间不早于该时间的记录（依赖项按任务定义的更新时间过滤）；为 None 时导出所有记录
+        parallelism : Optional[int], default = None
+            并行扫描的连接数量；为 None 时使用 meta_sdk 构造时提供的默认值
+        compression : Optional[str], default = "zstd"
+            压缩算法，为 None 时不压缩（Arrow IPC 文件只支持 lz4 和 zstd）
+        """
+        if pa is None:
+            raise ImportError("DSMetaExporter 依赖 pyarrow，请先安装：pip install pyarrow")
+        if file_format not in _FILE_FORMAT_DICT:
+            raise ValueError(f"不支持的文件格式: {file_format}（支持 {', '.join(_FILE_FORMAT_DICT)}）")
+        if batch_size < 1:
+            raise ValueError(f"batch_size 必须为正整数: {batch_size}")
+        self._meta_sdk = meta_sdk
+        self._output_dir = output_dir
+        self._file_format = file_format
+        self._batch_size = batch_size
+        self._update_time_from = update_time_from
+        self._parallelism = parallelism
+        self._compression = compression
+
+    def export_all(self, table_name_list: Optional[Iterable[str]] = None,
+                   include_dependent_item: bool = True,
+                   print_summary: bool = True) -> DSMetaExportStats:
+        """依次导出多张表及 DEPENDENT 类型任务的依赖项，返回导出结果
+
+        Parameters
+        ----------
+        table_name_list : Optional[Iterable[str]], default = None
+            需要导出的表；为 None 时导出 EXPORT_TABLE_LIST 中的所有表
+        include_dependent_item : bool, default = True
+            是否导出 DEPENDENT 类型任务的依赖项
+        print_summary : bool, default = True
+            是否打印每张表及合计的吞吐量摘要
+        """
+        if table_name_list is None:
+            table_name_list = EXPORT_TABLE_LIST
+        start_time = time.perf_counter()
+        table_stats_list = [self.export_table(table_name) for table_name in table_name_list]
+        if include_dependent_item:
+            table_stats_list.append(self.export_dependent_item())
+        stats = DSMetaExportStats(table_stats_list=table_stats_list, elapsed=time.perf_counter() - start_time)
+        if print_summary:
+            print(stats.summary())
+        return stats
+
+    def export_table(self, table_name: str) -> DSMetaExportTableStats:
+        """导出一张 t_ds_* 表的所有字段（table_name 必须在 EXPORT_TABLE_LIST 中）"""
+        if table_name not in EXPORT_TABLE_LIST:
+            raise KeyError(f"不支持导出的表: {table_name}")
+        column_type_list = self._meta_sdk.get_table_column_type_list(table_name)
+        if not column_type_list:
+            raise KeyError(f"表不存在或没有字段: {table_name}")
+        schema = pa.schema([(column_name, _to_arrow_type(_MYSQL_TYPE_DICT.get(data_type, "string")))
+                            for column_name, data_type in column_type_list])
+        row_iter = self._meta_sdk.get_all_row_list(table_name, schema.names,
+                                                   update_time_from=self._update_time_from,
+                                                   parallelism=self._parallelism)
+        return self._write(table_name, schema, row_iter)
+
+    def export_dependent_item(self) -> DSMetaExportTableStats:
+        """导出 DEPENDENT 类型任务的依赖项（每个依赖项一行，字段见 DolphinMetaSdk.DEPENDENT_ITEM_ROW_COLUMN_LIST）"""
+        schema = pa.schema([(column_name, _to_arrow_type(_DEPENDENT_ITEM_TYPE_DICT[column_name]))
+                            for column_name in DolphinMetaSdk.DEPENDENT_ITEM_ROW_COLUMN_LIST])
+        row_iter = self._meta_sdk.get_all_dependent_item_row_list(update_time_from=self._update_time_from,
+                                                                  parallelism=self._parallelism)
+        return self._write(DEPENDENT_ITEM_TABLE_NAME, schema, row_iter)
+
+    def _write(self, table_name: str, schema: "pa.Schema", row_iter: Iterable[tuple]) -> DSMetaExportTableStats:
+        """将 row_iter 中的记录每 batch_size 行构造一个 RecordBatch 写入文件；先写入临时文件，完成后再替换目标文件，避免导出中断时留下
+        不完整的文件"""
+        start_time = time.perf_counter()
+        os.makedirs(self._output_dir, exist_ok=True)
+        path = os.path.join(self._output_dir, table_name + _FILE_FORMAT_DICT[self._file_format])
+        temp_path = path + ".tmp"
+
+        row_count = 0
+        batch_count = 0
+        try:
+            with self._open_writer(temp_path, schema) as writer:
+                row_list: List[tuple] = []
+                for row in row_iter:
+                    row_list.append(row)
+                    if len(row_list) >= self._batch_size:
+                        writer.write_batch(_to_record_batch(schema, row_list))
+                        row_count += len(row_list)
+                        batch_count += 1
+                        row_list.clear()
+                if row_list:
+                    writer.write_batch(_to_record_batch(schema, row_list))
+                    row_count += len(row_list)
+                    batch_count += 1
+            os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        return DSMetaExportTableStats(table_name=table_name, path=path, row_count=row_count, batch_count=batch_count,
+                                      file_bytes=os.path.getsize(path), elapsed=time.perf_counter() - start_time)
+
+    def _open_writer(self, path: str, schema: "pa.Schema"):
+        if self._file_format == "parquet":
+            return pq.ParquetWriter(path, schema, compression=self._compression or "none")
+        return pa.ipc.new_file(path, schema, options=pa.ipc.IpcWriteOptions(compression=self._compression))
+
+
+def _to_arrow_type(type_name: str) -> "pa.DataType":
+    if type_name == "timestamp":
+        return pa.timestamp("us")
+    if type_name == "duration":
+        return pa.duration("us")
+    return pa.type_for_alias(type_name)
+
+
+def _to_record_batch(schema: "pa.Schema", row_list: List[tuple]) -> "pa.RecordBatch":
+    """将元组格式的记录按列转换为 RecordBatch"""
+    column_list: List[Tuple] = list(zip(*row_list))
+    return pa.RecordBatch.from_arrays([pa.array(column, type=field.type) for column, field in zip(column_list, schema)],
+                                      schema=schema)
+
+
+def _format_stats(name: str, row_count: int, batch_count: int, file_bytes: int, elapsed: float) -> str:
+    rows_per_second = row_count / elapsed if elapsed > 0 else 0.0
+    return (f"{name}: {row_count} 行，{batch_count} 批，{file_bytes / 1024 / 1024:.2f} MB，{elapsed:.2f} 秒，"
+            f"{rows_per_second:.0f} 行/秒")
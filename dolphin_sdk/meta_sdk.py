@@ -3,9 +3,30 @@
 """
 
 import collections
-from typing import Dict, Generator, List
+import datetime
+import itertools
+import threading
+from typing import Callable, Dict, Generator, Iterable, List, Optional, Sequence, Set, Tuple, TypeVar, Union
 
 import metasequoia_connector as ms_conn
+import pymysql.cursors
+from dolphin_sdk.meta import DEPENDENT_ITEM_COLUMN_LIST
+from dolphin_sdk.meta import DSBatchSizeController
+from dolphin_sdk.meta import DSDependencyGraph
+from dolphin_sdk.meta import DSDependentTaskEdge
+from dolphin_sdk.meta import DSQueryFilter
+from dolphin_sdk.meta import IN_LIST_ARITY_LIST
+from dolphin_sdk.meta import extract_upstream_process_set
+from dolphin_sdk.meta import DSFields
+from dolphin_sdk.meta import PROJECTION_FULL
+from dolphin_sdk.meta import execute_in_batches
+from dolphin_sdk.meta import extract_dependent_item_list
+from dolphin_sdk.meta import get_select_list_sql
+from dolphin_sdk.meta import in_list_placeholder
+from dolphin_sdk.meta import scan_shards
+from dolphin_sdk.meta import split_id_range
+from dolphin_sdk.objects import DSAvailableFlag
+from dolphin_sdk.objects import DSInternPool
 from dolphin_sdk.objects import DSProcessDefinition
 from dolphin_sdk.objects import DSProcessDefinitionRecord
 from dolphin_sdk.objects import DSProcessTaskRelationRecord
@@ -13,17 +34,22 @@ from dolphin_sdk.objects import DSProjectRecord
 from dolphin_sdk.objects import DSScheduleRecord
 from dolphin_sdk.objects import DSTaskDefinition
 from dolphin_sdk.objects import DSTaskDefinitionRecord
-from dolphin_sdk.objects import DSTaskDefinitionRecordDependent
+from dolphin_sdk.objects import DSTaskType
 
 __all__ = [
     "DolphinMetaSdk"
 ]
 
+R = TypeVar("R")
+
 
 class DolphinMetaSdk:
     """基于海豚调度元数据的 SDK"""
 
-    def __init__(self, manager: ms_conn.ConnectManager, mysql_name: str, db_name: str):
+    def __init__(self, manager: ms_conn.ConnectManager, mysql_name: str, db_name: str,
+                 parallelism: int = 1,
+                 batch_target_latency: Optional[float] = None,
+                 max_allowed_packet: int = 4 * 1024 * 1024):
         """
 
         Parameters
@@ -34,21 +60,50 @@ class DolphinMetaSdk:
             海豚调度元数据所在的 MySQL 实例名称
         db_name : str
             海豚调度元数据所在的数据库名称
+        parallelism : int, default = 1
+            IN 列表查询默认同时执行的批次数量（每个批次从连接池中获取独立的连接，建议连接池大小不小于该值）
+        batch_target_latency : Optional[float], default = None
+            IN 列表查询每个批次的目标耗时（秒）；提供时批次大小根据观察到的耗时自适应调整，为 None 时使用固定的批次大小
+        max_allowed_packet : int, default = 4 * 1024 * 1024
+            MySQL 的 max_allowed_packet（字节），用于限制 IN 列表查询的批次大小
         """
         self._manager = manager
         self._mysql_name = mysql_name
         self._db_name = db_name
+        self._parallelism = parallelism
+        self._batch_target_latency = batch_target_latency
+        self._max_allowed_packet = max_allowed_packet
+
+        # 查询名称到自适应批次大小控制器的映射（在多次查询之间保留学习到的批次大小）
+        self._batch_size_controller_dict: Dict[str, DSBatchSizeController] = {}
+        self._batch_size_controller_lock = threading.Lock()
 
     # ----------------------------------------------------------------------
     # ------------------------------ 项目级方法 ------------------------------
     # ----------------------------------------------------------------------
 
-    def get_all_project_list(self) -> List[DSProjectRecord]:
-        """返回海豚调度中所有项目的 DSProjectRecord 对象的列表"""
-        project_list = []
-        for query_row in self._select_all_as_dict("SELECT * FROM t_ds_project"):
-            project_list.append(DSProjectRecord.from_record_dict(query_row))
-        return project_list
+    def get_all_project_list(self, update_time_from: Optional[datetime.datetime] = None,
+                             intern_pool: Optional[DSInternPool] = None) -> List[DSProjectRecord]:
+        """返回海豚调度中所有项目的 DSProjectRecord 对象的列表
+
+        Parameters
+        ----------
+        update_time_from : Optional[datetime.datetime], default = None
+            只返回更新时间不早于该时间的项目；为 None 时返回所有项目
+        intern_pool : Optional[DSInternPool], default = None
+            字符串驻留池；提供时记录中取值较少的字符串字段会被驻留
+        """
+        condition, args = DSQueryFilter().greater_equal("update_time", update_time_from).to_condition()
+        column_list, row_list = self._select_all_as_tuple(f"SELECT * FROM t_ds_project{condition}", args)
+        decoder = DSProjectRecord.compile_row_decoder(column_list, intern_pool=intern_pool)
+        return [decoder(row) for row in row_list]
+
+    def get_tenant_code_dict(self) -> Dict[int, str]:
+        """返回 t_ds_tenant 表中租户 ID 到租户编码的映射（包括表示默认租户的 -1 -> "default"）"""
+        _, row_list = self._select_all_as_tuple("SELECT `id`, `tenant_code` FROM t_ds_tenant")
+        result = {-1: "default"}
+        result.update(row_list)
+        return result
 
     # ----------------------------------------------------------------------
     # ----------------------------- 工作流级方法 -----------------------------
@@ -56,16 +111,18 @@ class DolphinMetaSdk:
 
     def get_process_definition_by_id(self, row_id: int) -> DSProcessDefinition:
         """根据 t_ds_process_definition 表主键 row_id 构造工作流定义对象"""
-        sql = f"SELECT project_code, code FROM t_ds_process_definition WHERE id = '{row_id}'"
-        query_row = self._select_one_as_dict(sql)
+        query_row = self._select_one_as_dict("SELECT project_code, code FROM t_ds_process_definition WHERE id = %s",
+                                             [int(row_id)])
         return DSProcessDefinition(project_code=query_row["project_code"], process_code=query_row["code"])
 
     def get_depend_process_definition_list_by_process_definition_list(
             self,
             process_definition_list: List[DSProcessDefinition],
-            include: bool = True
+            include: bool = True,
+            max_depth: Optional[int] = None,
+            dependency_graph: Optional[DSDependencyGraph] = None
     ) -> List[DSProcessDefinition]:
-        """根据工作流定义的列表，获取其依赖的上游工作流定义的列表
+        """根据工作流定义的列表，获取其直接或间接依赖的上游工作流定义的列表
 
         Parameters
         ----------
@@ -73,161 +130,535 @@ class DolphinMetaSdk:
             工作流定义的列表
         include : bool, default = True
             返回列表中是否包含当前工作流定义
+        max_depth : Optional[int], default = None
+            最大遍历深度，为 None 时不限制
+        dependency_graph : Optional[DSDependencyGraph], default = None
+            已构造的依赖关系图；为 None 时重新构造
+        """
+        if dependency_graph is None:
+            dependency_graph = self.get_dependency_graph()
+        return list(dependency_graph.get_upstream_closure(process_definition_list, max_depth=max_depth,
+                                                          include=include))
+
+    def get_downstream_process_definition_list_by_process_definition_list(
+            self,
+            process_definition_list: List[DSProcessDefinition],
+            include: bool = True,
+            max_depth: Optional[int] = None,
+            dependency_graph: Optional[DSDependencyGraph] = None
+    ) -> List[DSProcessDefinition]:
+        """根据工作流定义的列表，获取直接或间接依赖它们的下游工作流定义的列表
+
+        Parameters
+        ----------
+        process_definition_list : List[DSProcessDefinition]
+            工作流定义的列表
+        include : bool, default = True
+            返回列表中是否包含当前工作流定义
+        max_depth : Optional[int], default = None
+            最大遍历深度，为 None 时不限制
+        dependency_graph : Optional[DSDependencyGraph], default = None
+            已构造的依赖关系图；为 None 时重新构造（需要多次查询时，应构造一次依赖关系图并通过 refresh_dependency_graph 增量更新）
+        """
+        if dependency_graph is None:
+            dependency_graph = self.get_dependency_graph()
+        return list(dependency_graph.get_downstream_closure(process_definition_list, max_depth=max_depth,
+                                                            include=include))
+
+    def get_upstream_process_dict_by_process_definition_list(
+            self,
+            process_definition_list: List[DSProcessDefinition]
+    ) -> Dict[DSProcessDefinition, Set[DSProcessDefinition]]:
+        """根据工作流定义的列表，获取每个工作流通过 DEPENDENT 任务直接依赖的上游工作流定义的集合"""
+        dependency_graph = DSDependencyGraph(self.get_dependent_task_edge_list(process_definition_list))
+        return dependency_graph.get_upstream_dict(process_definition_list)
+
+    def get_dependency_graph(self) -> DSDependencyGraph:
+        """读取所有 DEPENDENT 类型任务，构造工作流之间的依赖关系图（只需一次查询，可以复用于多次遍历）"""
+        query_row_list = self._select_all_as_dict(self._dependent_task_edge_sql())
+        return DSDependencyGraph(
+            [self._to_dependent_task_edge(query_row) for query_row in query_row_list],
+            watermark=max((query_row["update_time"] for query_row in query_row_list), default=None)
+        )
+
+    def refresh_dependency_graph(self, dependency_graph: DSDependencyGraph, batch_size: int = 500) -> None:
+        """增量更新依赖关系图（依赖关系图没有水位线时重新读取所有依赖边）
+
+        1. 只读取编号查找发生变化的 DEPENDENT 类型任务：任务定义或任务关系的更新时间不早于水位线（与水位线相等的记录也会被重新读取，
+           避免遗漏同一秒内的更新）；水位线条件在任务关系的分组之前过滤，不需要对整张任务关系表分组
+        2. 分批重新读取发生变化的任务在所有工作流中的依赖边，替换依赖关系图中这些任务的依赖边（已不属于任何工作流的任务被删除）
+        3. 读取所有 DEPENDENT 类型任务的编号（只读取任务定义表的 code 字段），删除已被删除或不再是 DEPENDENT 类型的任务
+
+        Parameters
+        ----------
+        dependency_graph : DSDependencyGraph
+            需要更新的依赖关系图
+        batch_size : int, default = 500
+            每次重新读取依赖边的任务数量
+        """
+        watermark = dependency_graph.watermark
+        if watermark is None:
+            query_row_list = self._select_all_as_dict(self._dependent_task_edge_sql())
+            dependency_graph.apply_changes(
+                upsert_edge_list=[self._to_dependent_task_edge(query_row) for query_row in query_row_list],
+                remove_task_code_set=dependency_graph.task_code_set,
+                watermark=max((query_row["update_time"] for query_row in query_row_list), default=None)
+            )
+            return
+
+        _, task_row_list = self._select_all_as_tuple(
+            "SELECT `code`, `update_time` FROM t_ds_task_definition "
+            "WHERE `task_type` = 'DEPENDENT' AND `update_time` >= %s",
+            [watermark]
+        )
+        _, relation_row_list = self._select_all_as_tuple(
+            "SELECT r.`post_task_code`, MAX(r.`update_time`) AS `update_time` "
+            "FROM t_ds_process_task_relation AS r "
+            "JOIN t_ds_task_definition AS t ON t.`code` = r.`post_task_code` "
+            "WHERE r.`update_time` >= %s AND t.`task_type` = 'DEPENDENT' "
+            "GROUP BY r.`post_task_code`",
+            [watermark]
+        )
+        changed_task_code_set = {task_code for task_code, _ in task_row_list + relation_row_list}
+        new_watermark = max((update_time for _, update_time in task_row_list + relation_row_list), default=None)
+
+        query_row_list = []
+        changed_task_code_list = sorted(changed_task_code_set)
+        for i in range(0, len(changed_task_code_list), batch_size):
+            placeholder, args = in_list_placeholder(changed_task_code_list[i: i + batch_size])
+            query_row_list.extend(self._select_all_as_dict(
+                self._dependent_task_edge_sql(relation_condition=f" WHERE `post_task_code` IN {placeholder}",
+                                              task_condition=f" AND t.`code` IN {placeholder}"),
+                args + args
+            ))
+
+        _, code_row_list = self._select_all_as_tuple(
+            "SELECT `code` FROM t_ds_task_definition WHERE `task_type` = 'DEPENDENT'")
+        task_code_set = {code for code, in code_row_list}
+
+        dependency_graph.apply_changes(
+            upsert_edge_list=[self._to_dependent_task_edge(query_row) for query_row in query_row_list],
+            remove_task_code_set=(dependency_graph.task_code_set - task_code_set) | changed_task_code_set,
+            watermark=new_watermark
+        )
+
+    def get_dependent_task_edge_list(
+            self,
+            process_definition_list: Optional[List[DSProcessDefinition]] = None,
+            batch_size: int = 100
+    ) -> List[DSDependentTaskEdge]:
+        """获取 DEPENDENT 类型任务的依赖边（只查询 DEPENDENT 类型任务，且只查询构造依赖边所需的字段）
+
+        Parameters
+        ----------
+        process_definition_list : Optional[List[DSProcessDefinition]], default = None
+            只获取这些工作流中的 DEPENDENT 类型任务；为 None 时获取所有 DEPENDENT 类型任务
+        batch_size : int, default = 100
+            每次查询的工作流数量
         """
-        visited = set(process_definition_list)
-        queue = list(process_definition_list)
-        while queue:
-            new_queue = []
-
-            # 按项目分析工作流
-            for project_code, grouped_process_definition_list in self._grouped_process_by_project(queue).items():
-
-                # 获取工作流定义的列表，获取其中包含的任务定义的列表（任务定义中包含工作流编号）
-                task_definition_list = self.get_task_definition_list_by_process_definition_list(
-                    process_definition_list=grouped_process_definition_list
-                )
-
-                # 根据任务定义的列表，获取任务定义的详细信息的列表
-                task_definition_detail_list = self.get_task_definition_detail_list_by_task_definition_list(
-                    task_definition_list=task_definition_list
-                )
-
-                # 遍历所有 task_params 字段，并将其中依赖的上游任务添加到新队列中
-                for task_definition in task_definition_detail_list:
-                    if not isinstance(task_definition, DSTaskDefinitionRecordDependent):
-                        continue
-                    for depend_task in task_definition.task_params.dependence.depend_task_list:
-                        for depend_item in depend_task.depend_item_list:
-                            dependence_process = DSProcessDefinition(
-                                project_code=depend_item.project_code,
-                                process_code=depend_item.definition_code
-                            )
-                            if dependence_process not in visited:
-                                visited.add(dependence_process)
-                                new_queue.append(dependence_process)
-            queue = new_queue
-
-        if include is False:
-            visited -= set(process_definition_list)
-
-        return list(visited)
+        if process_definition_list is None:
+            query_row_list = self._select_all_as_dict(self._dependent_task_edge_sql())
+        else:
+            query_row_list = []
+            for i in range(0, len(process_definition_list), batch_size):
+                placeholder, args = in_list_placeholder(
+                    [process.process_code for process in process_definition_list[i: i + batch_size]])
+                sql = self._dependent_task_edge_sql(
+                    relation_condition=f" WHERE `process_definition_code` IN {placeholder}")
+                query_row_list.extend(self._select_all_as_dict(sql, args))
+        return [self._to_dependent_task_edge(query_row) for query_row in query_row_list]
+
+    @staticmethod
+    def _dependent_task_edge_sql(relation_condition: str = "", task_condition: str = "") -> str:
+        """返回查询 DEPENDENT 类型任务依赖边的 SQL 语句（更新时间取任务定义和任务关系中较晚的一个）
+
+        任务在同一工作流中有多条任务关系时，在任务关系一侧按（项目, 工作流, 任务）去重，避免对包含 TEXT 类型 task_params 的结果去重
+        而产生临时表；relation_condition 为任务关系在分组之前的 WHERE 子句，task_condition 为追加到任务定义条件之后的 AND 子句。
+        """
+        return (
+            "SELECT r.`project_code`, r.`process_definition_code`, t.`code`, t.`task_params`, "
+            "GREATEST(t.`update_time`, r.`update_time`) AS `update_time` "
+            "FROM t_ds_task_definition AS t "
+            "JOIN (SELECT `project_code`, `process_definition_code`, `post_task_code`, "
+            "MAX(`update_time`) AS `update_time` "
+            f"FROM t_ds_process_task_relation{relation_condition} "
+            "GROUP BY `project_code`, `process_definition_code`, `post_task_code`) AS r "
+            "ON r.`post_task_code` = t.`code` "
+            f"WHERE t.`task_type` = 'DEPENDENT'{task_condition}"
+        )
+
+    @staticmethod
+    def _to_dependent_task_edge(query_row: dict) -> DSDependentTaskEdge:
+        return DSDependentTaskEdge(
+            task_code=query_row["code"],
+            process=DSProcessDefinition(project_code=query_row["project_code"],
+                                        process_code=query_row["process_definition_code"]),
+            upstream_set=extract_upstream_process_set(query_row["task_params"])
+        )
 
     def get_process_definition_detail_list_by_project_code(
             self,
-            project_code: int
+            project_code: int,
+            fields: DSFields = PROJECTION_FULL,
+            flag: Optional[Union[DSAvailableFlag, int]] = None,
+            update_time_from: Optional[datetime.datetime] = None
     ) -> List[DSProcessDefinitionRecord]:
-        """根据工作流定义的列表，获取工作流定义的详细信息的列表"""
-        result = []
-        for query_row in self._select_iter_as_dict(
-                f"SELECT * FROM t_ds_process_definition WHERE project_code = '{project_code}'",
-                primary_key="id"
-        ):
-            result.append(DSProcessDefinitionRecord.from_t_ds_process_definition_record(query_row))
-        return result
+        """根据项目编号，获取项目中工作流定义的详细信息的列表
+
+        Parameters
+        ----------
+        project_code : int
+            项目编号
+        fields : DSFields, default = "full"
+            投影名称（keys / summary / full）或需要读取的字段，未读取的字段为 UNLOADED
+        flag : Optional[Union[DSAvailableFlag, int]], default = None
+            只返回 flag 字段等于该值的工作流；为 None 时不过滤
+        update_time_from : Optional[datetime.datetime], default = None
+            只返回更新时间不早于该时间的工作流；为 None 时不过滤
+        """
+        select_list = get_select_list_sql("t_ds_process_definition", fields)
+        query_filter = (DSQueryFilter()
+                        .equal("project_code", project_code)
+                        .equal("flag", flag)
+                        .greater_equal("update_time", update_time_from))
+        return list(self._scan_table("t_ds_process_definition", select_list, query_filter,
+                                     DSProcessDefinitionRecord.compile_row_decoder, parallelism=1, ordered=True))
 
     def get_process_definition_detail_list_by_process_definition_list(
             self,
             process_definition_list: List[DSProcessDefinition],
-            batch_size: int = 100
+            batch_size: int = 100,
+            fields: DSFields = PROJECTION_FULL,
+            parallelism: Optional[int] = None
     ) -> List[DSProcessDefinitionRecord]:
-        """根据工作流定义的列表，获取工作流定义的详细信息的列表"""
-        result = []
-        for i in range(0, len(process_definition_list), batch_size):
-            end_i = min(i + batch_size, len(process_definition_list))
-            sub_task_definition_code_list = ms_conn.sql_format.to_quote_str_list_none_as_ignore([
-                task.process_code for task in process_definition_list[i: end_i]
-            ])
-            for query_row in self._select_all_as_dict(
-                    f"SELECT * "
-                    f"FROM t_ds_process_definition "
-                    f"WHERE `code` IN {sub_task_definition_code_list}"
-            ):
-                process_definition_detail = DSProcessDefinitionRecord.from_t_ds_process_definition_record(query_row)
-                result.append(process_definition_detail)
-        return result
+        """根据工作流定义的列表，获取工作流定义的详细信息的列表（fields 为投影名称或需要读取的字段）"""
+        select_list = get_select_list_sql("t_ds_process_definition", fields)
+
+        def query(sub_process_definition_list: Sequence[DSProcessDefinition]) -> List[DSProcessDefinitionRecord]:
+            column_list, row_list = self._select_all_as_tuple_with_in_list(
+                f"SELECT {select_list} FROM t_ds_process_definition WHERE `code` IN",
+                [process.process_code for process in sub_process_definition_list]
+            )
+            decoder = DSProcessDefinitionRecord.compile_row_decoder(column_list)
+            return [decoder(row) for row in row_list]
+
+        return self._execute_in_batches("process_definition_by_code", process_definition_list, query,
+                                        batch_size=batch_size, parallelism=parallelism)
 
     def get_task_definition_list_by_process_definition_list(
             self,
             process_definition_list: List[DSProcessDefinition],
-            batch_size: int = 100
+            batch_size: int = 100,
+            parallelism: Optional[int] = None
     ) -> List[DSTaskDefinition]:
         """获取工作流定义的列表，获取其中包含的任务定义的列表（任务定义中包含工作流编号）"""
-        result = []
-        for i in range(0, len(process_definition_list), batch_size):
-            sub_process_definition_code_list = ms_conn.sql_format.to_quote_str_list_none_as_ignore([
-                process.process_code
-                for process in process_definition_list[i:min(i + batch_size, len(process_definition_list))]
-            ])
-            for query_row in self._select_all_as_dict(
-                    f"SELECT `project_code`, `process_definition_code`, `post_task_code` "
-                    f"FROM t_ds_process_task_relation "
-                    f"WHERE `process_definition_code` IN {sub_process_definition_code_list}"
-            ):
-                result.append(DSTaskDefinition(
-                    project_code=query_row["project_code"],
-                    task_code=query_row["post_task_code"],
-                    process_code=query_row["process_definition_code"]
-                ))
-        return list(set(result))  # 当同一个任务包含多个上游任务时，会出现重复的任务定义，因此需要去重
+
+        def query(sub_process_definition_list: Sequence[DSProcessDefinition]) -> List[DSTaskDefinition]:
+            _, row_list = self._select_all_as_tuple_with_in_list(
+                "SELECT `project_code`, `process_definition_code`, `post_task_code` "
+                "FROM t_ds_process_task_relation "
+                "WHERE `process_definition_code` IN",
+                [process.process_code for process in sub_process_definition_list]
+            )
+            return [DSTaskDefinition(project_code=project_code, task_code=task_code, process_code=process_code)
+                    for project_code, process_code, task_code in row_list]
+
+        result = self._execute_in_batches("task_definition_by_process_code", process_definition_list, query,
+                                          batch_size=batch_size, parallelism=parallelism)
+        return list(dict.fromkeys(result))  # 当同一个任务包含多个上游任务时，会出现重复的任务定义，因此需要去重（保留首次出现的顺序）
 
     def get_task_definition_detail_list_by_task_definition_list(
             self,
             task_definition_list: List[DSTaskDefinition],
-            batch_size: int = 100
+            batch_size: int = 100,
+            fields: DSFields = PROJECTION_FULL,
+            eager: bool = False,
+            parallelism: Optional[int] = None
     ) -> List[DSTaskDefinitionRecord]:
-        """根据任务定义的列表，获取任务定义的详细信息的列表"""
+        """根据任务定义的列表，获取任务定义的详细信息的列表（fields 为投影名称或需要读取的字段；eager 为 True 时立即解析 task_params）"""
+        select_list = get_select_list_sql("t_ds_task_definition", fields)
         task_code_to_process_code_hash = {task.task_code: task.process_code for task in task_definition_list}
-        result = []
-        for i in range(0, len(task_definition_list), batch_size):
-            sub_task_definition_code_list = ms_conn.sql_format.to_quote_str_list_none_as_ignore([
-                task.task_code for task in task_definition_list[i: min(i + batch_size, len(task_definition_list))]
-            ])
-            for query_row in self._select_all_as_dict(
-                    f"SELECT * "
-                    f"FROM t_ds_task_definition "
-                    f"WHERE `code` IN {sub_task_definition_code_list}"
-            ):
-                task_definition_detail = DSTaskDefinitionRecord.from_t_ds_task_definition_record(
-                    query_row,
-                    process_code=task_code_to_process_code_hash[query_row["code"]]
-                )
-                result.append(task_definition_detail)
-        return result
+
+        def query(sub_task_definition_list: Sequence[DSTaskDefinition]) -> List[DSTaskDefinitionRecord]:
+            column_list, row_list = self._select_all_as_tuple_with_in_list(
+                f"SELECT {select_list} FROM t_ds_task_definition WHERE `code` IN",
+                [task.task_code for task in sub_task_definition_list]
+            )
+            decoder = DSTaskDefinitionRecord.compile_row_decoder(column_list, eager=eager)
+            code_position = column_list.index("code")
+            return [decoder(row, task_code_to_process_code_hash[row[code_position]]) for row in row_list]
+
+        return self._execute_in_batches("task_definition_by_code", task_definition_list, query,
+                                        batch_size=batch_size, parallelism=parallelism)
 
     def get_all_task_definition_detail_list(
             self,
+            task_code_to_process_code_hash: Optional[Dict[int, int]] = None,
+            update_time_from: Optional[datetime.datetime] = None,
+            fields: DSFields = PROJECTION_FULL,
+            eager: bool = False,
+            parallelism: Optional[int] = None,
+            ordered: bool = True,
+            project_code_list: Optional[Iterable[int]] = None,
+            task_type_list: Optional[Iterable[Union[DSTaskType, str]]] = None,
+            worker_group: Optional[str] = None,
+            flag: Optional[Union[DSAvailableFlag, int]] = None,
+            intern_pool: Optional[DSInternPool] = None
     ) -> Generator[DSTaskDefinitionRecord, None, None]:
-        """读取 t_ds_process_task_relation 表中所有记录"""
-        for query_row in self._select_iter_as_dict("SELECT * FROM t_ds_task_definition", primary_key="id"):
-            yield DSTaskDefinitionRecord.from_t_ds_task_definition_record(query_row)
+        """读取 t_ds_task_definition 表中所有记录
+
+        Parameters
+        ----------
+        task_code_to_process_code_hash : Optional[Dict[int, int]], default = None
+            任务编号到工作流编号的映射，用于填充任务定义的 process_code 属性；为 None 时 process_code 为 None
+        update_time_from : Optional[datetime.datetime], default = None
+            只读取更新时间不早于该时间的记录；为 None 时读取所有记录
+        fields : DSFields, default = "full"
+            投影名称（keys / summary / full）或需要读取的字段，未读取的字段为 UNLOADED；只需要任务编号和类型时使用 keys 投影，
+            可以避免读取 task_params 字段
+        eager : bool, default = False
+            是否在构造时立即解析 task_params；为 False 时在第一次访问 task_params 时解析
+        parallelism : Optional[int], default = None
+            并行扫描的连接数量，大于 1 时按主键范围分片扫描；为 None 时使用构造时提供的默认值
+        ordered : bool, default = True
+            分片扫描时是否按主键顺序返回记录；为 False 时按到达顺序返回
+        project_code_list : Optional[Iterable[int]], default = None
+            只读取属于这些项目的任务；为 None 时不过滤
+        task_type_list : Optional[Iterable[Union[DSTaskType, str]]], default = None
+            只读取这些类型的任务；为 None 时不过滤
+        worker_group : Optional[str], default = None
+            只读取该 Worker 分组的任务；为 None 时不过滤
+        flag : Optional[Union[DSAvailableFlag, int]], default = None
+            只读取 flag 字段等于该值的任务；为 None 时不过滤
+        intern_pool : Optional[DSInternPool], default = None
+            字符串驻留池；提供时记录中取值较少的字符串字段，以及解析后的 task_params 中的字符串会被驻留
+        """
+        if task_code_to_process_code_hash is None:
+            task_code_to_process_code_hash = {}
+        select_list = get_select_list_sql("t_ds_task_definition", fields)
+        query_filter = (DSQueryFilter()
+                        .is_in("project_code", project_code_list)
+                        .is_in("task_type", task_type_list)
+                        .equal("worker_group", worker_group)
+                        .equal("flag", flag)
+                        .greater_equal("update_time", update_time_from))
+
+        def compile_row_decoder(column_list: List[str]) -> Callable[[tuple], DSTaskDefinitionRecord]:
+            decoder = DSTaskDefinitionRecord.compile_row_decoder(column_list, eager=eager, intern_pool=intern_pool)
+            code_position = column_list.index("code")
+            return lambda row: decoder(row, task_code_to_process_code_hash.get(row[code_position]))
+
+        yield from self._scan_table("t_ds_task_definition", select_list, query_filter, compile_row_decoder,
+                                    parallelism, ordered)
+
+    def get_all_process_definition_detail_list(
+            self,
+            update_time_from: Optional[datetime.datetime] = None,
+            fields: DSFields = PROJECTION_FULL,
+            parallelism: Optional[int] = None,
+            ordered: bool = True,
+            project_code_list: Optional[Iterable[int]] = None,
+            flag: Optional[Union[DSAvailableFlag, int]] = None,
+            intern_pool: Optional[DSInternPool] = None
+    ) -> Generator[DSProcessDefinitionRecord, None, None]:
+        """读取 t_ds_process_definition 表中所有记录（如提供 update_time_from，则只读取更新时间不早于该时间的记录；fields 为投影名称或
+        需要读取的字段；其他参数的含义与 get_all_task_definition_detail_list 相同）"""
+        select_list = get_select_list_sql("t_ds_process_definition", fields)
+        query_filter = (DSQueryFilter()
+                        .is_in("project_code", project_code_list)
+                        .equal("flag", flag)
+                        .greater_equal("update_time", update_time_from))
+
+        def compile_row_decoder(column_list: List[str]) -> Callable[[tuple], DSProcessDefinitionRecord]:
+            return DSProcessDefinitionRecord.compile_row_decoder(column_list, intern_pool=intern_pool)
+
+        yield from self._scan_table("t_ds_process_definition", select_list, query_filter, compile_row_decoder,
+                                    parallelism, ordered)
+
+    def get_all_schedule_record_list(
+            self,
+            update_time_from: Optional[datetime.datetime] = None,
+            parallelism: Optional[int] = None,
+            ordered: bool = True,
+            worker_group: Optional[str] = None,
+            intern_pool: Optional[DSInternPool] = None
+    ) -> Generator[DSScheduleRecord, None, None]:
+        """读取 t_ds_schedules 表中所有记录（如提供 update_time_from，则只读取更新时间不早于该时间的记录；其他参数的含义与
+        get_all_task_definition_detail_list 相同）"""
+        query_filter = (DSQueryFilter()
+                        .equal("worker_group", worker_group)
+                        .greater_equal("update_time", update_time_from))
+
+        def compile_row_decoder(column_list: List[str]) -> Callable[[tuple], DSScheduleRecord]:
+            return DSScheduleRecord.compile_row_decoder(column_list, intern_pool=intern_pool)
+
+        yield from self._scan_table("t_ds_schedules", "*", query_filter, compile_row_decoder, parallelism, ordered)
 
     def get_schedule_record_list_by_process_definition_list(
             self,
             process_definition_list: List[DSProcessDefinition],
-            batch_size: int = 100
+            batch_size: int = 100,
+            parallelism: Optional[int] = None
     ) -> List[DSScheduleRecord]:
         """获取当前工作流集合的定时上线状态"""
-        result = []
-        for i in range(0, len(process_definition_list), batch_size):
-            sub_process_code_list = ms_conn.sql_format.to_quote_str_list_none_as_ignore([
-                process_definition.process_code
-                for process_definition in process_definition_list[i: min(i + batch_size, len(process_definition_list))]
-            ])
-            for query_row in self._select_all_as_dict(
-                    f"SELECT * "
-                    f"FROM `t_ds_schedules` "
-                    f"WHERE `process_definition_code` IN {sub_process_code_list}"
-            ):
-                task_definition_detail = DSScheduleRecord.from_t_ds_schedules_record(query_row)
-                result.append(task_definition_detail)
-        return result
+
+        def query(sub_process_definition_list: Sequence[DSProcessDefinition]) -> List[DSScheduleRecord]:
+            column_list, row_list = self._select_all_as_tuple_with_in_list(
+                "SELECT * FROM `t_ds_schedules` WHERE `process_definition_code` IN",
+                [process.process_code for process in sub_process_definition_list]
+            )
+            decoder = DSScheduleRecord.compile_row_decoder(column_list)
+            return [decoder(row) for row in row_list]
+
+        return self._execute_in_batches("schedule_by_process_code", process_definition_list, query,
+                                        batch_size=batch_size, parallelism=parallelism)
 
     def get_all_process_task_relation_list(
             self,
+            update_time_from: Optional[datetime.datetime] = None,
+            parallelism: Optional[int] = None,
+            ordered: bool = True,
+            project_code_list: Optional[Iterable[int]] = None,
+            intern_pool: Optional[DSInternPool] = None
     ) -> Generator[DSProcessTaskRelationRecord, None, None]:
-        """读取 t_ds_process_task_relation 表中所有记录"""
-        for query_row in self._select_iter_as_dict("SELECT * FROM t_ds_process_task_relation", primary_key="id"):
-            yield DSProcessTaskRelationRecord.from_t_ds_process_task_relation_record(query_row)
+        """读取 t_ds_process_task_relation 表中所有记录（如提供 update_time_from，则只读取更新时间不早于该时间的记录；其他参数的含义与
+        get_all_task_definition_detail_list 相同）"""
+        query_filter = (DSQueryFilter()
+                        .is_in("project_code", project_code_list)
+                        .greater_equal("update_time", update_time_from))
+
+        def compile_row_decoder(column_list: List[str]) -> Callable[[tuple], DSProcessTaskRelationRecord]:
+            return DSProcessTaskRelationRecord.compile_row_decoder(column_list, intern_pool=intern_pool)
+
+        yield from self._scan_table("t_ds_process_task_relation", "*", query_filter, compile_row_decoder,
+                                    parallelism, ordered)
+
+    def get_process_task_relation_list_by_process_definition_list(
+            self,
+            process_definition_list: List[DSProcessDefinition],
+            batch_size: int = 100,
+            parallelism: Optional[int] = None
+    ) -> List[DSProcessTaskRelationRecord]:
+        """获取工作流定义的列表中所有工作流的工作流、任务关系的列表"""
+
+        def query(sub_process_definition_list: Sequence[DSProcessDefinition]) -> List[DSProcessTaskRelationRecord]:
+            column_list, row_list = self._select_all_as_tuple_with_in_list(
+                "SELECT * FROM `t_ds_process_task_relation` WHERE `process_definition_code` IN",
+                [process.process_code for process in sub_process_definition_list]
+            )
+            decoder = DSProcessTaskRelationRecord.compile_row_decoder(column_list)
+            return [decoder(row) for row in row_list]
+
+        return self._execute_in_batches("process_task_relation_by_process_code", process_definition_list, query,
+                                        batch_size=batch_size, parallelism=parallelism)
+
+    def get_row_id_set(self, table_name: str) -> Set[int]:
+        """返回表中所有记录的主键（只读取主键，用于检测被删除的记录）"""
+        return set(self._scan_table(table_name, "id", DSQueryFilter(), lambda column_list: lambda row: row[0],
+                                    parallelism=1, ordered=True))
+
+    def get_table_column_type_list(self, table_name: str) -> List[Tuple[str, str]]:
+        """返回表中所有字段的字段名和 MySQL 数据类型（如 bigint、varchar、datetime），按字段在表中的顺序排列"""
+        _, row_list = self._select_all_as_tuple(
+            "SELECT `COLUMN_NAME`, `DATA_TYPE` FROM information_schema.`COLUMNS` "
+            "WHERE `TABLE_SCHEMA` = %s AND `TABLE_NAME` = %s ORDER BY `ORDINAL_POSITION`",
+            [self._db_name, table_name]
+        )
+        return [(column_name, data_type.lower()) for column_name, data_type in row_list]
+
+    def get_all_row_list(
+            self,
+            table_name: str,
+            column_list: List[str],
+            update_time_from: Optional[datetime.datetime] = None,
+            parallelism: Optional[int] = None,
+            ordered: bool = True
+    ) -> Generator[tuple, None, None]:
+        """按主键顺序读取表中所有记录的 column_list 字段，以元组格式返回，不构造记录对象（用于导出；column_list 必须包含 id 字段，如
+        提供 update_time_from，则只读取更新时间不早于该时间的记录；其他参数的含义与 get_all_task_definition_detail_list 相同）"""
+        select_list = ", ".join(f"`{column}`" for column in column_list)
+        query_filter = DSQueryFilter().greater_equal("update_time", update_time_from)
+        yield from self._scan_table(table_name, select_list, query_filter, lambda _: lambda row: row,
+                                    parallelism, ordered)
+
+    # get_all_dependent_item_row_list 返回的每个元组中各个值的名称
+    DEPENDENT_ITEM_ROW_COLUMN_LIST = ["task_code", "project_code", "process_code", *DEPENDENT_ITEM_COLUMN_LIST,
+                                      "update_time"]
+
+    def get_all_dependent_item_row_list(
+            self,
+            update_time_from: Optional[datetime.datetime] = None,
+            parallelism: Optional[int] = None,
+            ordered: bool = True,
+            batch_size: int = 1000
+    ) -> Generator[tuple, None, None]:
+        """读取所有 DEPENDENT 类型任务的依赖项，每个依赖项返回一个元组，元组中的值依次对应 DEPENDENT_ITEM_ROW_COLUMN_LIST
+
+        按主键顺序扫描 DEPENDENT 类型任务，每 batch_size 个任务查询一次所属的工作流（与 get_dependent_task_edge_list 相同，不属于任何
+        工作流的任务不返回，属于多个工作流时每个工作流返回一次），内存占用与任务总数无关。
+
+        Parameters
+        ----------
+        update_time_from : Optional[datetime.datetime], default = None
+            只读取任务定义的更新时间不早于该时间的任务的依赖项；为 None 时读取所有任务的依赖项
+        parallelism : Optional[int], default = None
+            并行扫描的连接数量；为 None 时使用构造时提供的默认值
+        ordered : bool, default = True
+            分片扫描时是否按主键顺序返回任务；为 False 时按到达顺序返回
+        batch_size : int, default = 1000
+            每次查询所属工作流的任务数量
+        """
+        query_filter = (DSQueryFilter()
+                        .equal("task_type", DSTaskType.DEPENDENT)
+                        .greater_equal("update_time", update_time_from))
+        task_row_iter = self._scan_table("t_ds_task_definition", "`id`, `code`, `task_params`, `update_time`",
+                                         query_filter, lambda _: lambda row: row, parallelism, ordered)
+        while True:
+            task_row_list = list(itertools.islice(task_row_iter, batch_size))
+            if not task_row_list:
+                return
+            _, relation_row_list = self._select_all_as_tuple_with_in_list(
+                "SELECT DISTINCT `post_task_code`, `project_code`, `process_definition_code` "
+                "FROM t_ds_process_task_relation WHERE `post_task_code` IN",
+                [task_row[1] for task_row in task_row_list]
+            )
+            task_code_to_process_list = collections.defaultdict(list)
+            for task_code, project_code, process_code in relation_row_list:
+                task_code_to_process_list[task_code].append((project_code, process_code))
+            for _, task_code, task_params, update_time in task_row_list:
+                process_list = task_code_to_process_list.get(task_code)
+                if not process_list:
+                    continue
+                depend_item_list = extract_dependent_item_list(task_params)
+                for project_code, process_code in process_list:
+                    for depend_item in depend_item_list:
+                        yield task_code, project_code, process_code, *depend_item, update_time
+
+    def _scan_table(self, table_name: str, select_list: str, query_filter: DSQueryFilter,
+                    compile_row_decoder: Callable[[List[str]], Callable[[tuple], R]],
+                    parallelism: Optional[int], ordered: bool) -> Generator[R, None, None]:
+        """按主键顺序读取表中的所有记录；parallelism 大于 1 时，按主键范围切分为 parallelism 的 4 倍个分片，在 parallelism 个连接上并发
+        扫描（分片数量多于连接数量，以平衡主键分布不均匀时各分片的耗时）
+
+        每页记录以元组格式读取，使用 compile_row_decoder 根据查询结果的字段名生成的函数构造记录对象（select_list 必须包含 id 字段）。
+        """
+        if parallelism is None:
+            parallelism = self._parallelism
+        if parallelism <= 1:
+            yield from self._select_iter_as_tuple(table_name, select_list, query_filter, compile_row_decoder)
+            return
+
+        # 分片边界只取满足过滤条件的记录的主键范围，避免过滤条件选择性较高时大部分分片扫描空的主键范围
+        condition, args = query_filter.to_condition()
+        query_row = self._select_one_as_dict(f"SELECT MIN(id) AS min_id, MAX(id) AS max_id FROM {table_name}{condition}",
+                                             args)
+        range_list = split_id_range(query_row["min_id"], query_row["max_id"], parallelism * 4)
+
+        def scan(start_id: int, end_id: int) -> Generator[R, None, None]:
+            return self._select_iter_as_tuple(table_name, select_list, query_filter, compile_row_decoder,
+                                              start_id=start_id, end_id=end_id)
+
+        yield from scan_shards(range_list, scan, parallelism=parallelism, ordered=ordered)
 
     @staticmethod
     def _grouped_process_by_project(process_list: List[DSProcessDefinition]) -> Dict[int, List[DSProcessDefinition]]:
@@ -237,20 +668,116 @@ class DolphinMetaSdk:
             grouped_process_dict[process.project_code].append(process)
         return grouped_process_dict
 
-    def _select_one_as_dict(self, sql: str):
-        return ms_conn.mysql.select_one_as_dict(
-            manager=self._manager, mysql_name=self._mysql_name, db_name=self._db_name,
-            sql=sql
-        )
+    def _execute_in_batches(self, name: str, item_list: Sequence, query: Callable[[Sequence], list],
+                            batch_size: int, parallelism: Optional[int]) -> list:
+        """分批执行 IN 列表查询，按批次顺序合并结果
 
-    def _select_all_as_dict(self, sql: str):
-        return ms_conn.mysql.select_all_as_dict(
-            manager=self._manager, mysql_name=self._mysql_name, db_name=self._db_name,
-            sql=sql
-        )
+        Parameters
+        ----------
+        name : str
+            查询名称，开启自适应批次大小时，同名查询共享学习到的批次大小
+        item_list : Sequence
+            需要查询的元素列表
+        query : Callable[[Sequence], list]
+            查询一个批次的函数
+        batch_size : int
+            批次大小（开启自适应批次大小时为初始批次大小）
+        parallelism : Optional[int]
+            同时执行的批次数量，为 None 时使用构造时提供的默认值
+        """
+        if self._batch_target_latency is None:
+            controller = DSBatchSizeController(batch_size=batch_size,
+                                               max_allowed_packet=self._max_allowed_packet,
+                                               allowed_size_list=IN_LIST_ARITY_LIST)
+        else:
+            with self._batch_size_controller_lock:
+                controller = self._batch_size_controller_dict.get(name)
+                if controller is None:
+                    controller = DSBatchSizeController(batch_size=batch_size,
+                                                       target_latency=self._batch_target_latency,
+                                                       max_allowed_packet=self._max_allowed_packet,
+                                                       allowed_size_list=IN_LIST_ARITY_LIST)
+                    self._batch_size_controller_dict[name] = controller
+        return execute_in_batches(item_list, query, controller,
+                                  parallelism=parallelism if parallelism is not None else self._parallelism)
 
-    def _select_iter_as_dict(self, sql: str, primary_key: str):
-        yield from ms_conn.mysql.select_iter_as_dict(
-            manager=self._manager, mysql_name=self._mysql_name, db_name=self._db_name,
-            sql=sql, primary_key=primary_key
-        )
+    def _select_all_as_dict_with_in_list(self, sql: str, code_list: Iterable[Optional[int]]) -> List[dict]:
+        """执行以 IN 结尾的 SQL 语句：编号作为整数参数绑定，IN 列表长度补齐到 IN_LIST_ARITY_LIST 中的值（忽略 None；编号为空时不执行
+        查询）"""
+        code_list = [int(code) for code in code_list if code is not None]
+        if not code_list:
+            return []
+        placeholder, args = in_list_placeholder(code_list)
+        return self._select_all_as_dict(f"{sql} {placeholder}", args)
+
+    def _select_one_as_dict(self, sql: str, args: Optional[Sequence] = None):
+        if args is None:
+            return ms_conn.mysql.select_one_as_dict(
+                manager=self._manager, mysql_name=self._mysql_name, db_name=self._db_name,
+                sql=sql
+            )
+        with self._manager.mysql_connect(self._mysql_name, self._db_name) as mysql_conn:
+            with mysql_conn.cursor(pymysql.cursors.DictCursor) as cursor:
+                cursor.execute(sql, args)
+                return cursor.fetchone()
+
+    def _select_all_as_dict(self, sql: str, args: Optional[Sequence] = None):
+        if args is None:
+            return ms_conn.mysql.select_all_as_dict(
+                manager=self._manager, mysql_name=self._mysql_name, db_name=self._db_name,
+                sql=sql
+            )
+        with self._manager.mysql_connect(self._mysql_name, self._db_name) as mysql_conn:
+            with mysql_conn.cursor(pymysql.cursors.DictCursor) as cursor:
+                cursor.execute(sql, args)
+                return cursor.fetchall()
+
+    def _select_all_as_tuple_with_in_list(self, sql: str,
+                                          code_list: Iterable[Optional[int]]) -> Tuple[List[str], List[tuple]]:
+        """与 _select_all_as_dict_with_in_list 相同，但以元组格式返回查询结果（编号为空时字段名列表也为空）"""
+        code_list = [int(code) for code in code_list if code is not None]
+        if not code_list:
+            return [], []
+        placeholder, args = in_list_placeholder(code_list)
+        return self._select_all_as_tuple(f"{sql} {placeholder}", args)
+
+    def _select_all_as_tuple(self, sql: str, args: Optional[Sequence] = None) -> Tuple[List[str], List[tuple]]:
+        """执行查询，返回查询结果的字段名列表和元组格式的记录列表（不为每条记录构造字典）"""
+        with self._manager.mysql_connect(self._mysql_name, self._db_name) as mysql_conn:
+            with mysql_conn.cursor() as cursor:
+                cursor.execute(sql, args)
+                return [column[0] for column in cursor.description], list(cursor.fetchall())
+
+    def _select_iter_as_tuple(self, table_name: str, select_list: str, query_filter: DSQueryFilter,
+                              compile_row_decoder: Callable[[List[str]], Callable[[tuple], R]],
+                              start_id: Optional[int] = None,
+                              end_id: Optional[int] = None,
+                              page_size: int = 1000) -> Generator[R, None, None]:
+        """按主键翻页读取表中满足条件的记录（提供 start_id 时只读取主键在 [start_id, end_id) 范围内的记录），使用 compile_row_decoder 生成的函数构造
+        记录对象；该函数在第一页读取后生成一次"""
+        condition, args = query_filter.to_condition()
+        if start_id is not None:
+            condition += f" {'AND' if condition else 'WHERE'} `id` >= %s AND `id` < %s"
+            args += [start_id, end_id]
+
+        decoder = None
+        id_position = None
+        last_id = None
+        while True:
+            if last_id is None:
+                sql = f"SELECT {select_list} FROM {table_name}{condition} ORDER BY `id` LIMIT {page_size}"
+                column_list, row_list = self._select_all_as_tuple(sql, args)
+            else:
+                sql = (f"SELECT {select_list} FROM {table_name}{condition} "
+                       f"{'AND' if condition else 'WHERE'} `id` > %s ORDER BY `id` LIMIT {page_size}")
+                column_list, row_list = self._select_all_as_tuple(sql, args + [last_id])
+            if not row_list:
+                return
+            if decoder is None:
+                decoder = compile_row_decoder(column_list)
+                id_position = column_list.index("id")
+            for row in row_list:
+                yield decoder(row)
+            if len(row_list) < page_size:
+                return
+            last_id = row_list[-1][id_position]
@@ -0,0 +1,564 @@
+"""
+海豚调度元数据的内存快照
+"""
+
+import dataclasses
+import datetime
+import enum
+import sys
+import time
+import types
+from typing import Dict, Generator, Iterable, List, Optional, Set
+
+from dolphin_sdk.meta import DSDependencyGraph
+from dolphin_sdk.meta import DSDependentTaskEdge
+from dolphin_sdk.meta import extract_upstream_process_set
+from dolphin_sdk.meta_sdk import DolphinMetaSdk
+from dolphin_sdk.objects import DSInternPool
+from dolphin_sdk.objects import DSInternPoolStats
+from dolphin_sdk.objects import DSProcessDefinition
+from dolphin_sdk.objects import DSProcessDefinitionRecord
+from dolphin_sdk.objects import DSProcessTaskRelationRecord
+from dolphin_sdk.objects import DSProjectRecord
+from dolphin_sdk.objects import DSScheduleRecord
+from dolphin_sdk.objects import DSTaskDefinition
+from dolphin_sdk.objects import DSTaskDefinitionRecord
+from dolphin_sdk.objects import DSTaskDefinitionRecordDependent
+from dolphin_sdk.objects import LazySlotDescriptor
+
+__all__ = [
+    "DolphinMetaSnapshot",
+    "DSMetaSnapshotStats",
+    "DSMetaSnapshotRefreshReport"
+]
+
+TABLE_PROJECT = "t_ds_project"
+TABLE_PROCESS_DEFINITION = "t_ds_process_definition"
+TABLE_TASK_DEFINITION = "t_ds_task_definition"
+TABLE_PROCESS_TASK_RELATION = "t_ds_process_task_relation"
+TABLE_SCHEDULES = "t_ds_schedules"
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class DSMetaSnapshotStats:
+    """元数据快照的统计信息"""
+
+    # 最近一次全量加载的耗时（秒）
+    load_time: float = dataclasses.field(kw_only=True)
+
+    # 各表的记录数量
+    project_count: int = dataclasses.field(kw_only=True)
+    process_count: int = dataclasses.field(kw_only=True)
+    task_count: int = dataclasses.field(kw_only=True)
+    relation_count: int = dataclasses.field(kw_only=True)
+    schedule_count: int = dataclasses.field(kw_only=True)
+
+    # 快照中记录及索引占用的内存（字节，估算值；未计算时为 None）
+    memory_bytes: Optional[int] = dataclasses.field(kw_only=True, default=None)
+
+    # 字符串驻留池的统计信息，包括驻留节省的内存（未开启驻留时为 None）
+    intern_stats: Optional[DSInternPoolStats] = dataclasses.field(kw_only=True, default=None)
+
+
+@dataclasses.dataclass(slots=True)
+class DSMetaSnapshotRefreshReport:
+    """一次增量更新的结果"""
+
+    # 各表新增或更新的记录数量
+    upsert_count_dict: Dict[str, int] = dataclasses.field(kw_only=True, default_factory=lambda: {})
+
+    # 各表被删除的记录数量
+    remove_count_dict: Dict[str, int] = dataclasses.field(kw_only=True, default_factory=lambda: {})
+
+    # 耗时（秒）
+    elapsed: float = dataclasses.field(kw_only=True, default=0.0)
+
+
+class DolphinMetaSnapshot:
+    """海豚调度元数据的内存快照
+
+    一次性读取 t_ds_project、t_ds_process_definition、t_ds_task_definition、t_ds_process_task_relation 和 t_ds_schedules 表中
+    的所有记录，并按编号构造哈希索引。提供与 DolphinMetaSdk 相同的查询方法，但均在内存中完成，不再访问 MySQL。
+
+    调用 refresh() 可以增量更新快照：每张表记录已读取的最大更新时间（水位线），只重新读取更新时间不早于水位线的记录，并通过比较
+    主键集合检测被删除的记录，然后原地修改记录和索引。快照不是线程安全的，更新与查询不能同时进行。
+    """
+
+    def __init__(self, meta_sdk: DolphinMetaSdk, intern_strings: bool = True, intern_max_length: int = 64):
+        """
+
+        Parameters
+        ----------
+        meta_sdk : DolphinMetaSdk
+            用于读取元数据的 SDK
+        intern_strings : bool, default = True
+            是否在解码记录时驻留取值较少的字符串（每个快照使用独立的驻留池，全量重新加载时重建）
+        intern_max_length : int, default = 64
+            驻留的字符串的最大长度
+        """
+        self._meta_sdk = meta_sdk
+        self._load_time = 0.0
+        self._intern_strings = intern_strings
+        self._intern_max_length = intern_max_length
+        self._intern_pool: Optional[DSInternPool] = None
+
+        # 记录：编号 -> 记录
+        self._project_dict: Dict[int, DSProjectRecord] = {}
+        self._process_dict: Dict[int, DSProcessDefinitionRecord] = {}
+        self._task_dict: Dict[int, DSTaskDefinitionRecord] = {}
+        self._relation_dict: Dict[int, DSProcessTaskRelationRecord] = {}
+        self._schedule_dict: Dict[int, DSScheduleRecord] = {}
+
+        # 索引
+        self._process_id_dict: Dict[int, int] = {}  # 工作流主键 -> 工作流编号
+        self._project_process_dict: Dict[int, Set[int]] = {}  # 项目编号 -> 工作流编号
+        self._process_task_dict: Dict[int, Set[int]] = {}  # 工作流编号 -> 任务编号
+        self._task_process_dict: Dict[int, Set[int]] = {}  # 任务编号 -> 工作流编号
+        self._process_relation_dict: Dict[int, Set[int]] = {}  # 工作流编号 -> 任务关系主键
+        self._process_schedule_dict: Dict[int, int] = {}  # 工作流编号 -> 定时主键
+        self._project_id_dict: Dict[int, int] = {}  # 项目主键 -> 项目编号
+        self._task_id_dict: Dict[int, int] = {}  # 任务主键 -> 任务编号
+
+        # 表名 -> 已读取的最大更新时间
+        self._watermark_dict: Dict[str, Optional[datetime.datetime]] = {}
+
+        self._dependency_graph: Optional[DSDependencyGraph] = None
+
+        self.reload()
+
+    # ------------------------------ 加载 ------------------------------
+
+    def reload(self) -> None:
+        """全量重新加载所有表"""
+        start_time = time.monotonic()
+        # 重建驻留池，使旧快照中的字符串可以被释放
+        self._intern_pool = DSInternPool(max_length=self._intern_max_length) if self._intern_strings else None
+        intern_pool = self._intern_pool
+
+        # 先读取工作流、任务关系，以便在读取任务定义时填充任务所属的工作流
+        self._relation_dict = {relation.id: relation for relation in
+                               self._meta_sdk.get_all_process_task_relation_list(intern_pool=intern_pool)}
+        self._process_relation_dict = {}
+        self._process_task_dict = {}
+        self._task_process_dict = {}
+        for relation in self._relation_dict.values():
+            self._index_relation(relation)
+
+        self._project_dict = {project.project_code: project
+                              for project in self._meta_sdk.get_all_project_list(intern_pool=intern_pool)}
+        self._process_dict = {process.process_code: process for process in
+                              self._meta_sdk.get_all_process_definition_detail_list(intern_pool=intern_pool)}
+        self._task_dict = {task.task_code: task for task in self._meta_sdk.get_all_task_definition_detail_list(
+            task_code_to_process_code_hash=self._task_code_to_process_code_hash(), intern_pool=intern_pool)}
+        self._schedule_dict = {schedule.id: schedule for schedule in
+                               self._meta_sdk.get_all_schedule_record_list(intern_pool=intern_pool)}
+
+        self._project_id_dict = {project.id: project.project_code for project in self._project_dict.values()}
+        self._task_id_dict = {task.id: task.task_code for task in self._task_dict.values()}
+
+        self._process_id_dict = {}
+        self._project_process_dict = {}
+        for process in self._process_dict.values():
+            self._index_process(process)
+
+        self._process_schedule_dict = {}
+        for schedule in self._schedule_dict.values():
+            self._process_schedule_dict[schedule.process_code] = schedule.id
+
+        self._watermark_dict = {
+            TABLE_PROJECT: _max_update_time(self._project_dict.values()),
+            TABLE_PROCESS_DEFINITION: _max_update_time(self._process_dict.values()),
+            TABLE_TASK_DEFINITION: _max_update_time(self._task_dict.values()),
+            TABLE_PROCESS_TASK_RELATION: _max_update_time(self._relation_dict.values()),
+            TABLE_SCHEDULES: _max_update_time(self._schedule_dict.values()),
+        }
+
+        self._dependency_graph = None
+        self._load_time = time.monotonic() - start_time
+
+    def refresh(self) -> DSMetaSnapshotRefreshReport:
+        """增量更新快照
+
+        每张表执行两次查询：读取更新时间不早于水位线的记录（与水位线相等的记录会被重复读取，以免遗漏与水位线同一秒内的更新，
+        重复读取的记录按主键覆盖），以及读取所有主键以检测被删除的记录。
+        """
+        start_time = time.monotonic()
+        report = DSMetaSnapshotRefreshReport()
+        meta_sdk = self._meta_sdk
+        intern_pool = self._intern_pool
+
+        # 项目
+        project_list = meta_sdk.get_all_project_list(update_time_from=self._watermark_dict[TABLE_PROJECT],
+                                                     intern_pool=intern_pool)
+        removed_id_set = set(self._project_id_dict) - meta_sdk.get_row_id_set(TABLE_PROJECT)
+        for row_id in removed_id_set:
+            self._project_dict.pop(self._project_id_dict.pop(row_id), None)
+        for project in project_list:
+            self._project_dict[project.project_code] = project
+            self._project_id_dict[project.id] = project.project_code
+        self._advance_watermark(TABLE_PROJECT, project_list, removed_id_set, report)
+
+        # 工作流定义
+        process_list = list(meta_sdk.get_all_process_definition_detail_list(
+            update_time_from=self._watermark_dict[TABLE_PROCESS_DEFINITION], intern_pool=intern_pool))
+        removed_id_set = set(self._process_id_dict) - meta_sdk.get_row_id_set(TABLE_PROCESS_DEFINITION)
+        for row_id in removed_id_set:
+            self._unindex_process(self._process_dict.pop(self._process_id_dict[row_id]))
+        for process in process_list:
+            old_process = self._process_dict.get(process.process_code)
+            if old_process is not None:
+                self._unindex_process(old_process)
+            self._process_dict[process.process_code] = process
+            self._index_process(process)
+        self._advance_watermark(TABLE_PROCESS_DEFINITION, process_list, removed_id_set, report)
+
+        # 工作流、任务关系：重新计算受影响的工作流的任务索引
+        relation_list = list(meta_sdk.get_all_process_task_relation_list(
+            update_time_from=self._watermark_dict[TABLE_PROCESS_TASK_RELATION], intern_pool=intern_pool))
+        removed_id_set = set(self._relation_dict) - meta_sdk.get_row_id_set(TABLE_PROCESS_TASK_RELATION)
+        affected_process_code_set = set()
+        for row_id in removed_id_set:
+            relation = self._relation_dict.pop(row_id)
+            self._process_relation_dict[relation.process_code].discard(row_id)
+            affected_process_code_set.add(relation.process_code)
+        for relation in relation_list:
+            old_relation = self._relation_dict.get(relation.id)
+            if old_relation is not None:
+                self._process_relation_dict[old_relation.process_code].discard(relation.id)
+                affected_process_code_set.add(old_relation.process_code)
+            self._relation_dict[relation.id] = relation
+            self._process_relation_dict.setdefault(relation.process_code, set()).add(relation.id)
+            affected_process_code_set.add(relation.process_code)
+        affected_task_code_set = self._reindex_process_task(affected_process_code_set)
+        self._advance_watermark(TABLE_PROCESS_TASK_RELATION, relation_list, removed_id_set, report)
+
+        # 任务定义
+        task_code_to_process_code_hash = self._task_code_to_process_code_hash()
+        task_list = list(meta_sdk.get_all_task_definition_detail_list(
+            task_code_to_process_code_hash=task_code_to_process_code_hash,
+            update_time_from=self._watermark_dict[TABLE_TASK_DEFINITION],
+            intern_pool=intern_pool))
+        removed_id_set = set(self._task_id_dict) - meta_sdk.get_row_id_set(TABLE_TASK_DEFINITION)
+        for row_id in removed_id_set:
+            task_code = self._task_id_dict.pop(row_id)
+            self._task_dict.pop(task_code, None)
+            affected_task_code_set.add(task_code)
+        for task in task_list:
+            self._task_dict[task.task_code] = task
+            self._task_id_dict[task.id] = task.task_code
+            affected_task_code_set.add(task.task_code)
+        # 任务定义未更新、但所属工作流发生变化的任务
+        for task_code in affected_task_code_set:
+            task = self._task_dict.get(task_code)
+            if task is not None and task.process_code != task_code_to_process_code_hash.get(task_code):
+                self._task_dict[task_code] = task.replace(process_code=task_code_to_process_code_hash.get(task_code))
+        self._advance_watermark(TABLE_TASK_DEFINITION, task_list, removed_id_set, report)
+
+        # 定时
+        schedule_list = list(meta_sdk.get_all_schedule_record_list(
+            update_time_from=self._watermark_dict[TABLE_SCHEDULES], intern_pool=intern_pool))
+        removed_id_set = set(self._schedule_dict) - meta_sdk.get_row_id_set(TABLE_SCHEDULES)
+        for row_id in removed_id_set:
+            schedule = self._schedule_dict.pop(row_id)
+            if self._process_schedule_dict.get(schedule.process_code) == row_id:
+                del self._process_schedule_dict[schedule.process_code]
+        for schedule in schedule_list:
+            old_schedule = self._schedule_dict.get(schedule.id)
+            if old_schedule is not None and self._process_schedule_dict.get(old_schedule.process_code) == schedule.id:
+                del self._process_schedule_dict[old_schedule.process_code]
+            self._schedule_dict[schedule.id] = schedule
+            self._process_schedule_dict[schedule.process_code] = schedule.id
+        self._advance_watermark(TABLE_SCHEDULES, schedule_list, removed_id_set, report)
+
+        # 依赖关系图：只更新受影响的任务
+        if self._dependency_graph is not None and affected_task_code_set:
+            upsert_edge_list = []
+            for task_code in affected_task_code_set:
+                edge = self._to_dependent_task_edge(self._task_dict.get(task_code))
+                if edge is not None:
+                    upsert_edge_list.append(edge)
+            upsert_task_code_set = {edge.task_code for edge in upsert_edge_list}
+            self._dependency_graph.apply_changes(upsert_edge_list, affected_task_code_set - upsert_task_code_set, None)
+
+        report.elapsed = time.monotonic() - start_time
+        return report
+
+    def _task_code_to_process_code_hash(self) -> Dict[int, int]:
+        """任务编号到所属工作流编号的映射（任务属于多个工作流时取编号最小的工作流）"""
+        return {task_code: min(process_code_set) for task_code, process_code_set in self._task_process_dict.items()}
+
+    def _advance_watermark(self, table_name: str, record_list: list, removed_id_set: Set[int],
+                           report: DSMetaSnapshotRefreshReport) -> None:
+        """记录增量更新的数量，并将水位线推进到本次读取的最大更新时间"""
+        report.upsert_count_dict[table_name] = len(record_list)
+        report.remove_count_dict[table_name] = len(removed_id_set)
+        watermark = _max_update_time(record_list)
+        if watermark is not None and (self._watermark_dict[table_name] is None
+                                      or watermark > self._watermark_dict[table_name]):
+            self._watermark_dict[table_name] = watermark
+
+    def _index_process(self, process: DSProcessDefinitionRecord) -> None:
+        self._process_id_dict[process.id] = process.process_code
+        self._project_process_dict.setdefault(process.project_code, set()).add(process.process_code)
+
+    def _unindex_process(self, process: DSProcessDefinitionRecord) -> None:
+        self._process_id_dict.pop(process.id, None)
+        process_code_set = self._project_process_dict.get(process.project_code)
+        if process_code_set is not None:
+            process_code_set.discard(process.process_code)
+            if not process_code_set:
+                del self._project_process_dict[process.project_code]
+
+    def _reindex_process_task(self, process_code_set: Iterable[int]) -> Set[int]:
+        """根据工作流、任务关系重新计算工作流的任务索引，返回所属工作流可能发生变化的任务编号"""
+        affected_task_code_set = set()
+        for process_code in process_code_set:
+            for task_code in self._process_task_dict.pop(process_code, ()):
+                affected_task_code_set.add(task_code)
+                task_process_code_set = self._task_process_dict[task_code]
+                task_process_code_set.discard(process_code)
+                if not task_process_code_set:
+                    del self._task_process_dict[task_code]
+            relation_id_set = self._process_relation_dict.get(process_code)
+            if relation_id_set is not None and not relation_id_set:
+                del self._process_relation_dict[process_code]
+                continue
+            for relation_id in relation_id_set or ():
+                relation = self._relation_dict[relation_id]
+                for task_code in (relation.pre_task_code, relation.post_task_code):
+                    if task_code:
+                        self._process_task_dict.setdefault(process_code, set()).add(task_code)
+                        self._task_process_dict.setdefault(task_code, set()).add(process_code)
+                        affected_task_code_set.add(task_code)
+        return affected_task_code_set
+
+    def _index_relation(self, relation: DSProcessTaskRelationRecord) -> None:
+        self._process_relation_dict.setdefault(relation.process_code, set()).add(relation.id)
+        for task_code in (relation.pre_task_code, relation.post_task_code):
+            if task_code:
+                self._process_task_dict.setdefault(relation.process_code, set()).add(task_code)
+                self._task_process_dict.setdefault(task_code, set()).add(relation.process_code)
+
+    # ------------------------------ 统计 ------------------------------
+
+    def stats(self, include_memory: bool = False) -> DSMetaSnapshotStats:
+        """返回快照的统计信息
+
+        Parameters
+        ----------
+        include_memory : bool, default = False
+            是否估算内存占用（需要遍历所有对象，耗时与记录数量成正比）
+        """
+        return DSMetaSnapshotStats(
+            load_time=self._load_time,
+            project_count=len(self._project_dict),
+            process_count=len(self._process_dict),
+            task_count=len(self._task_dict),
+            relation_count=len(self._relation_dict),
+            schedule_count=len(self._schedule_dict),
+            memory_bytes=self._memory_bytes() if include_memory else None,
+            intern_stats=self._intern_pool.stats() if self._intern_pool is not None else None
+        )
+
+    def _memory_bytes(self) -> int:
+        """估算记录及索引占用的内存（共享的对象只计算一次）"""
+        return _deep_sizeof([
+            self._project_dict, self._process_dict, self._task_dict, self._relation_dict, self._schedule_dict,
+            self._process_id_dict, self._project_process_dict, self._process_task_dict, self._task_process_dict,
+            self._process_relation_dict, self._process_schedule_dict, self._project_id_dict, self._task_id_dict
+        ])
+
+    # ----------------------------------------------------------------------
+    # ------------------------------ 项目级方法 ------------------------------
+    # ----------------------------------------------------------------------
+
+    def get_all_project_list(self) -> List[DSProjectRecord]:
+        """返回海豚调度中所有项目的 DSProjectRecord 对象的列表"""
+        return list(self._project_dict.values())
+
+    # ----------------------------------------------------------------------
+    # ----------------------------- 工作流级方法 -----------------------------
+    # ----------------------------------------------------------------------
+
+    def get_process_definition_by_id(self, row_id: int) -> DSProcessDefinition:
+        """根据 t_ds_process_definition 表主键 row_id 构造工作流定义对象"""
+        process = self._process_dict[self._process_id_dict[row_id]]
+        return DSProcessDefinition(project_code=process.project_code, process_code=process.process_code)
+
+    def get_dependency_graph(self) -> DSDependencyGraph:
+        """根据快照中的 DEPENDENT 类型任务构造工作流之间的依赖关系图（构造后缓存，增量更新时同步更新，全量重新加载时失效）"""
+        if self._dependency_graph is None:
+            edge_list = []
+            for task in self._task_dict.values():
+                edge = self._to_dependent_task_edge(task)
+                if edge is not None:
+                    edge_list.append(edge)
+            self._dependency_graph = DSDependencyGraph(edge_list)
+        return self._dependency_graph
+
+    @staticmethod
+    def _to_dependent_task_edge(task: Optional[DSTaskDefinitionRecord]) -> Optional[DSDependentTaskEdge]:
+        """将 DEPENDENT 类型任务转换为依赖边（其他类型的任务或不属于任何工作流的任务返回 None）"""
+        if not isinstance(task, DSTaskDefinitionRecordDependent) or task.process_code is None:
+            return None
+        if not task.is_task_params_decoded:
+            # 尚未解析的任务参数只提取依赖项，不构造完整的任务参数对象
+            return DSDependentTaskEdge(
+                task_code=task.task_code,
+                process=DSProcessDefinition(project_code=task.project_code, process_code=task.process_code),
+                upstream_set=extract_upstream_process_set(task.task_params_raw)
+            )
+        return DSDependentTaskEdge(
+            task_code=task.task_code,
+            process=DSProcessDefinition(project_code=task.project_code, process_code=task.process_code),
+            upstream_set=frozenset(
+                DSProcessDefinition(project_code=depend_item.project_code, process_code=depend_item.definition_code)
+                for depend_task in task.task_params.dependence.depend_task_list
+                for depend_item in depend_task.depend_item_list
+            )
+        )
+
+    def get_depend_process_definition_list_by_process_definition_list(
+            self,
+            process_definition_list: List[DSProcessDefinition],
+            include: bool = True,
+            max_depth: Optional[int] = None
+    ) -> List[DSProcessDefinition]:
+        """根据工作流定义的列表，获取其直接或间接依赖的上游工作流定义的列表"""
+        return list(self.get_dependency_graph().get_upstream_closure(process_definition_list, max_depth=max_depth,
+                                                                     include=include))
+
+    def get_downstream_process_definition_list_by_process_definition_list(
+            self,
+            process_definition_list: List[DSProcessDefinition],
+            include: bool = True,
+            max_depth: Optional[int] = None
+    ) -> List[DSProcessDefinition]:
+        """根据工作流定义的列表，获取直接或间接依赖它们的下游工作流定义的列表"""
+        return list(self.get_dependency_graph().get_downstream_closure(process_definition_list, max_depth=max_depth,
+                                                                       include=include))
+
+    def get_upstream_process_dict_by_process_definition_list(
+            self,
+            process_definition_list: List[DSProcessDefinition]
+    ) -> Dict[DSProcessDefinition, Set[DSProcessDefinition]]:
+        """根据工作流定义的列表，获取每个工作流通过 DEPENDENT 任务直接依赖的上游工作流定义的集合"""
+        return self.get_dependency_graph().get_upstream_dict(process_definition_list)
+
+    def get_process_definition_detail_list_by_project_code(
+            self,
+            project_code: int
+    ) -> List[DSProcessDefinitionRecord]:
+        """根据项目编号，获取项目中所有工作流定义的详细信息的列表"""
+        return [self._process_dict[process_code] for process_code in self._project_process_dict.get(project_code, ())]
+
+    def get_process_definition_detail_list_by_process_definition_list(
+            self,
+            process_definition_list: List[DSProcessDefinition]
+    ) -> List[DSProcessDefinitionRecord]:
+        """根据工作流定义的列表，获取工作流定义的详细信息的列表"""
+        return [self._process_dict[process.process_code] for process in process_definition_list
+                if process.process_code in self._process_dict]
+
+    def get_task_definition_list_by_process_definition_list(
+            self,
+            process_definition_list: List[DSProcessDefinition]
+    ) -> List[DSTaskDefinition]:
+        """获取工作流定义的列表，获取其中包含的任务定义的列表（任务定义中包含工作流编号）"""
+        result = []
+        for process in process_definition_list:
+            for task_code in self._process_task_dict.get(process.process_code, ()):
+                result.append(DSTaskDefinition(project_code=process.project_code, task_code=task_code,
+                                               process_code=process.process_code))
+        return result
+
+    def get_task_definition_detail_list_by_task_definition_list(
+            self,
+            task_definition_list: List[DSTaskDefinition]
+    ) -> List[DSTaskDefinitionRecord]:
+        """根据任务定义的列表，获取任务定义的详细信息的列表"""
+        return [self._task_dict[task.task_code] for task in task_definition_list if task.task_code in self._task_dict]
+
+    def get_task_definition_detail_list_by_process_code(self, process_code: int) -> List[DSTaskDefinitionRecord]:
+        """获取工作流中所有任务定义的详细信息的列表"""
+        return [self._task_dict[task_code] for task_code in self._process_task_dict.get(process_code, ())
+                if task_code in self._task_dict]
+
+    def get_process_code_set_by_task_code(self, task_code: int) -> Set[int]:
+        """获取包含任务的所有工作流编号"""
+        return set(self._task_process_dict.get(task_code, ()))
+
+    def get_all_task_definition_detail_list(self) -> Generator[DSTaskDefinitionRecord, None, None]:
+        """返回快照中所有任务定义"""
+        yield from self._task_dict.values()
+
+    def get_schedule_record_list_by_process_definition_list(
+            self,
+            process_definition_list: List[DSProcessDefinition]
+    ) -> List[DSScheduleRecord]:
+        """获取当前工作流集合的定时上线状态"""
+        result = []
+        for process in process_definition_list:
+            schedule_id = self._process_schedule_dict.get(process.process_code)
+            if schedule_id is not None:
+                result.append(self._schedule_dict[schedule_id])
+        return result
+
+    def get_schedule_record_by_process_code(self, process_code: int) -> Optional[DSScheduleRecord]:
+        """获取工作流的定时（没有定时时返回 None）"""
+        schedule_id = self._process_schedule_dict.get(process_code)
+        return self._schedule_dict[schedule_id] if schedule_id is not None else None
+
+    def get_all_process_task_relation_list(self) -> Generator[DSProcessTaskRelationRecord, None, None]:
+        """返回快照中所有工作流、任务关系"""
+        yield from self._relation_dict.values()
+
+    def get_process_task_relation_list_by_process_definition_list(
+            self,
+            process_definition_list: List[DSProcessDefinition]
+    ) -> List[DSProcessTaskRelationRecord]:
+        """获取工作流定义的列表中所有工作流的工作流、任务关系的列表"""
+        return [self._relation_dict[relation_id]
+                for process in process_definition_list
+                for relation_id in self._process_relation_dict.get(process.process_code, ())]
+
+
+def _max_update_time(record_list: Iterable) -> Optional[datetime.datetime]:
+    """返回记录中的最大更新时间（没有记录时返回 None）"""
+    return max((record.update_time for record in record_list if record.update_time is not None), default=None)
+
+
+def _deep_sizeof(obj: object) -> int:
+    """递归地估算对象及其引用的所有对象占用的内存（每个对象只计算一次；小整数、None 等共享对象也会被计入一次）"""
+    seen: Set[int] = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if isinstance(obj, (type, enum.Enum, types.ModuleType, types.FunctionType)):
+            continue  # 类、枚举值等为全局共享的对象，不计入快照
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif isinstance(obj, (str, bytes, int, float, bool, type(None))):
+            continue
+        else:
+            if hasattr(obj, "__dict__"):
+                stack.append(obj.__dict__)
+            for cls in type(obj).__mro__:
+                slots = getattr(cls, "__slots__", ())
+                for slot in ((slots,) if isinstance(slots, str) else slots):
+                    descriptor = cls.__dict__.get(slot)
+                    if isinstance(descriptor, LazySlotDescriptor):
+                        descriptor = descriptor.slot  # 不触发延迟解析字段的解析
+                    try:
+                        stack.append(descriptor.__get__(obj, cls) if descriptor is not None else getattr(obj, slot))
+                    except AttributeError:
+                        continue
+    return total
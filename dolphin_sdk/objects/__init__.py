@@ -1,5 +1,7 @@
+from dolphin_sdk.objects.base import *
 from dolphin_sdk.objects.common import *
 from dolphin_sdk.objects.enum import *
+from dolphin_sdk.objects.intern import *
 from dolphin_sdk.objects.process import *
 from dolphin_sdk.objects.process_task_relation import *
 from dolphin_sdk.objects.project import *
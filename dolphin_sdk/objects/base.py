@@ -1,10 +1,163 @@
 import abc
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple
 
 __all__ = [
-    "ObjectBase"
+    "ObjectBase",
+    "UNLOADED",
+    "is_loaded",
+    "get_record_field",
+    "LazyValue",
+    "LazySlotDescriptor",
+    "DSRecordFieldSpec",
+    "compile_record_decoder"
 ]
 
 
 class ObjectBase(abc.ABC):
     def to_json(self) -> dict:
         """"""
+
+
+class _Unloaded:
+    """未加载字段的占位值（查询时没有选择该字段）"""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "UNLOADED"
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __reduce__(self):
+        return "UNLOADED"
+
+
+UNLOADED = _Unloaded()
+
+
+def is_loaded(value: Any) -> bool:
+    """判断字段是否已加载"""
+    return value is not UNLOADED
+
+
+def get_record_field(record: Dict[str, Any], key: str, decoder: Optional[Callable[[Any], Any]] = None) -> Any:
+    """读取查询结果中的字段，并使用 decoder 转换；查询结果中没有该字段时返回 UNLOADED"""
+    if key not in record:
+        return UNLOADED
+    if decoder is None:
+        return record[key]
+    return decoder(record[key])
+
+
+class LazyValue:
+    """尚未解析的字段值：保存原始值和解析函数，在第一次访问字段时解析"""
+
+    __slots__ = ("raw", "decoder")
+
+    def __init__(self, raw: Any, decoder: Callable[[Any], Any]):
+        self.raw = raw
+        self.decoder = decoder
+
+    def __repr__(self) -> str:
+        return f"LazyValue({self.raw!r})"
+
+    def decode(self) -> Any:
+        return self.decoder(self.raw)
+
+
+class LazySlotDescriptor:
+    """包装 slots 数据类中某个字段的 slot 描述符：字段值为 LazyValue 时，在第一次访问时解析并将结果写回 slot
+
+    写回时直接调用 slot 描述符，因此不受 frozen 数据类的 __setattr__ 限制；通过 setattr 修改字段仍然会抛出 FrozenInstanceError。
+    多个线程同时第一次访问时可能重复解析，但结果相同。
+    """
+
+    __slots__ = ("slot",)
+
+    def __init__(self, slot):
+        self.slot = slot
+
+    @classmethod
+    def install(cls, owner: type, name: str) -> None:
+        """将 owner 类中名为 name 的 slot 字段替换为延迟解析的字段（子类继承该行为）"""
+        setattr(owner, name, cls(owner.__dict__[name]))
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.slot
+        value = self.slot.__get__(instance, owner)
+        if type(value) is LazyValue:
+            value = value.decode()
+            self.slot.__set__(instance, value)
+        return value
+
+    def __set__(self, instance, value) -> None:
+        self.slot.__set__(instance, value)
+
+    def __delete__(self, instance) -> None:
+        self.slot.__delete__(instance)
+
+    def get_raw(self, instance) -> Any:
+        """返回 slot 中保存的值，不触发解析（尚未解析时为 LazyValue）"""
+        return self.slot.__get__(instance, type(instance))
+
+
+# 记录对象的字段与查询结果字段的对应关系：（记录对象的构造参数名，查询结果的字段名，转换函数）
+DSRecordFieldSpec = Tuple[str, str, Optional[Callable[[Any], Any]]]
+
+
+def compile_record_decoder(constructor: Callable[..., Any],
+                           field_spec_list: Sequence[DSRecordFieldSpec],
+                           column_list: Sequence[str],
+                           required_column_list: Iterable[str] = (),
+                           extra_arg_list: Sequence[str] = (),
+                           intern: Optional[Callable[[Any], Any]] = None,
+                           intern_field_list: Iterable[str] = ()) -> Callable[..., Any]:
+    """根据查询结果的字段顺序，生成直接从元组构造记录对象的函数
+
+    生成的函数按位置读取元组中的值，直接调用 constructor，不构造中间字典；查询结果中没有的字段为 UNLOADED。对于同一个查询，只需要
+    生成一次，然后对每一行调用。
+
+    Parameters
+    ----------
+    constructor : Callable[..., Any]
+        记录对象的构造函数
+    field_spec_list : Sequence[DSRecordFieldSpec]
+        记录对象的字段与查询结果字段的对应关系
+    column_list : Sequence[str]
+        查询结果的字段名（与元组中值的顺序一致）
+    required_column_list : Iterable[str], default = ()
+        查询结果中必须包含的字段，缺失时抛出 KeyError
+    extra_arg_list : Sequence[str], default = ()
+        生成的函数在元组之后额外接收的参数名，原样传给 constructor 的同名参数
+    intern : Optional[Callable[[Any], Any]], default = None
+        字符串驻留函数，为 None 时不驻留
+    intern_field_list : Iterable[str], default = ()
+        需要驻留的字段（记录对象的属性名），在 decoder 之后调用 intern
+    """
+    position_dict = {column: i for i, column in enumerate(column_list)}
+    for column in required_column_list:
+        if column not in position_dict:
+            raise KeyError(f"查询结果中缺少字段: {column}")
+
+    intern_field_set = set(intern_field_list) if intern is not None else set()
+    namespace = {"_constructor": constructor, "UNLOADED": UNLOADED, "_intern": intern}
+    argument_list = []
+    for i, (field_name, column, decoder) in enumerate(field_spec_list):
+        if column not in position_dict:
+            argument_list.append(f"{field_name}=UNLOADED")
+            continue
+        expression = f"row[{position_dict[column]}]"
+        if decoder is not None:
+            namespace[f"_decoder_{i}"] = decoder
+            expression = f"_decoder_{i}({expression})"
+        if field_name in intern_field_set:
+            expression = f"_intern({expression})"
+        argument_list.append(f"{field_name}={expression}")
+    argument_list.extend(f"{name}={name}" for name in extra_arg_list)
+
+    parameter_list = ["row"] + [f"{name}=None" for name in extra_arg_list]
+    source = f"def decode({', '.join(parameter_list)}):\n    return _constructor({', '.join(argument_list)})\n"
+    exec(source, namespace)
+    return namespace["decode"]
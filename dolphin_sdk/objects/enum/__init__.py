@@ -1,6 +1,8 @@
 from dolphin_sdk.objects.enum.ds_available_flag import DSAvailableFlag
 from dolphin_sdk.objects.enum.ds_complement_dependent_mode import DSComplementDependentMode
 from dolphin_sdk.objects.enum.ds_condition_type import DSConditionType
+from dolphin_sdk.objects.enum.ds_enum_base import DSEnumBase
+from dolphin_sdk.objects.enum.ds_enum_base import DSEnumMeta
 from dolphin_sdk.objects.enum.ds_failure_stractegy import DSFailureStrategy
 from dolphin_sdk.objects.enum.ds_priority import DSPriority
 from dolphin_sdk.objects.enum.ds_process_execution_type import DSProcessExecutionType
@@ -0,0 +1,56 @@
+"""
+海豚调度枚举值的基类
+"""
+
+import enum
+from typing import Any, Type, TypeVar
+
+__all__ = [
+    "DSEnumMeta",
+    "DSEnumBase"
+]
+
+E = TypeVar("E", bound="DSEnumBase")
+
+
+class DSEnumMeta(enum.EnumMeta):
+    """在创建枚举类时构造数据库中存储的值和 Web API 中的值到枚举值的映射表"""
+
+    def __new__(mcs, cls_name, bases, class_dict, **kwargs):
+        cls = super().__new__(mcs, cls_name, bases, class_dict, **kwargs)
+        db_value_dict = {}
+        web_value_dict = {}
+        for member in cls:
+            # 多个枚举值的 db_value 或 web_value 相同时，与逐个遍历查找一致，使用先定义的枚举值
+            db_value_dict.setdefault(member.db_value, member)
+            web_value_dict.setdefault(member.web_value, member)
+        cls._db_value_dict = db_value_dict
+        cls._web_value_dict = web_value_dict
+        return cls
+
+
+class DSEnumBase(enum.Enum, metaclass=DSEnumMeta):
+    """海豚调度枚举值的基类：每个枚举值为 (db_value, web_value) 二元组
+
+    子类只需要定义枚举值，from_db_value 和 from_web_value 通过创建类时构造的映射表查找，不需要遍历所有枚举值。
+    """
+
+    def __new__(cls, db_value: Any, web_value: Any):
+        member = object.__new__(cls)
+        member.db_value = db_value  # 数据库中存储的值
+        member.web_value = web_value  # Web API 中的值
+        return member
+
+    @classmethod
+    def from_db_value(cls: Type[E], db_value: Any) -> E:
+        try:
+            return cls._db_value_dict[db_value]
+        except (KeyError, TypeError):
+            raise KeyError(f"{db_value} 不是 {cls.__name__} 的有效枚举值") from None
+
+    @classmethod
+    def from_web_value(cls: Type[E], web_value: Any) -> E:
+        try:
+            return cls._web_value_dict[web_value]
+        except (KeyError, TypeError):
+            raise KeyError(f"{web_value} 不是 {cls.__name__} 的有效枚举值") from None
@@ -2,15 +2,14 @@
 海豚调度优先级枚举值
 """
 
-import enum
-from typing import Tuple
+from dolphin_sdk.objects.enum.ds_enum_base import DSEnumBase
 
 __all__ = [
     "DSPriority"
 ]
 
 
-class DSPriority(enum.Enum):
+class DSPriority(DSEnumBase):
     """海豚调度优先级枚举值
 
     适用字段：
@@ -35,16 +34,3 @@ class DSPriority(enum.Enum):
     MEDIUM = (2, "MEDIUM")  # Medium
     LOW = (3, "LOW")  # Low
     LOWEST = (4, "LOWEST")  # Lowest
-
-    def __new__(cls, db_value: int, web_value: str):
-        member = object.__new__(cls)
-        member.db_value = db_value  # 数据库中存储的值
-        member.web_value = web_value  # Web API 中的值
-        return member
-
-    @classmethod
-    def from_db_value(cls, db_value: int) -> "DSPriority":
-        for member in cls:
-            if member.db_value == db_value:
-                return member
-        raise KeyError(f"{db_value} 不是 {cls.__name__} 的有效枚举值")
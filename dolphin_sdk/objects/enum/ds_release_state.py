@@ -2,14 +2,14 @@
 海豚调度任务定义表 flag 字段的枚举值
 """
 
-import enum
+from dolphin_sdk.objects.enum.ds_enum_base import DSEnumBase
 
 __all__ = [
     "DSReleaseState"
 ]
 
 
-class DSReleaseState(enum.Enum):
+class DSReleaseState(DSEnumBase):
     """海豚调度的上线状态
 
     适用字段：
@@ -21,16 +21,3 @@ class DSReleaseState(enum.Enum):
 
     OFFLINE = (0, "OFFLINE")  # offline
     ONLINE = (1, "ONLINE")  # online
-
-    def __new__(cls, db_value: int, web_value: str):
-        member = object.__new__(cls)
-        member.db_value = db_value  # 数据库中存储的值
-        member.web_value = web_value  # Web API 中的值
-        return member
-
-    @classmethod
-    def from_db_value(cls, db_value: int) -> "DSReleaseState":
-        for member in cls:
-            if member.db_value == db_value:
-                return member
-        raise KeyError(f"{db_value} 不是 {cls.__name__} 的有效枚举值")
@@ -1,11 +1,11 @@
-import enum
+from dolphin_sdk.objects.enum.ds_enum_base import DSEnumBase
 
 __all__ = [
     "DSTaskType"
 ]
 
 
-class DSTaskType(enum.Enum):
+class DSTaskType(DSEnumBase):
     """海豚调度任务类型的枚举值"""
 
     CONDITIONS = ("CONDITIONS", "CONDITIONS")
@@ -14,18 +14,9 @@ class DSTaskType(enum.Enum):
     SPARK = ("SPARK", "SPARK")
     SQL = ("SQL", "SQL")
     FLINK = ("FLINK", "FLINK")
-    
-    UNKNOWN = (None, None)
-
-    def __new__(cls, db_value: int, web_value: str):
-        member = object.__new__(cls)
-        member.db_value = db_value  # 数据库中存储的值
-        member.web_value = web_value  # Web API 中的值
-        return member
+    PYTHON = ("PYTHON", "PYTHON")
+    DATAX = ("DATAX", "DATAX")
+    SUB_PROCESS = ("SUB_PROCESS", "SUB_PROCESS")
+    HTTP = ("HTTP", "HTTP")
 
-    @classmethod
-    def from_db_value(cls, db_value: int) -> "DSTaskType":
-        for member in cls:
-            if member.db_value == db_value:
-                return member
-        raise KeyError(f"{db_value} 不是 {cls.__name__} 的有效枚举值")
+    UNKNOWN = (None, None)
@@ -0,0 +1,152 @@
+"""
+字符串驻留池
+
+元数据中 worker_group、crontab、依赖项的 cycle / dateValue、Spark 的 deployMode 等字段在大量记录中只有少数几种取值，但每条记录
+解析时都会构造独立的字符串对象。驻留池在解码时将相同的字符串替换为池中的同一个对象，并统计节省的内存。
+"""
+
+import dataclasses
+import sys
+import threading
+from typing import Any, Callable, Dict, Tuple
+
+__all__ = [
+    "DSInternPoolStats",
+    "DSInternPool"
+]
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class DSInternPoolStats:
+    """驻留池的统计信息"""
+
+    # 池中不同字符串的数量
+    distinct_count: int = dataclasses.field(kw_only=True)
+
+    # 查找次数（不包括超过长度上限而未驻留的字符串）
+    lookup_count: int = dataclasses.field(kw_only=True)
+
+    # 被替换为池中对象的重复字符串数量
+    hit_count: int = dataclasses.field(kw_only=True)
+
+    # 被替换的重复字符串占用的内存（字节）
+    saved_bytes: int = dataclasses.field(kw_only=True)
+
+    # 池本身占用的内存（字节，包括哈希表和池中的字符串）
+    pool_bytes: int = dataclasses.field(kw_only=True)
+
+    @property
+    def net_saved_bytes(self) -> int:
+        """扣除池本身占用后节省的内存（字节）"""
+        return self.saved_bytes - self.pool_bytes
+
+
+class DSInternPool:
+    """字符串驻留池（线程安全）
+
+    只驻留长度不超过 max_length 的字符串：脚本、SQL 等长字符串通常各不相同，驻留只会增加池的大小。
+    """
+
+    def __init__(self, max_length: int = 64):
+        """
+
+        Parameters
+        ----------
+        max_length : int, default = 64
+            驻留的字符串的最大长度
+        """
+        self._max_length = max_length
+        self._pool: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._lookup_count = 0
+        self._hit_count = 0
+        self._saved_bytes = 0
+
+    def __getstate__(self):
+        return self._max_length, self._pool, self._lookup_count, self._hit_count, self._saved_bytes
+
+    def __setstate__(self, state):
+        self._max_length, self._pool, self._lookup_count, self._hit_count, self._saved_bytes = state
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._pool)
+
+    def intern(self, value: Any) -> Any:
+        """返回池中与 value 相等的字符串（value 不是字符串或超过长度上限时原样返回）"""
+        if type(value) is not str or len(value) > self._max_length:
+            return value
+        with self._lock:
+            self._lookup_count += 1
+            result = self._pool.setdefault(value, value)
+            if result is not value:
+                self._hit_count += 1
+                self._saved_bytes += sys.getsizeof(value)
+        return result
+
+    def intern_object(self, obj: Any) -> Any:
+        """递归地驻留对象中的字符串，返回驻留后的对象
+
+        字符串返回池中的对象；列表、字典（包括键）和数据类对象原地修改后返回原对象；其他对象原样返回。
+        """
+        if type(obj) is str:
+            return self.intern(obj)
+        if isinstance(obj, list):
+            for i, item in enumerate(obj):
+                obj[i] = self.intern_object(item)
+            return obj
+        if isinstance(obj, dict):
+            item_list = [(self.intern(key), self.intern_object(value)) for key, value in obj.items()]
+            obj.clear()
+            obj.update(item_list)
+            return obj
+        field_name_tuple = _get_dataclass_field_names(type(obj))
+        if field_name_tuple:
+            for name in field_name_tuple:
+                value = getattr(obj, name)
+                new_value = self.intern_object(value)
+                if new_value is not value:
+                    object.__setattr__(obj, name, new_value)  # 兼容 frozen 数据类
+        return obj
+
+    def wrap(self, decoder: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        """返回先调用 decoder 解码、再驻留结果中的字符串的函数（可以被 pickle）"""
+        return _InternDecoder(self, decoder)
+
+    def stats(self) -> DSInternPoolStats:
+        with self._lock:
+            return DSInternPoolStats(
+                distinct_count=len(self._pool),
+                lookup_count=self._lookup_count,
+                hit_count=self._hit_count,
+                saved_bytes=self._saved_bytes,
+                pool_bytes=sys.getsizeof(self._pool) + sum(sys.getsizeof(value) for value in self._pool)
+            )
+
+
+class _InternDecoder:
+    """先解码、再驻留结果中的字符串"""
+
+    __slots__ = ("pool", "decoder")
+
+    def __init__(self, pool: DSInternPool, decoder: Callable[[Any], Any]):
+        self.pool = pool
+        self.decoder = decoder
+
+    def __call__(self, value: Any) -> Any:
+        return self.pool.intern_object(self.decoder(value))
+
+
+# 类 -> 数据类字段名（非数据类为空元组）
+_FIELD_NAME_CACHE: Dict[type, Tuple[str, ...]] = {}
+
+
+def _get_dataclass_field_names(cls: type) -> Tuple[str, ...]:
+    field_name_tuple = _FIELD_NAME_CACHE.get(cls)
+    if field_name_tuple is None:
+        if dataclasses.is_dataclass(cls):
+            field_name_tuple = tuple(field.name for field in dataclasses.fields(cls))
+        else:
+            field_name_tuple = ()
+        _FIELD_NAME_CACHE[cls] = field_name_tuple
+    return field_name_tuple
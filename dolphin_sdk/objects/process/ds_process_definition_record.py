@@ -4,14 +4,19 @@
 
 import dataclasses
 import datetime
-from typing import Any, Dict, List, Optional
+import functools
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
+from dolphin_sdk.objects.base import DSRecordFieldSpec
 from dolphin_sdk.objects.base import ObjectBase
+from dolphin_sdk.objects.base import compile_record_decoder
+from dolphin_sdk.objects.base import get_record_field
 from dolphin_sdk.objects.common import DSLocation
 from dolphin_sdk.objects.common import create_ds_location_list_from_db_value
 from dolphin_sdk.objects.enum import DSProcessExecutionType
 from dolphin_sdk.objects.enum import DSReleaseState
 from dolphin_sdk.objects.process.ds_process_definition import DSProcessDefinition
+from dolphin_sdk.objects.intern import DSInternPool
 
 __all__ = [
     "DSProcessDefinitionRecord"
@@ -74,22 +79,72 @@ class DSProcessDefinitionRecord(DSProcessDefinition):
 
     @staticmethod
     def from_t_ds_process_definition_record(record: Dict[str, Any]) -> "DSProcessDefinitionRecord":
+        """根据 t_ds_process_definition 表记录的字典格式构造（查询时没有选择的字段为 UNLOADED）"""
         return DSProcessDefinitionRecord(
             id=record["id"],
             process_code=record["code"],
-            name=record["name"],
-            version=record["version"],
-            description=record["description"],
+            name=get_record_field(record, "name"),
+            version=get_record_field(record, "version"),
+            description=get_record_field(record, "description"),
             project_code=record["project_code"],
-            release_state=DSReleaseState.from_db_value(record["release_state"]),
-            user_id=record["user_id"],
-            global_params=record["global_params"],
-            flag=record["flag"],
-            locations=create_ds_location_list_from_db_value(record["locations"]),
-            warning_group_id=record["warning_group_id"],
-            timeout=record["timeout"],
-            tenant_id=record["tenant_id"],
-            execution_type=DSProcessExecutionType.from_db_value(record["execution_type"]),
-            create_time=record["create_time"],
-            update_time=record["update_time"],
+            release_state=get_record_field(record, "release_state", DSReleaseState.from_db_value),
+            user_id=get_record_field(record, "user_id"),
+            global_params=get_record_field(record, "global_params"),
+            flag=get_record_field(record, "flag"),
+            locations=get_record_field(record, "locations", create_ds_location_list_from_db_value),
+            warning_group_id=get_record_field(record, "warning_group_id"),
+            timeout=get_record_field(record, "timeout"),
+            tenant_id=get_record_field(record, "tenant_id"),
+            execution_type=get_record_field(record, "execution_type", DSProcessExecutionType.from_db_value),
+            create_time=get_record_field(record, "create_time"),
+            update_time=get_record_field(record, "update_time"),
         )
+
+    @staticmethod
+    def compile_row_decoder(
+            column_list: Sequence[str],
+            intern_pool: Optional[DSInternPool] = None
+    ) -> Callable[[tuple], "DSProcessDefinitionRecord"]:
+        """返回根据 t_ds_process_definition 表元组格式的查询结果构造记录的函数（column_list 为查询结果的字段名）
+
+        提供 intern_pool 时，取值较少的字符串字段会被驻留；未提供 intern_pool 时结果会被缓存。
+        """
+        if intern_pool is None:
+            return _compile_row_decoder(tuple(column_list))
+        return _build_row_decoder(tuple(column_list), intern_pool)
+
+
+_T_DS_PROCESS_DEFINITION_FIELD_SPEC_LIST: List[DSRecordFieldSpec] = [
+    ("id", "id", None),
+    ("process_code", "code", None),
+    ("name", "name", None),
+    ("version", "version", None),
+    ("description", "description", None),
+    ("project_code", "project_code", None),
+    ("release_state", "release_state", DSReleaseState.from_db_value),
+    ("user_id", "user_id", None),
+    ("global_params", "global_params", None),
+    ("flag", "flag", None),
+    ("locations", "locations", create_ds_location_list_from_db_value),
+    ("warning_group_id", "warning_group_id", None),
+    ("timeout", "timeout", None),
+    ("tenant_id", "tenant_id", None),
+    ("execution_type", "execution_type", DSProcessExecutionType.from_db_value),
+    ("create_time", "create_time", None),
+    ("update_time", "update_time", None),
+]
+
+
+# 需要驻留的字段（description 为自由文本，不驻留）
+_T_DS_PROCESS_DEFINITION_INTERN_FIELD_LIST = ["global_params"]
+
+
+def _build_row_decoder(column_list: Tuple[str, ...],
+                       intern_pool: Optional[DSInternPool] = None) -> Callable[[tuple], DSProcessDefinitionRecord]:
+    return compile_record_decoder(DSProcessDefinitionRecord, _T_DS_PROCESS_DEFINITION_FIELD_SPEC_LIST, column_list,
+                                  required_column_list=["id", "code", "project_code"],
+                                  intern=intern_pool.intern_object if intern_pool is not None else None,
+                                  intern_field_list=_T_DS_PROCESS_DEFINITION_INTERN_FIELD_LIST)
+
+
+_compile_row_decoder = functools.lru_cache(maxsize=64)(_build_row_decoder)
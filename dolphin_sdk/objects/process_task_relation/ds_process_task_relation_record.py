@@ -4,12 +4,16 @@
 
 import dataclasses
 import datetime
+import functools
 import json
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Sequence, Tuple
 from typing import Optional
 
+from dolphin_sdk.objects.base import DSRecordFieldSpec
 from dolphin_sdk.objects.base import ObjectBase
+from dolphin_sdk.objects.base import compile_record_decoder
 from dolphin_sdk.objects.enum import DSConditionType
+from dolphin_sdk.objects.intern import DSInternPool
 
 
 @dataclasses.dataclass(slots=True)
@@ -86,3 +90,49 @@ class DSProcessTaskRelationRecord(ObjectBase):
             "conditionType": self.condition_type,
             "conditionParams": self.condition_params,
         }
+
+    @staticmethod
+    def compile_row_decoder(
+            column_list: Sequence[str],
+            intern_pool: Optional[DSInternPool] = None
+    ) -> Callable[[tuple], "DSProcessTaskRelationRecord"]:
+        """返回根据 t_ds_process_task_relation 表元组格式的查询结果构造记录的函数（column_list 为查询结果的字段名）
+
+        提供 intern_pool 时，取值较少的字符串字段会被驻留；未提供 intern_pool 时结果会被缓存。
+        """
+        if intern_pool is None:
+            return _compile_row_decoder(tuple(column_list))
+        return _build_row_decoder(tuple(column_list), intern_pool)
+
+
+_T_DS_PROCESS_TASK_RELATION_FIELD_SPEC_LIST: List[DSRecordFieldSpec] = [
+    ("id", "id", None),
+    ("name", "name", None),
+    ("project_code", "project_code", None),
+    ("process_code", "process_definition_code", None),
+    ("process_version", "process_definition_version", None),
+    ("pre_task_code", "pre_task_code", None),
+    ("pre_task_version", "pre_task_version", None),
+    ("post_task_code", "post_task_code", None),
+    ("post_task_version", "post_task_version", None),
+    ("condition_type", "condition_type", DSConditionType.from_db_value),
+    ("condition_params", "condition_params", json.loads),
+    ("create_time", "create_time", None),
+    ("update_time", "update_time", None),
+]
+
+
+# 需要驻留的字段
+_T_DS_PROCESS_TASK_RELATION_INTERN_FIELD_LIST = ["name", "condition_params"]
+
+
+def _build_row_decoder(column_list: Tuple[str, ...],
+                       intern_pool: Optional[DSInternPool] = None) -> Callable[[tuple], DSProcessTaskRelationRecord]:
+    return compile_record_decoder(DSProcessTaskRelationRecord, _T_DS_PROCESS_TASK_RELATION_FIELD_SPEC_LIST, column_list,
+                                  required_column_list=[column for _, column, _
+                                                        in _T_DS_PROCESS_TASK_RELATION_FIELD_SPEC_LIST],
+                                  intern=intern_pool.intern_object if intern_pool is not None else None,
+                                  intern_field_list=_T_DS_PROCESS_TASK_RELATION_INTERN_FIELD_LIST)
+
+
+_compile_row_decoder = functools.lru_cache(maxsize=64)(_build_row_decoder)
@@ -4,10 +4,14 @@
 
 import dataclasses
 import datetime
-from typing import Any, Dict, Optional
+import functools
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
+from dolphin_sdk.objects.base import DSRecordFieldSpec
 from dolphin_sdk.objects.base import ObjectBase
+from dolphin_sdk.objects.base import compile_record_decoder
 from dolphin_sdk.objects.enum import DSAvailableFlag
+from dolphin_sdk.objects.intern import DSInternPool
 
 __all__ = [
     "DSProjectRecord"
@@ -55,3 +59,41 @@ class DSProjectRecord(ObjectBase):
             create_time=record_dict["create_time"],
             update_time=record_dict["update_time"],
         )
+
+    @staticmethod
+    def compile_row_decoder(column_list: Sequence[str],
+                            intern_pool: Optional[DSInternPool] = None) -> Callable[[tuple], "DSProjectRecord"]:
+        """返回根据 t_ds_project 表元组格式的查询结果构造记录的函数（column_list 为查询结果的字段名）
+
+        提供 intern_pool 时，取值较少的字符串字段会被驻留；未提供 intern_pool 时结果会被缓存。
+        """
+        if intern_pool is None:
+            return _compile_row_decoder(tuple(column_list))
+        return _build_row_decoder(tuple(column_list), intern_pool)
+
+
+_T_DS_PROJECT_FIELD_SPEC_LIST: List[DSRecordFieldSpec] = [
+    ("id", "id", None),
+    ("project_name", "name", None),
+    ("project_code", "code", None),
+    ("description", "description", None),
+    ("user_id", "user_id", None),
+    ("flag", "flag", DSAvailableFlag.from_db_value),
+    ("create_time", "create_time", None),
+    ("update_time", "update_time", None),
+]
+
+
+# 需要驻留的字段（项目表中没有取值较少的字符串字段，description 为自由文本，不驻留）
+_T_DS_PROJECT_INTERN_FIELD_LIST = []
+
+
+def _build_row_decoder(column_list: Tuple[str, ...],
+                       intern_pool: Optional[DSInternPool] = None) -> Callable[[tuple], DSProjectRecord]:
+    return compile_record_decoder(DSProjectRecord, _T_DS_PROJECT_FIELD_SPEC_LIST, column_list,
+                                  required_column_list=[column for _, column, _ in _T_DS_PROJECT_FIELD_SPEC_LIST],
+                                  intern=intern_pool.intern_object if intern_pool is not None else None,
+                                  intern_field_list=_T_DS_PROJECT_INTERN_FIELD_LIST)
+
+
+_compile_row_decoder = functools.lru_cache(maxsize=64)(_build_row_decoder)
@@ -4,10 +4,14 @@
 
 import dataclasses
 import datetime
-from typing import Any, Dict, Optional
+import functools
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
+from dolphin_sdk.objects.base import DSRecordFieldSpec
 from dolphin_sdk.objects.base import ObjectBase
+from dolphin_sdk.objects.base import compile_record_decoder
 from dolphin_sdk.objects.enum import DSReleaseState
+from dolphin_sdk.objects.intern import DSInternPool
 
 __all__ = [
     "DSScheduleRecord"
@@ -91,3 +95,49 @@ class DSScheduleRecord(ObjectBase):
             create_time=record["create_time"],
             update_time=record["update_time"],
         )
+
+    @staticmethod
+    def compile_row_decoder(column_list: Sequence[str],
+                            intern_pool: Optional[DSInternPool] = None) -> Callable[[tuple], "DSScheduleRecord"]:
+        """返回根据 t_ds_schedules 表元组格式的查询结果构造记录的函数（column_list 为查询结果的字段名）
+
+        提供 intern_pool 时，取值较少的字符串字段会被驻留；未提供 intern_pool 时结果会被缓存。
+        """
+        if intern_pool is None:
+            return _compile_row_decoder(tuple(column_list))
+        return _build_row_decoder(tuple(column_list), intern_pool)
+
+
+_T_DS_SCHEDULES_FIELD_SPEC_LIST: List[DSRecordFieldSpec] = [
+    ("id", "id", None),
+    ("process_code", "process_definition_code", None),
+    ("start_time", "start_time", None),
+    ("end_time", "end_time", None),
+    ("timezone_id", "timezone_id", None),
+    ("crontab", "crontab", None),
+    ("failure_strategy", "failure_strategy", None),
+    ("user_id", "user_id", None),
+    ("release_state", "release_state", DSReleaseState.from_db_value),
+    ("warning_type", "warning_type", None),
+    ("warning_group_id", "warning_group_id", None),
+    ("process_instance_priority", "process_instance_priority", None),
+    ("worker_group", "worker_group", None),
+    ("environment_code", "environment_code", None),
+    ("create_time", "create_time", None),
+    ("update_time", "update_time", None),
+]
+
+
+# 需要驻留的字段
+_T_DS_SCHEDULES_INTERN_FIELD_LIST = ["timezone_id", "crontab", "worker_group"]
+
+
+def _build_row_decoder(column_list: Tuple[str, ...],
+                       intern_pool: Optional[DSInternPool] = None) -> Callable[[tuple], DSScheduleRecord]:
+    return compile_record_decoder(DSScheduleRecord, _T_DS_SCHEDULES_FIELD_SPEC_LIST, column_list,
+                                  required_column_list=[column for _, column, _ in _T_DS_SCHEDULES_FIELD_SPEC_LIST],
+                                  intern=intern_pool.intern_object if intern_pool is not None else None,
+                                  intern_field_list=_T_DS_SCHEDULES_INTERN_FIELD_LIST)
+
+
+_compile_row_decoder = functools.lru_cache(maxsize=64)(_build_row_decoder)
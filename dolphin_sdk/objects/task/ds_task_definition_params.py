@@ -18,6 +18,10 @@ __all__ = [
     "DSTaskDefinitionParamsSpark",
     "DSTaskDefinitionParamsSql",
     "DSTaskDefinitionParamsFlink",
+    "DSTaskDefinitionParamsPython",
+    "DSTaskDefinitionParamsDataX",
+    "DSTaskDefinitionParamsSubProcess",
+    "DSTaskDefinitionParamsHttp",
 ]
 
 
@@ -113,7 +117,7 @@ class DSTaskDefinitionParamsShell(DSTaskDefinitionParams):
             raw_script=data["rawScript"],
             local_params=data["localParams"],
             resource_list=data["resourceList"],
-            script_version=data.get("scriptVersion"),
+            script_version=data.get("scriptVersion", 0),
         )
 
     def to_json(self) -> dict:
@@ -377,3 +381,168 @@ class DSTaskDefinitionParamsFlink(DSTaskDefinitionParams):
             "taskManager": self.task_manager,
             "parallelism": self.parallelism
         }
+
+
+@dataclasses.dataclass(slots=True)
+class DSTaskDefinitionParamsPython(DSTaskDefinitionParams):
+    """海豚 PYTHON 类型任务的任务定义的参数"""
+
+    raw_script: str = dataclasses.field(kw_only=True)
+    local_params: list = dataclasses.field(kw_only=True, default_factory=lambda: [])
+    resource_list: list = dataclasses.field(kw_only=True, default_factory=lambda: [])
+
+    @staticmethod
+    def from_t_ds_task_definition_record(string: str) -> "DSTaskDefinitionParamsPython":
+        data = json.loads(string)
+        return DSTaskDefinitionParamsPython(
+            raw_script=data["rawScript"],
+            local_params=data.get("localParams", []),
+            resource_list=data.get("resourceList", []),
+        )
+
+    def to_json(self) -> dict:
+        return {
+            "rawScript": self.raw_script,
+            "localParams": self.local_params,
+            "resourceList": self.resource_list,
+        }
+
+
+@dataclasses.dataclass(slots=True)
+class DSTaskDefinitionParamsDataX(DSTaskDefinitionParams):
+    """海豚 DATAX 类型任务的任务定义的参数（custom_config 为 1 时使用 custom_json 中的自定义配置，其余同步配置字段无效）"""
+
+    local_params: list = dataclasses.field(kw_only=True, default_factory=lambda: [])
+    resource_list: list = dataclasses.field(kw_only=True, default_factory=lambda: [])
+    custom_config: int = dataclasses.field(kw_only=True, default=0)
+    custom_json: Optional[str] = dataclasses.field(kw_only=True, default=None)
+    ds_type: Optional[str] = dataclasses.field(kw_only=True, default=None)
+    data_source: Optional[int] = dataclasses.field(kw_only=True, default=None)
+    dt_type: Optional[str] = dataclasses.field(kw_only=True, default=None)
+    data_target: Optional[int] = dataclasses.field(kw_only=True, default=None)
+    sql: Optional[str] = dataclasses.field(kw_only=True, default=None)
+    target_table: Optional[str] = dataclasses.field(kw_only=True, default=None)
+    pre_statements: Optional[List[str]] = dataclasses.field(kw_only=True, default=None)
+    post_statements: Optional[List[str]] = dataclasses.field(kw_only=True, default=None)
+    job_speed_byte: Optional[int] = dataclasses.field(kw_only=True, default=None)
+    job_speed_record: Optional[int] = dataclasses.field(kw_only=True, default=None)
+    xms: Optional[int] = dataclasses.field(kw_only=True, default=None)
+    xmx: Optional[int] = dataclasses.field(kw_only=True, default=None)
+
+    @staticmethod
+    def from_t_ds_task_definition_record(string: str) -> "DSTaskDefinitionParamsDataX":
+        data = json.loads(string)
+        return DSTaskDefinitionParamsDataX(
+            local_params=data.get("localParams", []),
+            resource_list=data.get("resourceList", []),
+            custom_config=data.get("customConfig", 0),
+            custom_json=data.get("json"),
+            ds_type=data.get("dsType"),
+            data_source=data.get("dataSource"),
+            dt_type=data.get("dtType"),
+            data_target=data.get("dataTarget"),
+            sql=data.get("sql"),
+            target_table=data.get("targetTable"),
+            pre_statements=data.get("preStatements"),
+            post_statements=data.get("postStatements"),
+            job_speed_byte=data.get("jobSpeedByte"),
+            job_speed_record=data.get("jobSpeedRecord"),
+            xms=data.get("xms"),
+            xmx=data.get("xmx"),
+        )
+
+    def to_json(self) -> dict:
+        if self.custom_config == 1:
+            return {
+                "localParams": self.local_params,
+                "resourceList": self.resource_list,
+                "customConfig": self.custom_config,
+                "json": self.custom_json,
+                "xms": self.xms,
+                "xmx": self.xmx,
+            }
+        return {
+            "localParams": self.local_params,
+            "resourceList": self.resource_list,
+            "customConfig": self.custom_config,
+            "dsType": self.ds_type,
+            "dataSource": self.data_source,
+            "dtType": self.dt_type,
+            "dataTarget": self.data_target,
+            "sql": self.sql,
+            "targetTable": self.target_table,
+            "preStatements": self.pre_statements,
+            "postStatements": self.post_statements,
+            "jobSpeedByte": self.job_speed_byte,
+            "jobSpeedRecord": self.job_speed_record,
+            "xms": self.xms,
+            "xmx": self.xmx,
+        }
+
+
+@dataclasses.dataclass(slots=True)
+class DSTaskDefinitionParamsSubProcess(DSTaskDefinitionParams):
+    """海豚 SUB_PROCESS 类型任务的任务定义的参数"""
+
+    process_definition_code: int = dataclasses.field(kw_only=True)
+    local_params: list = dataclasses.field(kw_only=True, default_factory=lambda: [])
+    resource_list: list = dataclasses.field(kw_only=True, default_factory=lambda: [])
+
+    @staticmethod
+    def from_t_ds_task_definition_record(string: str) -> "DSTaskDefinitionParamsSubProcess":
+        data = json.loads(string)
+        return DSTaskDefinitionParamsSubProcess(
+            process_definition_code=data["processDefinitionCode"],
+            local_params=data.get("localParams", []),
+            resource_list=data.get("resourceList", []),
+        )
+
+    def to_json(self) -> dict:
+        return {
+            "processDefinitionCode": self.process_definition_code,
+            "localParams": self.local_params,
+            "resourceList": self.resource_list,
+        }
+
+
+@dataclasses.dataclass(slots=True)
+class DSTaskDefinitionParamsHttp(DSTaskDefinitionParams):
+    """海豚 HTTP 类型任务的任务定义的参数"""
+
+    url: str = dataclasses.field(kw_only=True)
+    http_method: str = dataclasses.field(kw_only=True, default="GET")
+    http_params: list = dataclasses.field(kw_only=True, default_factory=lambda: [])
+    http_check_condition: str = dataclasses.field(kw_only=True, default="STATUS_CODE_DEFAULT")
+    condition: Optional[str] = dataclasses.field(kw_only=True, default=None)
+    connect_timeout: int = dataclasses.field(kw_only=True, default=60000)
+    socket_timeout: int = dataclasses.field(kw_only=True, default=60000)
+    local_params: list = dataclasses.field(kw_only=True, default_factory=lambda: [])
+    resource_list: list = dataclasses.field(kw_only=True, default_factory=lambda: [])
+
+    @staticmethod
+    def from_t_ds_task_definition_record(string: str) -> "DSTaskDefinitionParamsHttp":
+        data = json.loads(string)
+        return DSTaskDefinitionParamsHttp(
+            url=data["url"],
+            http_method=data.get("httpMethod", "GET"),
+            http_params=data.get("httpParams", []),
+            http_check_condition=data.get("httpCheckCondition", "STATUS_CODE_DEFAULT"),
+            condition=data.get("condition"),
+            connect_timeout=data.get("connectTimeout", 60000),
+            socket_timeout=data.get("socketTimeout", 60000),
+            local_params=data.get("localParams", []),
+            resource_list=data.get("resourceList", []),
+        )
+
+    def to_json(self) -> dict:
+        return {
+            "url": self.url,
+            "httpMethod": self.http_method,
+            "httpParams": self.http_params,
+            "httpCheckCondition": self.http_check_condition,
+            "condition": self.condition,
+            "connectTimeout": self.connect_timeout,
+            "socketTimeout": self.socket_timeout,
+            "localParams": self.local_params,
+            "resourceList": self.resource_list,
+        }
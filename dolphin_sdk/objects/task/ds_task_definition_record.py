@@ -3,23 +3,36 @@
 """
 
 import abc
+import collections
 import dataclasses
 import datetime
-from typing import Any, Dict, Optional
-
+import functools
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
+
+from dolphin_sdk.objects.base import DSRecordFieldSpec
+from dolphin_sdk.objects.base import LazySlotDescriptor
+from dolphin_sdk.objects.base import LazyValue
+from dolphin_sdk.objects.base import compile_record_decoder
+from dolphin_sdk.objects.base import get_record_field
 from dolphin_sdk.objects.enum import DSPriority
 from dolphin_sdk.objects.enum import DSTaskExecuteType
 from dolphin_sdk.objects.enum import DSAvailableFlag
 from dolphin_sdk.objects.enum import DSTaskType
 from dolphin_sdk.objects.enum import DSTimeoutFlag
+from dolphin_sdk.objects.intern import DSInternPool
 from dolphin_sdk.objects.task.ds_task_definition import DSTaskDefinition
 from dolphin_sdk.objects.task.ds_task_definition_params import DSTaskDefinitionParams
 from dolphin_sdk.objects.task.ds_task_definition_params import DSTaskDefinitionParamsConditions
+from dolphin_sdk.objects.task.ds_task_definition_params import DSTaskDefinitionParamsDataX
 from dolphin_sdk.objects.task.ds_task_definition_params import DSTaskDefinitionParamsDependent
 from dolphin_sdk.objects.task.ds_task_definition_params import DSTaskDefinitionParamsFlink
+from dolphin_sdk.objects.task.ds_task_definition_params import DSTaskDefinitionParamsHttp
+from dolphin_sdk.objects.task.ds_task_definition_params import DSTaskDefinitionParamsPython
 from dolphin_sdk.objects.task.ds_task_definition_params import DSTaskDefinitionParamsShell
 from dolphin_sdk.objects.task.ds_task_definition_params import DSTaskDefinitionParamsSpark
 from dolphin_sdk.objects.task.ds_task_definition_params import DSTaskDefinitionParamsSql
+from dolphin_sdk.objects.task.ds_task_definition_params import DSTaskDefinitionParamsSubProcess
 
 __all__ = [
     "DSTaskDefinitionRecord",
@@ -29,6 +42,14 @@ __all__ = [
     "DSTaskDefinitionRecordShell",
     "DSTaskDefinitionRecordSpark",
     "DSTaskDefinitionRecordSql",
+    "DSTaskDefinitionRecordPython",
+    "DSTaskDefinitionRecordDataX",
+    "DSTaskDefinitionRecordSubProcess",
+    "DSTaskDefinitionRecordHttp",
+    "DSTaskDefinitionRecordUnknown",
+    "register_task_type",
+    "get_unknown_task_type_count",
+    "reset_unknown_task_type_count",
 ]
 
 
@@ -45,6 +66,8 @@ class DSTaskDefinitionRecord(DSTaskDefinition):
     用途：
     1. 作为海豚调度任务定义表查询结果的返回值
     2. 用于构造海豚调度任务定义表的插入逻辑
+
+    从 t_ds_task_definition 表记录构造时，task_params 默认延迟解析：保存原始字符串，在第一次访问时解析为对应类型的任务参数并缓存。
     """
 
     # self-increasing id（在构造时不需要）
@@ -124,6 +147,23 @@ class DSTaskDefinitionRecord(DSTaskDefinition):
     def task_type(self) -> DSTaskType:
         """任务类型"""
 
+    @property
+    def is_task_params_decoded(self) -> bool:
+        """task_params 是否已经解析"""
+        return type(_TASK_PARAMS_DESCRIPTOR.get_raw(self)) is not LazyValue
+
+    @property
+    def task_params_raw(self) -> Optional[str]:
+        """尚未解析的 task_params 原始字符串（已解析时为 None）"""
+        value = _TASK_PARAMS_DESCRIPTOR.get_raw(self)
+        return value.raw if type(value) is LazyValue else None
+
+    def replace(self, **changes) -> "DSTaskDefinitionRecord":
+        """同 dataclasses.replace，但不会触发尚未解析的 task_params 的解析"""
+        if "task_params" not in changes:
+            changes["task_params"] = _TASK_PARAMS_DESCRIPTOR.get_raw(self)
+        return dataclasses.replace(self, **changes)
+
     def to_json(self) -> dict:
         return {
             "code": self.task_code,
@@ -148,66 +188,95 @@ class DSTaskDefinitionRecord(DSTaskDefinition):
 
     @staticmethod
     def from_t_ds_task_definition_record(record: Dict[str, Any],
-                                         process_code: Optional[int] = None) -> "DSTaskDefinitionRecord":
+                                         process_code: Optional[int] = None,
+                                         eager: bool = False) -> "DSTaskDefinitionRecord":
+        """根据 t_ds_task_definition 表记录的字典格式构造（查询时没有选择的字段为 UNLOADED；task_type 字段必须选择）
+
+        Parameters
+        ----------
+        record : Dict[str, Any]
+            t_ds_task_definition 表记录
+        process_code : Optional[int], default = None
+            任务所属的工作流编号
+        eager : bool, default = False
+            是否在构造时立即解析 task_params；为 False 时在第一次访问 task_params 时解析
+        """
         default_params = dict(
             id=record["id"],
             task_code=record["code"],
             process_code=process_code,
-            name=record["name"],
-            version=record["version"],
-            description=record["description"],
+            name=get_record_field(record, "name"),
+            version=get_record_field(record, "version"),
+            description=get_record_field(record, "description"),
             project_code=record["project_code"],
-            user_id=record["user_id"],
-            task_execute_type=DSTaskExecuteType.from_db_value(record["task_execute_type"]),
-            flag=DSAvailableFlag.from_db_value(record["flag"]),
-            task_priority=DSPriority.from_db_value(record["task_priority"]),
-            worker_group=record["worker_group"],
-            environment_code=record["environment_code"],
-            fail_retry_times=record["fail_retry_times"],
-            fail_retry_interval=record["fail_retry_interval"],
-            timeout_flag=DSTimeoutFlag.from_db_value(record["timeout_flag"]),
-            timeout_notify_strategy=record["timeout_notify_strategy"],
-            timeout=record["timeout"],
-            delay_time=record["delay_time"],
-            resource_ids=record["resource_ids"],
-            task_group_id=record["task_group_id"],
-            task_group_priority=record["task_group_priority"],
-            cpu_quota=record["cpu_quota"],
-            memory_max=record["memory_max"],
-            create_time=record["create_time"],
-            update_time=record["update_time"],
+            user_id=get_record_field(record, "user_id"),
+            task_execute_type=get_record_field(record, "task_execute_type", DSTaskExecuteType.from_db_value),
+            flag=get_record_field(record, "flag", DSAvailableFlag.from_db_value),
+            task_priority=get_record_field(record, "task_priority", DSPriority.from_db_value),
+            worker_group=get_record_field(record, "worker_group"),
+            environment_code=get_record_field(record, "environment_code"),
+            fail_retry_times=get_record_field(record, "fail_retry_times"),
+            fail_retry_interval=get_record_field(record, "fail_retry_interval"),
+            timeout_flag=get_record_field(record, "timeout_flag", DSTimeoutFlag.from_db_value),
+            timeout_notify_strategy=get_record_field(record, "timeout_notify_strategy"),
+            timeout=get_record_field(record, "timeout"),
+            delay_time=get_record_field(record, "delay_time"),
+            resource_ids=get_record_field(record, "resource_ids"),
+            task_group_id=get_record_field(record, "task_group_id"),
+            task_group_priority=get_record_field(record, "task_group_priority"),
+            cpu_quota=get_record_field(record, "cpu_quota"),
+            memory_max=get_record_field(record, "memory_max"),
+            create_time=get_record_field(record, "create_time"),
+            update_time=get_record_field(record, "update_time"),
         )
 
         task_type = record["task_type"]
-        if task_type == "CONDITIONS":
-            task_params = DSTaskDefinitionParamsConditions.from_t_ds_task_definition_record(record["task_params"])
-            default_params["task_params"] = task_params
-            return DSTaskDefinitionRecordConditions(**default_params)
-        elif task_type == "DEPENDENT":
-            task_params = DSTaskDefinitionParamsDependent.from_t_ds_task_definition_record(record["task_params"])
-            default_params["task_params"] = task_params
-            return DSTaskDefinitionRecordDependent(**default_params)
-        elif task_type == "FLINK":
-            task_params = DSTaskDefinitionParamsFlink.from_t_ds_task_definition_record(record["task_params"])
-            default_params["task_params"] = task_params
-            return DSTaskDefinitionRecordFlink(**default_params)
-        elif task_type == "SHELL":
-            task_params = DSTaskDefinitionParamsShell.from_t_ds_task_definition_record(record["task_params"])
-            default_params["task_params"] = task_params
-            return DSTaskDefinitionRecordShell(**default_params)
-        elif task_type == "SPARK":
-            task_params = DSTaskDefinitionParamsSpark.from_t_ds_task_definition_record(record["task_params"])
-            default_params["task_params"] = task_params
-            return DSTaskDefinitionRecordSpark(**default_params)
-        elif task_type == "SQL":
-            task_params = DSTaskDefinitionParamsSql.from_t_ds_task_definition_record(record["task_params"])
-            default_params["task_params"] = task_params
-            return DSTaskDefinitionRecordSql(**default_params)
-        else:
-            print(f"暂未定义的海豚任务类型: {task_type}")
-            default_params["task_params"] = None
-
-        return DSTaskDefinitionRecordUnknown(**default_params)
+        if task_type in _TASK_RECORD_CLASS_DICT:
+            record_class, params_class = _TASK_RECORD_CLASS_DICT[task_type]
+            params_decoder = params_class.from_t_ds_task_definition_record
+            default_params["task_params"] = _get_task_params(record, params_decoder, eager)
+            return record_class(**default_params)
+
+        _count_unknown_task_type(task_type)
+        default_params["task_params"] = get_record_field(record, "task_params", lambda value: None)
+        return DSTaskDefinitionRecordUnknown(raw_task_type=task_type, **default_params)
+
+    @staticmethod
+    def compile_row_decoder(
+            column_list: Sequence[str],
+            eager: bool = False,
+            intern_pool: Optional[DSInternPool] = None,
+            count_unknown: bool = True
+    ) -> Callable[[tuple, Optional[int]], "DSTaskDefinitionRecord"]:
+        """返回根据 t_ds_task_definition 表元组格式的查询结果构造记录的函数（未提供 intern_pool 时结果会被缓存）
+
+        返回的函数接收元组格式的记录和任务所属的工作流编号，按 task_type 字段选择对应类型的记录类。
+
+        Parameters
+        ----------
+        column_list : Sequence[str]
+            查询结果的字段名（必须包含 task_type 字段）
+        eager : bool, default = False
+            是否在构造时立即解析 task_params
+        intern_pool : Optional[DSInternPool], default = None
+            字符串驻留池；提供时驻留取值较少的字符串字段，以及解析后的 task_params 中的字符串
+        count_unknown : bool, default = True
+            是否将未注册的任务类型计入 get_unknown_task_type_count（根据已读取过的记录重新构造记录对象时应为 False，避免重复计数）
+        """
+        if intern_pool is None:
+            return _compile_row_decoder(tuple(column_list), eager, count_unknown=count_unknown)
+        return _build_row_decoder(tuple(column_list), eager, intern_pool, count_unknown=count_unknown)
+
+
+LazySlotDescriptor.install(DSTaskDefinitionRecord, "task_params")
+_TASK_PARAMS_DESCRIPTOR: LazySlotDescriptor = DSTaskDefinitionRecord.__dict__["task_params"]
+
+
+def _get_task_params(record: Dict[str, Any], decoder: Callable[[str], DSTaskDefinitionParams], eager: bool) -> Any:
+    """读取查询结果中的 task_params 字段：eager 为 False 时返回延迟解析的 LazyValue"""
+    if eager is True:
+        return get_record_field(record, "task_params", decoder)
+    return get_record_field(record, "task_params", lambda value: LazyValue(value, decoder))
 
 
 @dataclasses.dataclass(slots=True, frozen=True, eq=True)
@@ -276,12 +345,203 @@ class DSTaskDefinitionRecordSql(DSTaskDefinitionRecord):
         return DSTaskType.SQL
 
 
+@dataclasses.dataclass(slots=True, frozen=True, eq=True)
+class DSTaskDefinitionRecordPython(DSTaskDefinitionRecord):
+    """海豚调度 PYTHON 类型任务定义详情节点"""
+
+    task_params: DSTaskDefinitionParamsPython = dataclasses.field(kw_only=True)
+
+    @property
+    def task_type(self) -> DSTaskType:
+        return DSTaskType.PYTHON
+
+
+@dataclasses.dataclass(slots=True, frozen=True, eq=True)
+class DSTaskDefinitionRecordDataX(DSTaskDefinitionRecord):
+    """海豚调度 DATAX 类型任务定义详情节点"""
+
+    task_params: DSTaskDefinitionParamsDataX = dataclasses.field(kw_only=True)
+
+    @property
+    def task_type(self) -> DSTaskType:
+        return DSTaskType.DATAX
+
+
+@dataclasses.dataclass(slots=True, frozen=True, eq=True)
+class DSTaskDefinitionRecordSubProcess(DSTaskDefinitionRecord):
+    """海豚调度 SUB_PROCESS 类型任务定义详情节点"""
+
+    task_params: DSTaskDefinitionParamsSubProcess = dataclasses.field(kw_only=True)
+
+    @property
+    def task_type(self) -> DSTaskType:
+        return DSTaskType.SUB_PROCESS
+
+
+@dataclasses.dataclass(slots=True, frozen=True, eq=True)
+class DSTaskDefinitionRecordHttp(DSTaskDefinitionRecord):
+    """海豚调度 HTTP 类型任务定义详情节点"""
+
+    task_params: DSTaskDefinitionParamsHttp = dataclasses.field(kw_only=True)
+
+    @property
+    def task_type(self) -> DSTaskType:
+        return DSTaskType.HTTP
+
+
 @dataclasses.dataclass(slots=True, frozen=True, eq=True)
 class DSTaskDefinitionRecordUnknown(DSTaskDefinitionRecord):
     """海豚调度未知类型任务定义详情节点"""
 
     task_params: DSTaskDefinitionParams = dataclasses.field(kw_only=True)
 
+    # t_ds_task_definition 表中 task_type 字段的原始值（task_type 属性为 DSTaskType.UNKNOWN，无法区分不同的未注册类型）
+    raw_task_type: Optional[str] = dataclasses.field(kw_only=True, default=None)
+
     @property
     def task_type(self) -> DSTaskType:
         return DSTaskType.UNKNOWN
+
+
+# 任务类型（t_ds_task_definition.task_type）到（记录类，任务参数类）的映射
+_TASK_RECORD_CLASS_DICT: Dict[str, Tuple[Type[DSTaskDefinitionRecord], Type[DSTaskDefinitionParams]]] = {}
+
+# 未注册的任务类型到出现次数的映射
+_UNKNOWN_TASK_TYPE_COUNTER: collections.Counter = collections.Counter()
+_UNKNOWN_TASK_TYPE_LOCK = threading.Lock()
+
+
+def register_task_type(task_type: str,
+                       record_class: Type[DSTaskDefinitionRecord],
+                       params_class: Type[DSTaskDefinitionParams]) -> None:
+    """注册任务类型：构造记录对象时，task_type 字段等于 task_type 的记录使用 record_class 构造，task_params 使用 params_class 解析
+
+    重复注册同一个任务类型时覆盖之前的注册。未注册的任务类型使用 DSTaskDefinitionRecordUnknown 构造，并计入
+    get_unknown_task_type_count 的结果。
+
+    Parameters
+    ----------
+    task_type : str
+        t_ds_task_definition 表中 task_type 字段的值
+    record_class : Type[DSTaskDefinitionRecord]
+        记录类
+    params_class : Type[DSTaskDefinitionParams]
+        任务参数类
+    """
+    if not issubclass(record_class, DSTaskDefinitionRecord):
+        raise ValueError(f"{record_class.__name__} 不是 DSTaskDefinitionRecord 的子类")
+    if not issubclass(params_class, DSTaskDefinitionParams):
+        raise ValueError(f"{params_class.__name__} 不是 DSTaskDefinitionParams 的子类")
+    _TASK_RECORD_CLASS_DICT[task_type] = (record_class, params_class)
+    _compile_row_decoder.cache_clear()  # 已生成的构造函数中不包含新注册的任务类型
+
+
+def get_unknown_task_type_count() -> Dict[str, int]:
+    """返回构造记录对象时遇到的未注册任务类型及其出现次数"""
+    with _UNKNOWN_TASK_TYPE_LOCK:
+        return dict(_UNKNOWN_TASK_TYPE_COUNTER)
+
+
+def reset_unknown_task_type_count() -> None:
+    """清空未注册任务类型的计数"""
+    with _UNKNOWN_TASK_TYPE_LOCK:
+        _UNKNOWN_TASK_TYPE_COUNTER.clear()
+
+
+def _count_unknown_task_type(task_type: str) -> None:
+    with _UNKNOWN_TASK_TYPE_LOCK:
+        _UNKNOWN_TASK_TYPE_COUNTER[task_type] += 1
+
+
+# t_ds_task_definition 表中除 task_type 和 task_params 以外的字段
+_T_DS_TASK_DEFINITION_FIELD_SPEC_LIST: List[DSRecordFieldSpec] = [
+    ("id", "id", None),
+    ("task_code", "code", None),
+    ("name", "name", None),
+    ("version", "version", None),
+    ("description", "description", None),
+    ("project_code", "project_code", None),
+    ("user_id", "user_id", None),
+    ("task_execute_type", "task_execute_type", DSTaskExecuteType.from_db_value),
+    ("flag", "flag", DSAvailableFlag.from_db_value),
+    ("task_priority", "task_priority", DSPriority.from_db_value),
+    ("worker_group", "worker_group", None),
+    ("environment_code", "environment_code", None),
+    ("fail_retry_times", "fail_retry_times", None),
+    ("fail_retry_interval", "fail_retry_interval", None),
+    ("timeout_flag", "timeout_flag", DSTimeoutFlag.from_db_value),
+    ("timeout_notify_strategy", "timeout_notify_strategy", None),
+    ("timeout", "timeout", None),
+    ("delay_time", "delay_time", None),
+    ("resource_ids", "resource_ids", None),
+    ("task_group_id", "task_group_id", None),
+    ("task_group_priority", "task_group_priority", None),
+    ("cpu_quota", "cpu_quota", None),
+    ("memory_max", "memory_max", None),
+    ("create_time", "create_time", None),
+    ("update_time", "update_time", None),
+]
+
+
+# 需要驻留的字段（只驻留取值较少的字段；description 为自由文本，resource_ids 通常为空或各不相同，驻留只会增加池的大小）
+_T_DS_TASK_DEFINITION_INTERN_FIELD_LIST = ["worker_group", "timeout_notify_strategy"]
+
+
+def _build_row_decoder(column_list: Tuple[str, ...],
+                       eager: bool,
+                       intern_pool: Optional[DSInternPool] = None,
+                       count_unknown: bool = True
+                       ) -> Callable[[tuple, Optional[int]], DSTaskDefinitionRecord]:
+    """为每种任务类型生成构造函数，并按 task_type 字段分派"""
+
+    def compile_one(record_class: Type[DSTaskDefinitionRecord],
+                    params_decoder: Callable[[str], Any],
+                    extra_field_spec_list: Sequence[DSRecordFieldSpec] = ()
+                    ) -> Callable[[tuple, Optional[int]], DSTaskDefinitionRecord]:
+        return compile_record_decoder(
+            record_class,
+            _T_DS_TASK_DEFINITION_FIELD_SPEC_LIST + [("task_params", "task_params", params_decoder),
+                                                     *extra_field_spec_list],
+            column_list,
+            required_column_list=["id", "code", "project_code", "task_type"],
+            extra_arg_list=["process_code"],
+            intern=intern_pool.intern if intern_pool is not None else None,
+            intern_field_list=_T_DS_TASK_DEFINITION_INTERN_FIELD_LIST
+        )
+
+    decoder_dict = {}
+    for task_type, (record_class, params_class) in _TASK_RECORD_CLASS_DICT.items():
+        params_decoder = params_class.from_t_ds_task_definition_record
+        if intern_pool is not None:
+            params_decoder = intern_pool.wrap(params_decoder)
+        if eager is False:
+            params_decoder = functools.partial(LazyValue, decoder=params_decoder)
+        decoder_dict[task_type] = compile_one(record_class, params_decoder)
+    unknown_decoder = compile_one(DSTaskDefinitionRecordUnknown, lambda value: None,
+                                  [("raw_task_type", "task_type", None)])
+    task_type_position = column_list.index("task_type")
+
+    def decode(row: tuple, process_code: Optional[int] = None) -> DSTaskDefinitionRecord:
+        decoder = decoder_dict.get(row[task_type_position])
+        if decoder is None:
+            if count_unknown is True:
+                _count_unknown_task_type(row[task_type_position])
+            return unknown_decoder(row, process_code)
+        return decoder(row, process_code)
+
+    return decode
+
+
+_compile_row_decoder = functools.lru_cache(maxsize=64)(_build_row_decoder)
+
+
+register_task_type("CONDITIONS", DSTaskDefinitionRecordConditions, DSTaskDefinitionParamsConditions)
+register_task_type("DEPENDENT", DSTaskDefinitionRecordDependent, DSTaskDefinitionParamsDependent)
+register_task_type("FLINK", DSTaskDefinitionRecordFlink, DSTaskDefinitionParamsFlink)
+register_task_type("SHELL", DSTaskDefinitionRecordShell, DSTaskDefinitionParamsShell)
+register_task_type("SPARK", DSTaskDefinitionRecordSpark, DSTaskDefinitionParamsSpark)
+register_task_type("SQL", DSTaskDefinitionRecordSql, DSTaskDefinitionParamsSql)
+register_task_type("PYTHON", DSTaskDefinitionRecordPython, DSTaskDefinitionParamsPython)
+register_task_type("DATAX", DSTaskDefinitionRecordDataX, DSTaskDefinitionParamsDataX)
+register_task_type("SUB_PROCESS", DSTaskDefinitionRecordSubProcess, DSTaskDefinitionParamsSubProcess)
+register_task_type("HTTP", DSTaskDefinitionRecordHttp, DSTaskDefinitionParamsHttp)
@@ -2,10 +2,18 @@
 基于海豚调度 Web API 的 SDK
 """
 
-from typing import List
+import threading
+import time
+from typing import Iterable, List, Optional
 
 import requests
+import requests.adapters
 
+from dolphin_sdk.common import DSRateLimiter
+from dolphin_sdk.common import DSReadCache
+from dolphin_sdk.common import DSRequestEvent
+from dolphin_sdk.common import DSRequestHook
+from dolphin_sdk.common import dispatch_request_event
 from dolphin_sdk.form import DSPostSchedulesForm
 from dolphin_sdk.form import DSStartProcessInstanceForm
 from dolphin_sdk.form import PostProcessDefinitionForm
@@ -17,6 +25,23 @@ __all__ = [
 ]
 
 
+# 接口模板（用于请求埋点的接口维度，以及只读请求缓存的键和过期时间配置）
+ENDPOINT_PROCESS_DEFINITION_LIST = "/projects/{project_code}/process-definition"
+ENDPOINT_PROCESS_DEFINITION = "/projects/{project_code}/process-definition/{code}"
+ENDPOINT_PROCESS_DEFINITION_VERIFY_NAME = "/projects/{project_code}/process-definition/verify-name"
+ENDPOINT_PROCESS_DEFINITION_RELEASE = "/projects/{project_code}/process-definition/{code}/release"
+ENDPOINT_TASK_DEFINITION_GEN_TASK_CODES = "/projects/{project_code}/task-definition/gen-task-codes"
+ENDPOINT_START_PROCESS_INSTANCE = "/projects/{project_code}/executors/start-process-instance"
+ENDPOINT_SCHEDULES = "/projects/{project_code}/schedules"
+ENDPOINT_SCHEDULES_ONLINE = "/projects/{project_code}/schedules/{id}/online"
+ENDPOINT_SCHEDULES_OFFLINE = "/projects/{project_code}/schedules/{id}/offline"
+
+
+def _url(endpoint: str, **path_params) -> str:
+    """将接口模板填充为请求路径"""
+    return "/dolphinscheduler" + endpoint.format(**path_params)
+
+
 class DolphinApiError(Exception):
     """海豚 API 请求异常"""
     pass
@@ -25,9 +50,66 @@ class DolphinApiError(Exception):
 class DolphinWebSdk:
     """基于海豚调度 Web API 的 SDK"""
 
-    def __init__(self, base_url: str, token: str):
+    def __init__(self, base_url: str, token: str,
+                 pool_connections: int = 10,
+                 pool_maxsize: int = 10,
+                 connect_timeout: Optional[float] = 10.0,
+                 read_timeout: Optional[float] = 60.0,
+                 max_retries: int = 0,
+                 read_cache: Optional[DSReadCache] = None,
+                 hooks: Optional[Iterable[DSRequestHook]] = None,
+                 rate_limiter: Optional[DSRateLimiter] = None):
+        """
+
+        Parameters
+        ----------
+        base_url : str
+            海豚调度 Web 服务地址
+        token : str
+            海豚调度的安全令牌
+        pool_connections : int, default = 10
+            连接池缓存的 Host 数量
+        pool_maxsize : int, default = 10
+            每个 Host 最多保持的长连接数量（多线程并发请求时应不小于线程数）
+        connect_timeout : Optional[float], default = 10.0
+            建立连接的超时时间（秒），为 None 时不限制
+        read_timeout : Optional[float], default = 60.0
+            读取响应的超时时间（秒），为 None 时不限制
+        max_retries : int, default = 0
+            建立连接失败时的重试次数
+        read_cache : Optional[DSReadCache], default = None
+            只读请求的缓存；如提供，则 get_process_definition 和 get_process_definition_verify_name 会合并并发的相同请求并缓存结果，
+            更新工作流的方法会使相关缓存失效
+        hooks : Optional[Iterable[DSRequestHook]], default = None
+            请求埋点的回调；每个请求完成（或失败）后，都会以 DSRequestEvent 调用所有回调
+        rate_limiter : Optional[DSRateLimiter], default = None
+            请求限流器（可以在多个 SDK 实例之间共享）；每个请求发起前获取许可，完成后归还
+        """
         self._base_url = base_url
         self._token = token
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._max_retries = max_retries
+        self._timeout = (connect_timeout, read_timeout)
+        self._read_cache = read_cache
+        self._hook_list: List[DSRequestHook] = list(hooks) if hooks is not None else []
+        self._rate_limiter = rate_limiter
+
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+
+    def __enter__(self) -> "DolphinWebSdk":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """关闭连接池中的所有长连接（关闭后再次请求时会重新创建连接池）"""
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
 
     # ------------------------------ SDK 属性 ------------------------------
 
@@ -39,39 +121,124 @@ class DolphinWebSdk:
     def token(self) -> str:
         return self._token
 
+    @property
+    def read_cache(self) -> Optional[DSReadCache]:
+        return self._read_cache
+
+    @property
+    def rate_limiter(self) -> Optional[DSRateLimiter]:
+        return self._rate_limiter
+
+    @property
+    def hook_list(self) -> List[DSRequestHook]:
+        return list(self._hook_list)
+
+    def add_hook(self, hook: DSRequestHook) -> None:
+        """添加请求埋点的回调（复制后替换列表，因此不影响其他线程中正在进行的遍历）"""
+        self._hook_list = self._hook_list + [hook]
+
     # ------------------------------ 通用请求方法 ------------------------------
 
-    def _do_get(self, url, params):
-        """执行海豚调度的 GET 请求"""
+    def _get_session(self) -> requests.Session:
+        """获取共享的 Session（首次调用时创建；Session 及其连接池可以被多个线程共享）"""
+        session = self._session
+        if session is not None:
+            return session
+        with self._session_lock:
+            if self._session is None:
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=self._pool_connections,
+                    pool_maxsize=self._pool_maxsize,
+                    max_retries=self._max_retries,
+                    pool_block=False
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers.update({
+                    "Accept": "application/json",
+                    "token": self.token
+                })
+                self._session = session
+            return self._session
+
+    def _do_request(self, method: str, endpoint: str, url: str,
+                    params: Optional[dict] = None, data: Optional[dict] = None):
+        """执行海豚调度的请求，并返回解析后的 Json 结果；请求完成（或失败）后触发请求埋点（等待限流许可的时间不计入耗时）
+
+        Parameters
+        ----------
+        method : str
+            请求方法
+        endpoint : str
+            接口模板（用于请求埋点）
+        url : str
+            请求路径
+        params : Optional[dict], default = None
+            查询参数
+        data : Optional[dict], default = None
+            表单参数
+        """
         actual_url = f"{self._base_url}{url}"
-        headers = {
-            "Accept": "application/json",
-            "token": self.token
-        }
-        return requests.get(actual_url, params=params, headers=headers).json()
+        response: Optional[requests.Response] = None
+        result = None
+        error = None
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+        start_time = time.perf_counter()
+        try:
+            response = self._get_session().request(method, actual_url, params=params, data=data,
+                                                   timeout=self._timeout)
+            if method == "PUT" and response.status_code != 200:
+                raise DolphinApiError(f"status_code={response.status_code}, text={response.text}")
+            result = response.json()
+            return result
+        except (requests.RequestException, ValueError, DolphinApiError) as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            if self._hook_list or self._rate_limiter is not None:
+                event = self._build_request_event(method, endpoint, time.perf_counter() - start_time,
+                                                  response, result, error)
+                if self._rate_limiter is not None:
+                    self._rate_limiter.release(event)
+                dispatch_request_event(self._hook_list, event)
+
+    @staticmethod
+    def _build_request_event(method: str, endpoint: str, latency: float,
+                             response: Optional[requests.Response], result, error: Optional[str]) -> DSRequestEvent:
+        """构造请求埋点事件"""
+        request_bytes = 0
+        response_bytes = 0
+        status_code = None
+        if response is not None:
+            status_code = response.status_code
+            response_bytes = len(response.content)
+            body = response.request.body
+            if body is not None:
+                request_bytes = len(body.encode("UTF-8") if isinstance(body, str) else body)
+        return DSRequestEvent(
+            endpoint=endpoint,
+            method=method,
+            status_code=status_code,
+            ds_code=result.get("code") if isinstance(result, dict) else None,
+            request_bytes=request_bytes,
+            response_bytes=response_bytes,
+            latency=latency,
+            error=error
+        )
+
+    def _do_get(self, endpoint: str, url: str, params: dict):
+        """执行海豚调度的 GET 请求"""
+        return self._do_request("GET", endpoint, url, params=params)
 
-    def _do_post(self, url, data):
+    def _do_post(self, endpoint: str, url: str, data: dict):
         """执行海豚调度的 POST 请求"""
-        actual_url = f"{self._base_url}{url}"
-        headers = {
-            "Accept": "application/json",
-            "token": self.token
-        }
-        return requests.post(actual_url, data=data, headers=headers).json()
-
-    def _do_put(self, url, data):
-        """执行海豚调度的 PUT 请求"""
-        actual_url = f"{self._base_url}{url}"
-        headers = {
-            "Accept": "application/json",
-            "token": self.token
-        }
-        print(actual_url)
-        print(data)
-        response = requests.put(actual_url, data=data, headers=headers)
-        if response.status_code != 200:
-            raise DolphinApiError(f"status_code={response.status_code}, text={response.text}")
-        return response.json()
+        return self._do_request("POST", endpoint, url, data=data)
+
+    def _do_put(self, endpoint: str, url: str, data: dict):
+        """执行海豚调度的 PUT 请求（HTTP 状态码不为 200 时抛出 DolphinApiError）"""
+        return self._do_request("PUT", endpoint, url, data=data)
 
     # ------------------------------ SDK 方法 ------------------------------
 
@@ -85,9 +252,14 @@ class DolphinWebSdk:
         name : name
             工作流名称
         """
-        url = f"/dolphinscheduler/projects/{project_code}/process-definition/verify-name"
+        endpoint = ENDPOINT_PROCESS_DEFINITION_VERIFY_NAME
+        url = _url(endpoint, project_code=project_code)
         params = {"name": name}
-        response = self._do_get(url, params)
+        if self._read_cache is None:
+            response = self._do_get(endpoint, url, params)
+        else:
+            response = self._read_cache.get_or_load(endpoint, (project_code, name),
+                                                    lambda: self._do_get(endpoint, url, params))
         return response["code"] == 0
 
     def get_process_definition(self, project_code: int, process_code: int):
@@ -100,12 +272,22 @@ class DolphinWebSdk:
         process_code : int
             工作流ID
         """
-        url = f"/dolphinscheduler/projects/{project_code}/process-definition/{process_code}"
+        endpoint = ENDPOINT_PROCESS_DEFINITION
+        url = _url(endpoint, project_code=project_code, code=process_code)
         params = {}
-        response = self._do_get(url, params)
-        if response["code"] != 0:
-            response_code = response["code"]
-            raise DolphinApiError(f"url={url} params={params} code={response_code}")
+
+        def load():
+            # 在 loader 中检查返回码，使错误响应（包括工作流尚不存在）抛出异常而不会被缓存
+            response = self._do_get(endpoint, url, params)
+            if response["code"] != 0:
+                response_code = response["code"]
+                raise DolphinApiError(f"url={url} params={params} code={response_code}")
+            return response
+
+        if self._read_cache is None:
+            response = load()
+        else:
+            response = self._read_cache.get_or_load(endpoint, (project_code, process_code), load)
         return response["data"]
 
     def get_task_definition_gen_task_codes(self, project_code: int, gen_num: int) -> List[int]:
@@ -118,9 +300,10 @@ class DolphinWebSdk:
         gen_num : int
             生成数量
         """
-        url = f"/dolphinscheduler/projects/{project_code}/task-definition/gen-task-codes"
+        endpoint = ENDPOINT_TASK_DEFINITION_GEN_TASK_CODES
+        url = _url(endpoint, project_code=project_code)
         params = {"genNum": gen_num}
-        response = self._do_get(url, params)
+        response = self._do_get(endpoint, url, params)
         if response["code"] != 0:
             response_code = response["code"]
             raise DolphinApiError(f"url={url} params={params} code={response_code}")
@@ -128,15 +311,23 @@ class DolphinWebSdk:
 
     def post_process_definition(self, project_code: int, data: PostProcessDefinitionForm) -> dict:
         """提交一个新的工作流"""
-        url = f"/dolphinscheduler/projects/{project_code}/process-definition"
+        endpoint = ENDPOINT_PROCESS_DEFINITION_LIST
+        url = _url(endpoint, project_code=project_code)
         data_dict = data.to_dict()
-        response = self._do_post(url, data_dict)
+        try:
+            response = self._do_post(endpoint, url, data_dict)
+        finally:
+            self._invalidate_process_definition(project_code)
         return response
 
     def put_process_definition(self, project_code: int, process_code: int, data: PostProcessDefinitionForm) -> dict:
         """更新一个工作流"""
-        url = f"/dolphinscheduler/projects/{project_code}/process-definition/{process_code}"
-        response = self._do_put(url, data.to_dict())
+        endpoint = ENDPOINT_PROCESS_DEFINITION
+        url = _url(endpoint, project_code=project_code, code=process_code)
+        try:
+            response = self._do_put(endpoint, url, data.to_dict())
+        finally:
+            self._invalidate_process_definition(project_code, process_code)
         return response
 
     def post_process_definition_release(self, project_code: int,
@@ -144,34 +335,49 @@ class DolphinWebSdk:
                                         process_name: str,
                                         release_state: DSReleaseState) -> bool:
         """上线 / 下线工作流"""
-        url = f"/dolphinscheduler/projects/{project_code}/process-definition/{process_code}/release"
-        response = self._do_post(url, {
-            "name": process_name,
-            "releaseState": release_state.web_value
-        })
+        endpoint = ENDPOINT_PROCESS_DEFINITION_RELEASE
+        url = _url(endpoint, project_code=project_code, code=process_code)
+        try:
+            response = self._do_post(endpoint, url, {
+                "name": process_name,
+                "releaseState": release_state.web_value
+            })
+        finally:
+            self._invalidate_process_definition(project_code, process_code)
         return response["code"] == 0
 
     def post_start_process_instance(self, project_code: int, data: DSStartProcessInstanceForm) -> bool:
         """启动工作流实例"""
-        url = f"/dolphinscheduler/projects/{project_code}/executors/start-process-instance"
-        response = self._do_post(url, data.to_dict())
+        endpoint = ENDPOINT_START_PROCESS_INSTANCE
+        url = _url(endpoint, project_code=project_code)
+        response = self._do_post(endpoint, url, data.to_dict())
         return response["code"] == 0
 
     def post_schedules(self, project_code: int, data: DSPostSchedulesForm) -> dict:
         """设置工作流定时"""
-        url = f"/dolphinscheduler/projects/{project_code}/schedules"
-        response = self._do_post(url, data.to_dict())
+        endpoint = ENDPOINT_SCHEDULES
+        url = _url(endpoint, project_code=project_code)
+        response = self._do_post(endpoint, url, data.to_dict())
         return response
 
     def post_schedules_online(self, project_code: int, schedule_id: int) -> bool:
         """将工作流定时上线"""
-        url = f"/dolphinscheduler/projects/{project_code}/schedules/{schedule_id}/online"
-        response = self._do_post(url, {})
-        print(response)
+        endpoint = ENDPOINT_SCHEDULES_ONLINE
+        url = _url(endpoint, project_code=project_code, id=schedule_id)
+        response = self._do_post(endpoint, url, {})
         return response["code"] == 0
 
     def post_schedules_offline(self, project_code: int, schedule_id: int) -> bool:
         """将工作流定时下线"""
-        url = f"/dolphinscheduler/projects/{project_code}/schedules/{schedule_id}/offline"
-        response = self._do_post(url, {})
+        endpoint = ENDPOINT_SCHEDULES_OFFLINE
+        url = _url(endpoint, project_code=project_code, id=schedule_id)
+        response = self._do_post(endpoint, url, {})
         return response["code"] == 0
+
+    def _invalidate_process_definition(self, project_code: int, process_code: Optional[int] = None) -> None:
+        """使工作流相关的只读请求缓存失效（工作流名称可能被新增或修改，因此同时使项目下所有名称校验结果失效）"""
+        if self._read_cache is None:
+            return
+        self._read_cache.invalidate(ENDPOINT_PROCESS_DEFINITION_VERIFY_NAME, (project_code,))
+        if process_code is not None:
+            self._read_cache.invalidate(ENDPOINT_PROCESS_DEFINITION, (project_code, process_code))
@@ -14,7 +14,11 @@ setup(
     author="changxing",
     author_email="1278729001@qq.com",
     url="https://github.com/ChangxingJiang/dolphin_sdk",
-    install_requires=["metasequoia_connector", "Requests"],
+    install_requires=["metasequoia_connector", "PyMySQL", "Requests"],
+    extras_require={
+        "async": ["aiohttp"],
+        "analytics": ["numpy", "pyarrow"],
+    },
     license="Apache License V2.0",
     packages=find_packages(),
     platforms=["all"],